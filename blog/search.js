@@ -0,0 +1,84 @@
+/* SteadiDay blog search (generated by scripts/search_index.py) */
+(function () {
+  var C = {"prefix":2,"chunk":128,"max":8,"stop":["a","an","and","are","as","at","be","but","by","can","do","does","for","from","how","if","in","into","is","it","its","more","most","of","on","or","our","so","than","that","the","their","them","these","this","those","to","too","up","was","we","what","when","which","who","why","will","with","you","your"]};
+  var script = document.currentScript;
+  var form = document.querySelector('.blog-search');
+  if (!form || !script || !window.fetch || !window.Promise) return;
+  var input = form.querySelector('input');
+  var status = form.querySelector('.blog-search-status');
+  var list = form.querySelector('.blog-search-results');
+  var blog = new URL('./', script.src), base = new URL('search/', blog);
+  var cache = {}, seq = 0, timer;
+  form.hidden = false;
+
+  function get(path) {
+    if (!cache[path]) {
+      cache[path] = fetch(new URL(path, base)).then(function (r) {
+        return r.ok ? r.json() : null;
+      }).catch(function () { return null; });
+    }
+    return cache[path];
+  }
+
+  function tokens(q) {
+    var words = q.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '').match(/[a-z0-9]+/g) || [];
+    return words.filter(function (w) { return w.length > 1 && C.stop.indexOf(w) < 0; });
+  }
+
+  function postings(word, prefix) {
+    return get('t/' + word.slice(0, C.prefix) + '.json').then(function (shard) {
+      var scores = {};
+      Object.keys(shard || {}).forEach(function (term) {
+        if (term !== word && !(prefix && term.indexOf(word) === 0)) return;
+        var p = shard[term];
+        for (var i = 0; i < p.length; i += 2) scores[p[i]] = Math.max(scores[p[i]] || 0, p[i + 1]);
+      });
+      return scores;
+    });
+  }
+
+  function render(docs, query) {
+    list.textContent = '';
+    docs.forEach(function (d) {
+      var li = document.createElement('li'), a = document.createElement('a'), meta = document.createElement('span');
+      a.href = new URL(d[0], blog).href;
+      a.textContent = d[1];
+      meta.textContent = d[2] + (d[3] ? ' · ' + d[3] : '');
+      li.appendChild(a);
+      li.appendChild(meta);
+      list.appendChild(li);
+    });
+    status.textContent = !query ? '' : docs.length ? docs.length + ' matching article' + (docs.length > 1 ? 's' : '')
+      : 'No articles found for "' + query + '"';
+  }
+
+  function search() {
+    var query = input.value.trim(), words = tokens(query), id = ++seq;
+    if (!words.length) { render([], ''); return; }
+    Promise.all(words.map(function (w, i) { return postings(w, i === words.length - 1); })).then(function (sets) {
+      var hits = Object.keys(sets[0]).filter(function (doc) {
+        return sets.every(function (s) { return doc in s; });
+      }).map(function (doc) {
+        return [+doc, sets.reduce(function (sum, s) { return sum + s[doc]; }, 0)];
+      });
+      hits.sort(function (a, b) { return b[1] - a[1] || b[0] - a[0]; });
+      return Promise.all(hits.slice(0, C.max).map(function (hit) {
+        return get('d/' + Math.floor(hit[0] / C.chunk) + '.json').then(function (docs) {
+          return docs && docs[hit[0] % C.chunk];
+        });
+      }));
+    }).then(function (docs) {
+      if (id === seq) render(docs.filter(Boolean), query);
+    });
+  }
+
+  input.addEventListener('input', function () {
+    clearTimeout(timer);
+    timer = setTimeout(search, 120);
+  });
+  form.addEventListener('submit', function (e) {
+    e.preventDefault();
+    var first = list.querySelector('a');
+    if (first) window.location.href = first.href;
+  });
+})();
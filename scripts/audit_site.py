@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Site Audit
+
+One SEO/consistency audit for every page, replacing checks that were
+scattered across scripts as printed warnings (title length in
+fix_blog_posts.py and generate_blog_post(), the stale github.io check).
+
+Per page (parsed once, checks run in a process pool):
+    title-length        <title> / og:title over 60 characters
+    missing-title       no <title>
+    missing-description no meta description
+    missing-canonical   no <link rel="canonical">
+    canonical-mismatch  canonical URL does not match the file's own URL
+    stale-domain        old github.io URLs in canonical / og / twitter tags
+    missing-og-image    no og:image (an error on blog posts)
+    empty-h1            no <h1>, or one with no text
+    placeholder         leftover [IMAGE_n] / [VIDEO] from the generator
+    encoding            page is not valid UTF-8
+
+Across pages:
+    duplicate-title     two pages share a <title>
+    duplicate-canonical two pages claim the same canonical URL
+
+Reports go to .site-build/audit.json (machine-readable, also the cache for
+--incremental) and .site-build/audit.md. With --incremental only pages
+whose content changed since the last report are re-audited; cross-page
+checks always run over the full set.
+
+Usage (from the repo root):
+    python scripts/site_cli.py audit
+    python scripts/site_cli.py audit --incremental
+    python scripts/site_cli.py audit --strict      # exit 1 if any errors
+"""
+
+import os
+import re
+import json
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import site_tree
+from site_tree import SiteTree, parse_page_meta, write_if_changed
+
+WEBSITE_URL = "https://www.steadiday.com"
+JSON_REPORT = ".site-build/audit.json"
+MD_REPORT = ".site-build/audit.md"
+MAX_TITLE_LENGTH = 60
+
+# parse_page_meta strips the " | SteadiDay Blog" suffix; duplicates are
+# judged on the full <title> the search engine sees.
+_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.DOTALL)
+_OG_TITLE_RE = re.compile(r'<meta property="og:title" content="([^"]+)"')
+_H1_PRESENT_RE = re.compile(r'<h1[\s>]', re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r'\[(?:IMAGE_\d+|VIDEO)\]')
+_URL_TAG_RES = [
+    ('canonical', re.compile(r'<link rel="canonical" href="([^"]+)"')),
+    ('og:url', re.compile(r'<meta property="og:url" content="([^"]+)"')),
+    ('twitter:url', re.compile(r'<meta name="twitter:url" content="([^"]+)"')),
+    ('og:image', re.compile(r'<meta property="og:image" content="([^"]+)"')),
+    ('twitter:image', re.compile(r'<meta name="twitter:image" content="([^"]+)"')),
+]
+
+
+def expected_urls(relpath):
+    """Canonical URLs a page may legitimately claim."""
+    urls = {f"{WEBSITE_URL}/{relpath}"}
+    if relpath == "index.html" or relpath.endswith("/index.html"):
+        urls.add(f"{WEBSITE_URL}/{relpath[:-len('index.html')]}")
+    return urls
+
+
+def audit_page(relpath, content):
+    """Run the per-page checks. Returns the page summary stored in the report."""
+    meta = parse_page_meta(relpath, content)
+    is_post = relpath.startswith("blog/") and "/" not in relpath[5:] and relpath != "blog/index.html"
+    issues = []
+
+    def issue(severity, check, message):
+        issues.append({"severity": severity, "check": check, "message": message})
+
+    raw_title = _TITLE_RE.search(content)
+    full_title = raw_title.group(1).strip() if raw_title else ""
+    if not full_title:
+        issue("error", "missing-title", "No <title>")
+    elif len(meta["title"]) > MAX_TITLE_LENGTH:
+        issue("warning", "title-length", f"Title is {len(meta['title'])} chars (max {MAX_TITLE_LENGTH})")
+    og_title = _OG_TITLE_RE.search(content)
+    if og_title and len(og_title.group(1)) > MAX_TITLE_LENGTH:
+        issue("warning", "title-length", f"og:title is {len(og_title.group(1))} chars (max {MAX_TITLE_LENGTH})")
+
+    if not meta["description"]:
+        issue("error" if is_post else "warning", "missing-description", "No meta description")
+
+    if not meta["canonical"]:
+        issue("warning", "missing-canonical", "No canonical link")
+    elif meta["canonical"] not in expected_urls(relpath):
+        issue("error", "canonical-mismatch", f"Canonical {meta['canonical']} does not match the file's URL")
+
+    if 'github.io' in content:
+        for tag, pattern in _URL_TAG_RES:
+            m = pattern.search(content)
+            if m and 'github.io' in m.group(1):
+                issue("error", "stale-domain", f"{tag} still points at {m.group(1)}")
+
+    if not meta["og_image"]:
+        issue("error" if is_post else "warning", "missing-og-image", "No og:image")
+
+    if not _H1_PRESENT_RE.search(content):
+        issue("error" if is_post else "warning", "empty-h1", "No <h1>")
+    elif not meta["h1"]:
+        issue("error", "empty-h1", "<h1> has no text")
+
+    placeholders = sorted(set(_PLACEHOLDER_RE.findall(content)))
+    if placeholders:
+        issue("error", "placeholder", f"Unreplaced placeholder(s): {', '.join(placeholders)}")
+
+    return {"title": full_title, "canonical": meta["canonical"], "issues": issues}
+
+
+def _audit_file(args):
+    """Process-pool worker: read, hash and audit one page."""
+    relpath, path = args
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+        content = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        return relpath, digest, {"title": "", "canonical": "", "issues": [
+            {"severity": "error", "check": "encoding", "message": f"Not valid UTF-8: {e}"}]}
+    return relpath, digest, audit_page(relpath, content)
+
+
+def cross_page_issues(pages):
+    """Checks that need every page: duplicate titles and canonicals."""
+    found = defaultdict(list)
+    for check, key in (("duplicate-title", "title"), ("duplicate-canonical", "canonical")):
+        owners = defaultdict(list)
+        for rel, page in pages.items():
+            if page[key]:
+                owners[page[key]].append(rel)
+        for value, rels in owners.items():
+            if len(rels) > 1:
+                for rel in rels:
+                    others = ", ".join(r for r in rels if r != rel)
+                    found[rel].append({"severity": "error", "check": check,
+                                       "message": f"Same {key} as {others}: {value}"})
+    return found
+
+
+def checks_version():
+    """Hash of this module and site_tree.py (parse_page_meta feeds the checks),
+    so editing a check or the parser invalidates --incremental caches."""
+    digest = hashlib.sha256()
+    for path in (__file__, site_tree.__file__):
+        with open(os.path.abspath(path), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def load_report(tree):
+    try:
+        with open(tree.abspath(JSON_REPORT), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def run_audit(tree=None, incremental=False, jobs=None):
+    """Audit every HTML page and write the JSON and Markdown reports."""
+    tree = tree or SiteTree()
+    previous = load_report(tree) if incremental else None
+    version = checks_version()
+    # Cached results only count if they were produced by these checks
+    cached = previous["pages"] if previous and previous.get("checks_version") == version else {}
+
+    pages, todo = {}, []
+    for rel in tree.html_files():
+        entry = cached.get(rel)
+        if entry:
+            st = os.stat(tree.abspath(rel))
+            if entry.get("stat") == [st.st_mtime_ns, st.st_size]:
+                pages[rel] = entry
+                continue
+        todo.append(rel)
+
+    if todo:
+        tasks = [(rel, tree.abspath(rel)) for rel in todo]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(tasks) // ((jobs or os.cpu_count() or 1) * 4))
+            for rel, digest, summary in pool.map(_audit_file, tasks, chunksize=chunksize):
+                entry = cached.get(rel)
+                if entry and entry.get("digest") == digest:
+                    summary = {k: entry[k] for k in ("title", "canonical", "issues")}
+                st = os.stat(tree.abspath(rel))
+                pages[rel] = dict(summary, digest=digest, stat=[st.st_mtime_ns, st.st_size])
+
+    cross = cross_page_issues(pages)
+    counts = {"error": 0, "warning": 0}
+    for rel, page in pages.items():
+        for item in page["issues"] + cross.get(rel, []):
+            counts[item["severity"]] += 1
+
+    report = {
+        "checks_version": version,
+        "summary": {"pages": len(pages), "audited": len(todo), "errors": counts["error"],
+                    "warnings": counts["warning"]},
+        "pages": {rel: pages[rel] for rel in sorted(pages)},
+        "cross_page": {rel: cross[rel] for rel in sorted(cross)},
+    }
+    os.makedirs(os.path.dirname(tree.abspath(JSON_REPORT)), exist_ok=True)
+    write_if_changed(tree.abspath(JSON_REPORT), json.dumps(report, indent=1, sort_keys=True) + "\n")
+    write_if_changed(tree.abspath(MD_REPORT), render_markdown(report))
+    return report
+
+
+def render_markdown(report):
+    s = report["summary"]
+    lines = ["# SteadiDay site audit", "",
+             f"{s['pages']} pages, {s['errors']} errors, {s['warnings']} warnings.", ""]
+    by_check = defaultdict(list)
+    for rel, page in report["pages"].items():
+        for item in page["issues"] + report["cross_page"].get(rel, []):
+            by_check[(item["severity"], item["check"])].append((rel, item["message"]))
+    for severity in ("error", "warning"):
+        for (sev, check), items in sorted(by_check.items()):
+            if sev != severity:
+                continue
+            lines += [f"## {severity}: {check} ({len(items)})", ""]
+            lines += [f"- `{rel}`: {message}" for rel, message in items]
+            lines.append("")
+    if not by_check:
+        lines.append("No issues found.")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def print_summary(report):
+    s = report["summary"]
+    print(f"📄 Pages: {s['pages']} (audited this run: {s['audited']})")
+    print(f"❌ Errors: {s['errors']} | ⚠️  Warnings: {s['warnings']}")
+    print(f"📝 Reports: {JSON_REPORT}, {MD_REPORT}")
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Site Script Benchmarks
+
+Times and memory-profiles the site scripts against synthetic sites
+(scripts/synth_site.py) of increasing size, and saves the results as JSON
+so regressions can be diffed between commits.
+
+Each benchmark gets a fresh SiteTree (cold cache), runs once untraced for
+wall time and once under tracemalloc for peak Python heap. Benchmarks that
+rewrite the site (fix-urls, gtag) run against a fresh copy of the pristine
+blog each time, so both runs do the real work.
+
+Results go to .site-build/bench/<commit>.json by default:
+
+    {"commit": ..., "python": ..., "created": ...,
+     "results": {"1000": {"get_existing_posts": {"seconds": .., "peak_kb": ..}, ...}}}
+
+--startup instead times what each site_cli command imports before doing
+any work. Every command in STARTUP_COMMANDS runs in a fresh interpreter
+under `python -X importtime` against a small synthetic site, and the
+import time of everything beyond a bare interpreter is recorded:
+
+    "startup": {"rss": {"import_ms": .., "modules": .., "heavy": []}, ...}
+
+"publish" is measured up to the point where it needs the model (importing
+generate_blog), since running it would call the API. Commands must not
+import HEAVY_MODULES (the anthropic SDK, NumPy, Pillow, fontTools) unless
+listed in STARTUP_ALLOWED; --strict exits 1 when one does, so the check
+can run in CI.
+
+Usage (from the repo root):
+    python scripts/benchmark.py                          # 1k, 10k, 100k posts
+    python scripts/benchmark.py --sizes 1000 10000
+    python scripts/benchmark.py --only generate_rss_feed --only sitemap
+    python scripts/benchmark.py --compare .site-build/bench/abc1234.json
+    python scripts/benchmark.py --startup [--strict]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+
+from site_tree import SiteTree
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+RESULTS_DIR = ".site-build/bench"
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# command -> Python run under -X importtime ({root} is the synthetic site)
+STARTUP_COMMANDS = {
+    "rss": "import site_cli; site_cli.main(['rss', '--root', {root!r}])",
+    "index": "import site_cli; site_cli.main(['index', '--root', {root!r}])",
+    "sitemap": "import site_cli; site_cli.main(['sitemap', '--root', {root!r}])",
+    "audit": "import site_cli; site_cli.main(['audit', '--root', {root!r}])",
+    "publish": "import site_cli, generate_blog",
+}
+STARTUP_POSTS = 50
+HEAVY_MODULES = ["anthropic", "numpy", "PIL", "fontTools"]
+# command -> heavy modules it is expected to import
+STARTUP_ALLOWED = {}
+
+
+def _existing_posts(tree):
+    import generate_blog
+    return generate_blog.get_existing_posts("blog", tree=tree)
+
+
+def bench_get_existing_posts(tree, _):
+    _existing_posts(tree)
+
+
+def bench_get_recently_used_images(tree, _):
+    import generate_blog
+    generate_blog.get_recently_used_images("blog", 15, tree=tree)
+
+
+def bench_select_unique_topic(tree, existing):
+    import generate_blog
+    random.seed(0)
+    generate_blog.select_unique_topic(existing, tree=tree)
+
+
+def bench_generate_rss_feed(tree, _):
+    import generate_blog
+    generate_blog.generate_rss_feed("blog", tree=tree)
+
+
+def bench_sitemap(tree, _):
+    import generate_sitemap
+    generate_sitemap.main(tree=tree)
+
+
+def bench_inject_gtag(tree, _):
+    import inject_gtag
+    inject_gtag.main(tree.root, tree=tree)
+
+
+def bench_fix_blog_posts(tree, _):
+    import fix_blog_posts
+    fix_blog_posts.scan_and_fix_blog_directory("blog", tree=tree)
+
+
+def bench_blog_index(tree, _):
+    import blog_index
+    blog_index.build(tree, force=True)
+
+
+def bench_related_posts(tree, _):
+    import related_posts
+    related_posts.build(tree, full=True)
+
+
+def bench_search_index(tree, _):
+    import search_index
+    search_index.build(tree, force=True)
+
+
+def bench_duplicate_audit(tree, _):
+    import duplicate_audit
+    duplicate_audit.run(tree)
+
+
+# name -> (function, rewrites the site)
+BENCHMARKS = {
+    "get_existing_posts": (bench_get_existing_posts, False),
+    "get_recently_used_images": (bench_get_recently_used_images, False),
+    "select_unique_topic": (bench_select_unique_topic, False),
+    "generate_rss_feed": (bench_generate_rss_feed, False),
+    "sitemap": (bench_sitemap, False),
+    "inject_gtag": (bench_inject_gtag, True),
+    "fix_blog_posts": (bench_fix_blog_posts, True),
+    "blog_index": (bench_blog_index, True),
+    "search_index": (bench_search_index, False),
+    "related_posts": (bench_related_posts, True),
+    "duplicate_audit": (bench_duplicate_audit, False),
+}
+
+
+def _measure(func, root, arg, traced):
+    tree = SiteTree(root)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        if traced:
+            tracemalloc.start()
+        start = time.perf_counter()
+        func(tree, arg)
+        elapsed = time.perf_counter() - start
+        peak = 0
+        if traced:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    return elapsed, peak
+
+
+def run_size(num_posts, names, work_dir):
+    """Benchmark `names` against a synthetic site of `num_posts` posts."""
+    import synth_site
+    pristine = os.path.join(work_dir, f"site-{num_posts}")
+    print(f"\n🧪 Generating {num_posts:,} posts...")
+    start = time.perf_counter()
+    synth_site.generate(num_posts, pristine)
+    print(f"   generated in {time.perf_counter() - start:.1f}s")
+
+    # select_unique_topic takes the post list, not the tree; build it untimed
+    existing = _existing_posts(SiteTree(pristine)) if "select_unique_topic" in names else None
+    results = {}
+    for name in names:
+        func, rewrites = BENCHMARKS[name]
+        runs = []
+        for traced in (False, True):
+            root = pristine
+            if rewrites:
+                root = os.path.join(work_dir, "scratch")
+                shutil.rmtree(root, ignore_errors=True)
+                shutil.copytree(pristine, root)
+            runs.append(_measure(func, root, existing, traced))
+        seconds, peak = runs[0][0], runs[1][1]
+        results[name] = {"seconds": round(seconds, 4), "peak_kb": peak // 1024}
+        print(f"   {name:<26} {seconds:>9.3f}s {peak / 1048576:>9.1f} MB")
+    shutil.rmtree(pristine, ignore_errors=True)
+    shutil.rmtree(os.path.join(work_dir, "scratch"), ignore_errors=True)
+    return results
+
+
+def _import_times(code):
+    """{module: (cumulative µs, imported at top level)} for every import in a
+    fresh interpreter running `code`, from `python -X importtime`."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=SCRIPTS_DIR,
+                         capture_output=True, text=True, timeout=300)
+    if out.returncode:
+        raise RuntimeError(f"{code}: {out.stderr.strip().splitlines()[-1:]}")
+    times = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if cumulative.strip().isdigit():
+            # Nested imports are indented two spaces per level
+            times[name.strip()] = (int(cumulative), not name[1:].startswith(" "))
+    return times
+
+
+def run_startup(work_dir):
+    """Import cost of every STARTUP_COMMANDS command, beyond a bare interpreter."""
+    import synth_site
+    root = os.path.join(work_dir, "startup-site")
+    print(f"\n🧪 Generating {STARTUP_POSTS} posts for startup timing...")
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        synth_site.generate(STARTUP_POSTS, root)
+    baseline = _import_times("pass")
+    results = {}
+    for name, code in STARTUP_COMMANDS.items():
+        times = _import_times(code.format(root=root))
+        extra = {m: t for m, t in times.items() if m not in baseline}
+        # A top-level import's cumulative time covers everything it imported
+        total = sum(t for t, top in extra.values() if top) / 1000
+        heavy = sorted(h for h in HEAVY_MODULES if h in extra and h not in STARTUP_ALLOWED.get(name, []))
+        results[name] = {"import_ms": round(total, 1), "modules": len(extra), "heavy": heavy}
+        flag = f"  ⚠️  imports {', '.join(heavy)}" if heavy else ""
+        print(f"   {name:<26} {total:>8.1f} ms {len(extra):>5} modules{flag}")
+    shutil.rmtree(root, ignore_errors=True)
+    return results
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def compare(current, baseline):
+    """Print time/memory ratios of `current` against a saved baseline."""
+    print(f"\n📊 vs {baseline.get('commit', '?')}:")
+    for size, results in current["results"].items():
+        old_results = baseline.get("results", {}).get(size, {})
+        for name, r in results.items():
+            old = old_results.get(name)
+            if not old:
+                continue
+            t = r["seconds"] / old["seconds"] if old["seconds"] else float('inf')
+            m = r["peak_kb"] / old["peak_kb"] if old["peak_kb"] else float('inf')
+            flag = "⚠️ " if t > 1.2 or m > 1.2 else "  "
+            print(f"  {flag}{size:>7} {name:<26} time x{t:.2f}  mem x{m:.2f}")
+    for name, r in current.get("startup", {}).items():
+        old = baseline.get("startup", {}).get(name)
+        if not old:
+            continue
+        t = r["import_ms"] / old["import_ms"] if old["import_ms"] else float('inf')
+        new_heavy = sorted(set(r["heavy"]) - set(old["heavy"]))
+        flag = "⚠️ " if t > 1.2 or new_heavy else "  "
+        print(f"  {flag}startup {name:<26} imports x{t:.2f}" + (f"  now imports {', '.join(new_heavy)}" if new_heavy else ""))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the site scripts on synthetic sites")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Post counts to benchmark (default: 1000 10000 100000)")
+    parser.add_argument("--only", action="append", default=[], choices=list(BENCHMARKS),
+                        help="Run only these benchmarks (repeatable)")
+    parser.add_argument("--work-dir", default=None,
+                        help="Where to generate sites (default: a temp dir, removed afterwards)")
+    parser.add_argument("--out", default=None,
+                        help=f"Results file (default: {RESULTS_DIR}/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Baseline results JSON to compare against")
+    parser.add_argument("--startup", action="store_true",
+                        help="Time what each site_cli command imports instead of the size benchmarks")
+    parser.add_argument("--strict", action="store_true",
+                        help="With --startup, exit 1 if a command imports a HEAVY_MODULES module")
+    args = parser.parse_args(argv)
+
+    print("=" * 50)
+    print("⏱️  SteadiDay Site Benchmarks")
+    print("=" * 50)
+
+    names = args.only or list(BENCHMARKS)
+    baseline = None
+    if args.compare:
+        # Load up front: the new results may overwrite the same file
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "python": platform.python_version(),
+        "created": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "results": {},
+    }
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="steadiday-bench-")
+    try:
+        if args.startup:
+            report["startup"] = run_startup(work_dir)
+        else:
+            for size in args.sizes:
+                report["results"][str(size)] = run_size(size, names, work_dir)
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    out = args.out or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"\n✅ Results saved to {out}")
+
+    if baseline is not None:
+        compare(report, baseline)
+    if args.strict and any(r["heavy"] for r in report.get("startup", {}).values()):
+        sys.exit(1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
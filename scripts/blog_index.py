@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Blog Index
+
+Renders the blog listing pages from a card catalog instead of patching
+blog/index.html. update_blog_index() used to prepend one more card after
+<!--BLOG_ENTRIES_START--> on every publish and move the `featured` class
+with a string replace, so the index grew without limit, and every card
+thumbnail was a CSS background the browser fetched eagerly.
+
+Cards live in content/blog_index.json, one record per post:
+
+    {"posts": {"2026-05-14-smart-home-devices-that-help.html": {
+        "title", "date" (YYYY-MM-DD), "read_time", "category", "excerpt",
+        "image", "badge" (optional), "link_text" (optional)}}}
+
+The catalog keeps what the post pages themselves do not carry (the
+category, and the thumbnail picked at publish time). It is bootstrapped
+from the cards on the current index the first time the builder runs;
+posts missing from it get a card derived from their page and source record.
+
+From the catalog the builder renders, newest first, PAGE_SIZE cards per page:
+    blog/index.html, blog/page/<n>/index.html
+    blog/category/<slug>/index.html, blog/category/<slug>/page/<n>/index.html
+
+blog/index.html is also the template: everything outside the marker
+regions (BLOG_CATEGORIES, BLOG_ENTRIES, BLOG_PAGINATION) is copied to the
+other pages, with relative URLs re-pointed and title/description/canonical
+rewritten. Cards use <img loading="lazy" srcset> (responsive_images.card_img);
+only the first card on a page is eager.
+
+Each page's inputs are digested into .site-build/blog-index.json, so only
+pages whose cards, navigation or template changed are re-rendered. Pages
+that no longer exist (fewer pages, an emptied category) are removed.
+
+Usage (from the repo root):
+    python scripts/site_cli.py index
+"""
+
+import os
+import re
+import json
+import hashlib
+import posixpath
+from datetime import datetime
+
+import responsive_images
+from site_tree import SiteTree, write_if_changed
+
+WEBSITE_URL = "https://www.steadiday.com"
+CARDS_PATH = "content/blog_index.json"
+STATE_PATH = ".site-build/blog-index.json"
+BLOG_DIR = "blog"
+INDEX_PATH = f"{BLOG_DIR}/index.html"
+PAGE_SIZE = 12
+DEFAULT_CATEGORY = "Wellness"
+# Bump when the card/page markup changes to re-render every page
+VERSION = 1
+
+READ_MORE_ICON = ('<svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor">'
+                  '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M17 8l4 4m0 0l-4 4m4-4H3"/></svg>')
+
+# Appended to the index <style> once, when the builder first adds the
+# category and pagination regions
+INDEX_CSS = """
+    /* Card images, category nav & pagination (scripts/blog_index.py) */
+    .blog-card-image img { position: absolute; inset: 0; width: 100%; height: 100%; object-fit: cover; display: block; }
+    .category-nav { display: flex; flex-wrap: wrap; gap: 0.5rem; margin-bottom: 2rem; }
+    .category-nav a { padding: 0.4rem 1rem; border-radius: 20px; border: 1px solid rgba(30, 58, 95, 0.15); color: var(--navy); text-decoration: none; font-size: 0.9rem; font-weight: 600; }
+    .category-nav a:hover, .category-nav a[aria-current="page"] { background: var(--teal); border-color: var(--teal); color: var(--white); }
+    .pagination { display: flex; justify-content: space-between; align-items: center; gap: 1rem; margin-top: 3rem; }
+    .pagination a { color: var(--teal); font-weight: 700; text-decoration: none; }
+    .pagination-status { color: var(--charcoal-light); }
+"""
+_CSS_MARKER = "/* Card images, category nav & pagination"
+
+_CARD_RE = re.compile(r'<article class="blog-card[^"]*">(.*?)</article>', re.DOTALL)
+_CARD_FIELDS = {
+    "href": re.compile(r'<h2><a href="([^"]+)">'),
+    "title": re.compile(r'<h2><a href="[^"]+">(.*?)</a>', re.DOTALL),
+    "date": re.compile(r'<div class="blog-meta">\s*<span>([^<]+)</span>'),
+    "read_time": re.compile(r'(\d+) min read'),
+    "category": re.compile(r'class="blog-card-tag">([^<]+)<'),
+    "excerpt": re.compile(r'<p class="blog-excerpt">(.*?)</p>', re.DOTALL),
+    "image": re.compile(r"""<img src="([^"]+)"|url\('([^']+)'\)"""),
+    "badge": re.compile(r'<span class="featured-badge">([^<]+)</span>'),
+    "link_text": re.compile(r'class="read-more">\s*([^<]*?)\s*<'),
+}
+_READ_TIME_RE = re.compile(r'(\d+) min read')
+
+
+# --- Card catalog ---
+
+def _card_date(text):
+    for fmt in ('%B %d, %Y', '%b %d, %Y', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(text.strip(), fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return ""
+
+
+def extract_cards(html):
+    """{post file name: card} from the cards on a rendered index page."""
+    cards = {}
+    for body in _CARD_RE.findall(html):
+        found = {name: pattern.search(body) for name, pattern in _CARD_FIELDS.items()}
+        if not found["href"] or found["href"].group(1) in cards:
+            continue
+        image = found["image"]
+        card = {
+            "title": found["title"].group(1).strip() if found["title"] else "",
+            "date": _card_date(found["date"].group(1)) if found["date"] else "",
+            "read_time": found["read_time"].group(1) if found["read_time"] else "",
+            "category": found["category"].group(1).strip() if found["category"] else DEFAULT_CATEGORY,
+            "excerpt": found["excerpt"].group(1).strip() if found["excerpt"] else "",
+            "image": responsive_images.base_unsplash_url(image.group(1) or image.group(2)) if image else "",
+        }
+        if found["badge"]:
+            card["badge"] = found["badge"].group(1).strip()
+        if found["link_text"] and found["link_text"].group(1) != "Read full article":
+            card["link_text"] = found["link_text"].group(1)
+        cards[found["href"].group(1)] = card
+    return cards
+
+
+def card_from_post(post_data, image):
+    """Card for a post dict as generate_blog.generate_blog_post() returns it."""
+    return {
+        "title": post_data["title"],
+        "date": post_data["date"],
+        "read_time": str(post_data["read_time"]),
+        "category": post_data.get("category") or DEFAULT_CATEGORY,
+        "excerpt": post_data["meta_description"],
+        "image": responsive_images.base_unsplash_url(image),
+    }
+
+
+def card_from_page(tree, relpath):
+    """Fallback card for a post that is not in the catalog."""
+    import post_sources
+    meta = tree.meta(relpath)
+    front = {}
+    source = f"{post_sources.SOURCES_DIR}/{meta['filename'][:-len('.html')]}.json"
+    if tree.exists(source):
+        front = json.loads(tree.read(source)).get("front_matter", {})
+    read_time = _READ_TIME_RE.search(tree.read(relpath))
+    return {
+        "title": meta["h1"] or meta["title"],
+        "date": meta["date"] or meta["published_time"][:10],
+        "read_time": read_time.group(1) if read_time else "",
+        "category": front.get("category") or DEFAULT_CATEGORY,
+        "excerpt": meta["description"],
+        "image": responsive_images.base_unsplash_url(meta["og_image"]),
+    }
+
+
+def load_cards(tree):
+    """The catalog, bootstrapped from the current index when there is none."""
+    if tree.exists(CARDS_PATH):
+        return json.loads(tree.read(CARDS_PATH))["posts"]
+    if not tree.exists(INDEX_PATH):
+        return {}
+    posts = set(name.rsplit('/', 1)[-1] for name in tree.blog_posts(BLOG_DIR))
+    cards = extract_cards(tree.read(INDEX_PATH))
+    dangling = sorted(set(cards) - posts)
+    for name in dangling:
+        print(f"  ⚠️  Dropping card for missing post: {name}")
+        del cards[name]
+    print(f"📇 Card catalog bootstrapped from {INDEX_PATH}: {len(cards)} cards")
+    return cards
+
+
+def save_cards(tree, cards):
+    tree.write(CARDS_PATH, json.dumps({"posts": dict(sorted(cards.items()))}, indent=1, ensure_ascii=False) + "\n")
+
+
+def add_post(tree, filename, card):
+    """Add or replace one post's card in the catalog."""
+    cards = load_cards(tree)
+    cards[filename] = card
+    save_cards(tree, cards)
+
+
+def collect(tree, cards=None):
+    """[(file name, card)] for every post on disk, newest first."""
+    cards = load_cards(tree) if cards is None else cards
+    entries = []
+    for rel in tree.blog_posts(BLOG_DIR):
+        name = rel.rsplit('/', 1)[-1]
+        card = cards.get(name)
+        if card is None:
+            card = cards[name] = card_from_page(tree, rel)
+            print(f"  ➕ Card derived from the page: {name}")
+        entries.append((name, card))
+    entries.sort(key=lambda e: (e[1]["date"], e[0]), reverse=True)
+    return entries
+
+
+# --- Listings ---
+
+def category_slug(category):
+    return re.sub(r'[^a-z0-9]+', '-', category.lower().replace("'", "")).strip('-')
+
+
+def page_path(base, number):
+    return f"{base}/index.html" if number == 1 else f"{base}/page/{number}/index.html"
+
+
+def page_url(path):
+    return f"{WEBSITE_URL}/{path[:-len('index.html')]}"
+
+
+def listings(entries):
+    """Every listing page: dicts with path, number, total, entries, base, category."""
+    groups = [(BLOG_DIR, None, entries)]
+    by_category = {}
+    for entry in entries:
+        by_category.setdefault(entry[1]["category"], []).append(entry)
+    for category in sorted(by_category):
+        groups.append((f"{BLOG_DIR}/category/{category_slug(category)}", category, by_category[category]))
+
+    pages = []
+    for base, category, group in groups:
+        total = max(1, -(-len(group) // PAGE_SIZE))
+        for number in range(1, total + 1):
+            pages.append({
+                "path": page_path(base, number),
+                "base": base,
+                "category": category,
+                "number": number,
+                "total": total,
+                "entries": group[(number - 1) * PAGE_SIZE:number * PAGE_SIZE],
+            })
+    return pages, sorted(by_category)
+
+
+def _href(from_path, to_path):
+    return posixpath.relpath(to_path, posixpath.dirname(from_path))
+
+
+def render_card(card, href, featured=False, eager=False):
+    date = datetime.strptime(card["date"], '%Y-%m-%d').strftime('%B %d, %Y') if card["date"] else ""
+    badge = f'<span class="featured-badge">{card["badge"]}</span>' if card.get("badge") else ""
+    return (f'<article class="blog-card{" featured" if featured else ""}"><div class="blog-card-image">'
+            f'{responsive_images.card_img(card["image"], featured=featured, eager=eager)}'
+            f'<span class="blog-card-tag">{card["category"]}</span></div><div class="blog-card-content">{badge}'
+            f'<h2><a href="{href}">{card["title"]}</a></h2><div class="blog-meta"><span>{date}</span>'
+            f'<span>&bull;</span><span>{card["read_time"]} min read</span></div>'
+            f'<p class="blog-excerpt">{card["excerpt"]}</p><a href="{href}" class="read-more">'
+            f'{card.get("link_text", "Read full article")}{READ_MORE_ICON}</a></div></article>')
+
+
+def render_categories(page, categories):
+    links = [(BLOG_DIR, "All articles", page["category"] is None)]
+    links += [(f"{BLOG_DIR}/category/{category_slug(c)}", c, page["category"] == c) for c in categories]
+    current_attr = ' aria-current="page"'
+    items = "".join(f'<a href="{_href(page["path"], page_path(base, 1))}"{current_attr if current else ""}>{label}</a>'
+                    for base, label, current in links)
+    return f'<nav class="category-nav" aria-label="Article categories">{items}</nav>'
+
+
+def render_pagination(page):
+    if page["total"] == 1:
+        return ""
+    number, path = page["number"], page["path"]
+    newer = (f'<a href="{_href(path, page_path(page["base"], number - 1))}" rel="prev">&larr; Newer articles</a>'
+             if number > 1 else "<span></span>")
+    older = (f'<a href="{_href(path, page_path(page["base"], number + 1))}" rel="next">Older articles &rarr;</a>'
+             if number < page["total"] else "<span></span>")
+    return (f'<nav class="pagination" aria-label="Blog pages">{newer}'
+            f'<span class="pagination-status">Page {number} of {page["total"]}</span>{older}</nav>')
+
+
+# --- Page template (blog/index.html outside the marker regions) ---
+
+REGIONS = ("BLOG_CATEGORIES", "BLOG_ENTRIES", "BLOG_PAGINATION")
+
+
+def _region_bounds(html, name):
+    start_marker, end_marker = f"<!--{name}_START-->", f"<!--{name}_END-->"
+    start = html.find(start_marker)
+    end = html.find(end_marker, start)
+    if start < 0 or end < 0:
+        return None
+    return start + len(start_marker), end
+
+
+def _set_region(html, name, content):
+    start, end = _region_bounds(html, name)
+    return html[:start] + content + html[end:]
+
+
+def prepare_shell(html):
+    """Add the category/pagination regions and their CSS on first run."""
+    if _region_bounds(html, "BLOG_ENTRIES") is None:
+        raise ValueError(f"{INDEX_PATH} has no <!--BLOG_ENTRIES_START/END--> markers")
+    if _region_bounds(html, "BLOG_CATEGORIES") is None:
+        grid = html.find('<div class="blog-grid">')
+        if grid < 0:
+            grid = html.find("<!--BLOG_ENTRIES_START-->")
+        html = html[:grid] + "<!--BLOG_CATEGORIES_START--><!--BLOG_CATEGORIES_END-->\n" + html[grid:]
+    if _region_bounds(html, "BLOG_PAGINATION") is None:
+        grid_end = html.find("</div>", html.find("<!--BLOG_ENTRIES_END-->")) + len("</div>")
+        html = html[:grid_end] + "\n<!--BLOG_PAGINATION_START--><!--BLOG_PAGINATION_END-->" + html[grid_end:]
+    if _CSS_MARKER not in html and "</style>" in html:
+        line_start = html.rfind("\n", 0, html.find("</style>")) + 1
+        html = html[:line_start] + INDEX_CSS.lstrip("\n") + html[line_start:]
+    return html
+
+
+def shell_of(html):
+    """The template: the index with its marker regions emptied."""
+    for name in REGIONS:
+        html = _set_region(html, name, "")
+    return html
+
+
+_RELATIVE_URL_RE = re.compile(r'(\s(?:href|src)=")(?![a-zA-Z][a-zA-Z0-9+.-]*:|/|#)([^"]*")')
+
+
+def _sub_once(pattern, replacement, html):
+    return re.sub(pattern, lambda m: m.group(1) + replacement + m.group(2), html, count=1, flags=re.DOTALL)
+
+
+def retarget(shell, page):
+    """The template adapted to a page other than blog/index.html."""
+    depth = page["path"].count("/") - 1
+    html = _RELATIVE_URL_RE.sub(lambda m: m.group(1) + "../" * depth + m.group(2), shell)
+    category, number = page["category"], page["number"]
+    suffix = f" - Page {number}" if number > 1 else ""
+    if category:
+        title = f"{category} Articles{suffix} | SteadiDay Blog"
+        heading = category
+        description = (f"{category} articles from the SteadiDay blog: practical health and wellness "
+                       f"advice for adults 50+{f' (page {number})' if number > 1 else ''}.")
+    else:
+        title = f"SteadiDay Blog{suffix} | Health & Wellness Tips for Adults 50+"
+        heading = "SteadiDay Blog"
+        description = f"Health and wellness articles for adults 50+, page {number} of the SteadiDay blog."
+    url = page_url(page["path"])
+    html = _sub_once(r'(<title>).*?(</title>)', title, html)
+    html = _sub_once(r'(<meta name="description" content=")[^"]*(")', description, html)
+    html = _sub_once(r'(<link rel="canonical" href=")[^"]*(")', url, html)
+    html = _sub_once(r'(<meta property="og:title" content=")[^"]*(")', title.split(" | ")[0], html)
+    html = _sub_once(r'(<meta property="og:description" content=")[^"]*(")', description, html)
+    html = _sub_once(r'(<meta property="og:url" content=")[^"]*(")', url, html)
+    html = _sub_once(r'(<div class="header-content">\s*<h1>).*?(</h1>)', heading, html)
+    if category:
+        html = _sub_once(r'(<span class="section-label">).*?(</span>)', f"{category} Articles", html)
+    return html
+
+
+def render_page(template, page, categories):
+    cards = [render_card(card, _href(page["path"], f"{BLOG_DIR}/{name}"),
+                         featured=page["category"] is None and page["number"] == 1 and i == 0, eager=i == 0)
+             for i, (name, card) in enumerate(page["entries"])]
+    html = _set_region(template, "BLOG_CATEGORIES", render_categories(page, categories))
+    html = _set_region(html, "BLOG_ENTRIES", "\n" + "".join(f"  {card}\n" for card in cards) + "  ")
+    return _set_region(html, "BLOG_PAGINATION", render_pagination(page))
+
+
+# --- Build ---
+
+def _load_state(tree):
+    try:
+        with open(tree.abspath(STATE_PATH), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _digest(shell, page, categories):
+    payload = json.dumps([VERSION, page, categories], sort_keys=True)
+    return hashlib.sha256((shell + "\0" + payload).encode('utf-8')).hexdigest()
+
+
+def _listing_files(tree):
+    prefixes = (f"{BLOG_DIR}/page/", f"{BLOG_DIR}/category/")
+    return [rel for rel in tree.files_in(BLOG_DIR, recursive=True) if rel.startswith(prefixes)]
+
+
+def build(tree=None, force=False):
+    """Render every listing page whose inputs changed. Returns (written, removed)."""
+    tree = tree or SiteTree()
+    if not tree.exists(INDEX_PATH):
+        print(f"Warning: {INDEX_PATH} not found")
+        return 0, 0
+    cards = load_cards(tree)
+    entries = collect(tree, cards)
+    save_cards(tree, cards)
+
+    index = prepare_shell(tree.read(INDEX_PATH))
+    shell = shell_of(index)
+    pages, categories = listings(entries)
+    state = _load_state(tree)
+    previous = {} if force else state.get("pages", {})
+    digests, written, skipped = {}, 0, 0
+    for page in pages:
+        path = page["path"]
+        digests[path] = _digest(shell, page, categories)
+        if digests[path] == previous.get(path) and tree.exists(path) and path != INDEX_PATH:
+            skipped += 1
+            continue
+        template = index if path == INDEX_PATH else retarget(shell, page)
+        if tree.write(path, render_page(template, page, categories)):
+            written += 1
+            print(f"  ✏️  {path}")
+
+    removed = 0
+    for rel in _listing_files(tree):
+        if rel not in digests:
+            tree.remove(rel)
+            try:
+                os.removedirs(os.path.dirname(tree.abspath(rel)))
+            except OSError:
+                pass  # directory still has other pages
+            removed += 1
+            print(f"  🗑️  {rel}")
+    os.makedirs(os.path.dirname(tree.abspath(STATE_PATH)), exist_ok=True)
+    write_if_changed(tree.abspath(STATE_PATH), json.dumps({"pages": digests}, indent=1, sort_keys=True) + "\n")
+    print(f"📚 Listing pages: {len(pages)} ({written} written, {skipped} unchanged, {removed} removed) | "
+          f"Posts: {len(entries)} | Categories: {len(categories)}")
+    return written, removed
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Font Build
+
+Self-hosted, subset web fonts in place of the Google Fonts stylesheet.
+Every page used to preconnect to fonts.googleapis.com and fonts.gstatic.com
+and load a render-blocking stylesheet for Merriweather 400/700 and Source
+Sans 3 400-700 before any text could paint.
+
+The font files are vendored in assets/fonts/src/ (the OFL-licensed TTFs
+from the Google Fonts or Adobe releases, file names as in FACES). For each
+face this writes assets/fonts/<family>-<weight>.<hash>.woff2, subset with
+fontTools to the characters the site actually uses: BASE_TEXT (ASCII,
+Latin-1 and typographic punctuation, so most new posts need nothing new)
+plus every character in the text of the site's pages. The covered set only
+grows, so a publish re-subsets (and renames) the fonts only when a post
+brings a character that is not covered yet; --force rebuilds from scratch.
+
+Pages then get, in place of the Google Fonts block:
+    <link rel="preload" ... as="font">   for the PRELOAD faces (body text
+                                         and headings), so they are fetched
+                                         in parallel with the HTML
+    <style id="web-fonts">               @font-face rules with
+                                         font-display: swap
+The URLs are root-relative, so the same block works at every depth,
+including the blog listings rendered from blog/index.html. Pages using
+other fonts (security.html) are left alone.
+
+assets/fonts/manifest.json records the source hashes, the covered text and
+the output of every face, and is what head_tags() (and so the post
+template) renders from. Until the sources are vendored there is no
+manifest and pages keep the Google Fonts block. A per-page cache of the
+characters found (.site-build/font-text.json, keyed by mtime and size)
+keeps re-runs from re-reading unchanged pages.
+
+Requires fontTools and brotli (pip install fonttools brotli) to subset;
+head_tags() and the page rewrite need neither.
+
+Usage (from the repo root):
+    python scripts/site_cli.py build --only fonts
+    python scripts/site_cli.py fonts [--force]
+"""
+
+import os
+import re
+import io
+import json
+import html
+import hashlib
+
+from site_tree import SiteTree, write_if_changed
+
+FONTS_DIR = "assets/fonts"
+SOURCE_DIR = f"{FONTS_DIR}/src"
+MANIFEST = f"{FONTS_DIR}/manifest.json"
+CACHE_PATH = ".site-build/font-text.json"
+
+# (family, weight, source file in SOURCE_DIR)
+FACES = [
+    ("Merriweather", 400, "Merriweather-Regular.ttf"),
+    ("Merriweather", 700, "Merriweather-Bold.ttf"),
+    ("Source Sans 3", 400, "SourceSans3-Regular.ttf"),
+    ("Source Sans 3", 500, "SourceSans3-Medium.ttf"),
+    ("Source Sans 3", 600, "SourceSans3-SemiBold.ttf"),
+    ("Source Sans 3", 700, "SourceSans3-Bold.ttf"),
+]
+# Faces needed for the first paint: body text and headings
+PRELOAD = [("Source Sans 3", 400), ("Merriweather", 700)]
+
+BASE_TEXT = ("".join(map(chr, range(0x20, 0x7f))) + "".join(map(chr, range(0xa0, 0x100)))
+             + "‐‑–—‘’‚“”„†‡•"
+             "…‰′″‹›€™←↑→↓")
+# Bump when the subsetting options change to rebuild every face
+VERSION = 1
+
+GOOGLE_FONTS_CSS = ("https://fonts.googleapis.com/css2?family=Merriweather:wght@400;700"
+                    "&family=Source+Sans+3:wght@400;500;600;700&display=swap")
+# The block pages carry without self-hosted fonts, as the post template writes it
+GOOGLE_FONTS_TAGS = [
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>',
+    f'<link href="{GOOGLE_FONTS_CSS}" rel="stylesheet">',
+]
+
+_FONT_BLOCK_RE = re.compile(
+    r'<link rel="preconnect" href="https://fonts\.googleapis\.com">\s*'
+    r'<link rel="preconnect" href="https://fonts\.gstatic\.com" crossorigin>\s*'
+    r'<link href="' + re.escape(GOOGLE_FONTS_CSS) + r'" rel="stylesheet">'
+    r'|(?:<link rel="preload" href="[^"]*\.woff2" as="font" type="font/woff2" crossorigin>\s*)*'
+    r'<style id="web-fonts">[^<]*</style>')
+_SKIP_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_ATTR_TEXT_RE = re.compile(r'\s(?:alt|placeholder|title|aria-label)="([^"]*)"')
+
+
+# --- Characters in use ---
+
+def page_chars(page):
+    """Characters a page can render in a web font: its text and text attributes."""
+    page = _SKIP_RE.sub(" ", page)
+    text = _TAG_RE.sub(" ", page) + " ".join(_ATTR_TEXT_RE.findall(page))
+    return set(html.unescape(text))
+
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def site_chars(tree, cache):
+    """Characters beyond BASE_TEXT across the site's pages. Updates `cache`
+    ({relpath: [mtime_ns, size, chars]}) and returns (chars, pages parsed)."""
+    base, chars, parsed, seen = set(BASE_TEXT), set(), [], {}
+    for rel in tree.html_files():
+        st = os.stat(tree.abspath(rel))
+        entry = cache.get(rel)
+        if not entry or entry[:2] != [st.st_mtime_ns, st.st_size]:
+            entry = [st.st_mtime_ns, st.st_size,
+                     "".join(sorted(c for c in page_chars(tree.read(rel)) - base if c.isprintable()))]
+            parsed.append(rel)
+        seen[rel] = entry
+        chars.update(entry[2])
+    cache.clear()
+    cache.update(seen)
+    return chars, parsed
+
+
+# --- Subsetting ---
+
+def source_faces(tree):
+    """[(family, weight, source relpath)] if every face in FACES is vendored, else None."""
+    faces = [(family, weight, f"{SOURCE_DIR}/{name}") for family, weight, name in FACES]
+    missing = [rel for _, _, rel in faces if not tree.exists(rel)]
+    if missing:
+        if len(missing) < len(faces):
+            print(f"⚠️  Missing font sources: {', '.join(missing)}")
+        return None
+    return faces
+
+
+def _file_hash(tree, rel):
+    with open(tree.abspath(rel), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def subset_face(path, text):
+    """woff2 bytes of the font at `path`, subset to the characters of `text`."""
+    from fontTools import subset
+    options = subset.Options()
+    options.flavor = "woff2"
+    font = subset.load_font(path, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    buf = io.BytesIO()
+    subset.save_font(font, buf, options)
+    return buf.getvalue()
+
+
+def _slug(family):
+    return re.sub(r'[^a-z0-9]+', '-', family.lower()).strip('-')
+
+
+def build_fonts(tree, faces, text, force=False):
+    """Subset every face to `text` unless the manifest already covers it.
+    Returns (manifest, rebuilt)."""
+    manifest = _load_json(tree.abspath(MANIFEST))
+    sources = {rel: _file_hash(tree, rel) for _, _, rel in faces}
+    covered = "" if force else manifest.get("text", "")
+    current = (not force and manifest.get("version") == VERSION
+               and [(f["family"], f["weight"], f["source"], f["source_hash"]) for f in manifest.get("faces", [])]
+               == [(family, weight, rel, sources[rel]) for family, weight, rel in faces]
+               and set(text) <= set(covered))
+    if current:
+        return manifest, False
+
+    text = "".join(sorted(set(text) | set(covered)))
+    old_files = {f["file"] for f in manifest.get("faces", [])}
+    entries = []
+    for family, weight, rel in faces:
+        data = subset_face(tree.abspath(rel), text)
+        out = f"{FONTS_DIR}/{_slug(family)}-{weight}.{hashlib.sha256(data).hexdigest()[:10]}.woff2"
+        write_if_changed(tree.abspath(out), data)
+        entries.append({"family": family, "weight": weight, "source": rel,
+                        "source_hash": sources[rel], "file": out, "bytes": len(data)})
+        print(f"  🔤 {out} ({len(data) / 1024:.1f} KB)")
+    for rel in old_files - {f["file"] for f in entries}:
+        if tree.exists(rel):
+            tree.remove(rel)
+    manifest = {"version": VERSION, "text": text, "faces": entries}
+    write_if_changed(tree.abspath(MANIFEST), json.dumps(manifest, indent=1, ensure_ascii=False) + "\n")
+    return manifest, True
+
+
+# --- Markup ---
+
+def load_manifest(tree=None):
+    tree = tree or SiteTree()
+    return _load_json(tree.abspath(MANIFEST))
+
+
+def head_tags(indent="    ", manifest=None):
+    """The font block for a page's <head>: self-hosted fonts once the manifest
+    exists, the Google Fonts links until then."""
+    manifest = load_manifest() if manifest is None else manifest
+    faces = manifest.get("faces")
+    if not faces:
+        return f"\n{indent}".join(GOOGLE_FONTS_TAGS)
+    tags = [f'<link rel="preload" href="/{f["file"]}" as="font" type="font/woff2" crossorigin>'
+            for f in faces if (f["family"], f["weight"]) in PRELOAD]
+    css = "".join(f"@font-face{{font-family:'{f['family']}';font-style:normal;font-weight:{f['weight']};"
+                  f"font-display:swap;src:url(/{f['file']}) format('woff2')}}" for f in faces)
+    tags.append(f'<style id="web-fonts">{css}</style>')
+    return f"\n{indent}".join(tags)
+
+
+def rewrite_page(page, manifest):
+    """`page` with its font block replaced by head_tags() at the block's indentation."""
+    def replace(m):
+        line_start = page.rfind("\n", 0, m.start()) + 1
+        indent = page[line_start:m.start()]
+        return head_tags(indent if not indent.strip() else "", manifest)
+    return _FONT_BLOCK_RE.sub(replace, page, count=1)
+
+
+def font_files(tree=None):
+    """Repo-relative paths of the self-hosted font files (none before the sources are vendored)."""
+    return [f["file"] for f in load_manifest(tree).get("faces", [])]
+
+
+def build(tree=None, force=False):
+    """Subset the vendored fonts as needed and point every page at them.
+    Returns the number of pages written."""
+    tree = tree or SiteTree()
+    faces = source_faces(tree)
+    if faces is None:
+        print(f"🔤 Fonts: no sources in {SOURCE_DIR}/, pages keep Google Fonts")
+        return 0
+    os.makedirs(os.path.dirname(tree.abspath(CACHE_PATH)), exist_ok=True)
+    cache = _load_json(tree.abspath(CACHE_PATH))
+    if cache.get("version") != VERSION:
+        cache = {"version": VERSION, "pages": {}}
+    chars, parsed = site_chars(tree, cache["pages"])
+    try:
+        manifest, rebuilt = build_fonts(tree, faces, BASE_TEXT + "".join(chars), force=force)
+    except ImportError as e:
+        # Keep serving the current subset; characters it lacks fall back to the next font
+        print(f"⚠️  Cannot subset fonts ({e}); pip install fonttools brotli")
+        manifest, rebuilt = load_manifest(tree), False
+
+    # New and changed pages; every page when the fonts were renamed
+    written = 0
+    for rel in (tree.html_files() if rebuilt else parsed):
+        if tree.write(rel, rewrite_page(tree.read(rel), manifest)):
+            written += 1
+            st = os.stat(tree.abspath(rel))
+            cache["pages"][rel][:2] = [st.st_mtime_ns, st.st_size]
+    write_if_changed(tree.abspath(CACHE_PATH), json.dumps(cache, sort_keys=True, ensure_ascii=False) + "\n")
+    total = sum(f["bytes"] for f in manifest.get("faces", []))
+    print(f"🔤 Fonts: {len(manifest.get('faces', []))} faces, {len(manifest.get('text', ''))} characters, "
+          f"{total / 1024:.1f} KB woff2 ({'re-subset' if rebuilt else 'unchanged'}); "
+          f"{len(parsed)} pages scanned, {written} pages written")
+    return written
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Build Graph
+
+A small incremental build system layered over the site scripts.
+
+Each Artifact declares what it depends on:
+  - inputs:  content files (posts, pages), as a list or a callable(tree)
+  - sources: the scripts/templates that produce it
+  - config:  (source_file, CONSTANT) pairs such as ("scripts/inject_gtag.py",
+             "GTAG_ID"), resolved with ast so nothing gets imported
+  - deps:    artifacts that must be built first (their outputs may be inputs)
+
+A digest over all of that, plus the artifact's own outputs, is stored in
+the build database (.site-build/db.json). On the next run only artifacts
+whose digest changed are rebuilt; independent stale artifacts run in
+parallel. File hashes are cached by (mtime, size), so a no-op run only
+stats files and writes nothing.
+"""
+
+import os
+import ast
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+DB_PATH = ".site-build/db.json"
+
+
+class Artifact:
+    def __init__(self, name, build, inputs=(), sources=(), config=(), deps=(), outputs=()):
+        self.name = name
+        self.build = build
+        self.inputs = inputs
+        self.sources = list(sources)
+        self.config = list(config)
+        self.deps = list(deps)
+        self.outputs = list(outputs)
+
+    def input_files(self, tree):
+        files = self.inputs(tree) if callable(self.inputs) else self.inputs
+        return sorted(set(files))
+
+
+class BuildDB:
+    """Persistent artifact digests plus a stat-keyed file hash cache."""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {"artifacts": {}, "files": {}, "constants": {}}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.data.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+        self.dirty = False
+
+    def artifact_digest(self, name):
+        return self.data["artifacts"].get(name)
+
+    def set_artifact_digest(self, name, digest):
+        if self.data["artifacts"].get(name) != digest:
+            self.data["artifacts"][name] = digest
+            self.dirty = True
+
+    def file_digest(self, tree, relpath):
+        """sha256 of a file, rehashing only when its (mtime, size) changed."""
+        path = tree.abspath(relpath)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return "missing"
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = self.data["files"].get(relpath)
+        if cached and cached[:2] == stamp:
+            return cached[2]
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self.data["files"][relpath] = stamp + [digest]
+        self.dirty = True
+        return digest
+
+    def constant(self, tree, relpath, name):
+        """Value of a module-level constant, re-parsed only when the file changes."""
+        file_digest = self.file_digest(tree, relpath)
+        key = f"{relpath}:{name}"
+        cached = self.data["constants"].get(key)
+        if cached and cached[0] == file_digest:
+            return cached[1]
+        value = None
+        if file_digest != "missing":
+            with open(tree.abspath(relpath), 'r', encoding='utf-8') as f:
+                module = ast.parse(f.read())
+            for node in module.body:
+                if isinstance(node, ast.Assign) and any(
+                        isinstance(t, ast.Name) and t.id == name for t in node.targets):
+                    try:
+                        value = ast.literal_eval(node.value)
+                    except ValueError:
+                        value = ast.dump(node.value)
+        self.data["constants"][key] = [file_digest, value]
+        self.dirty = True
+        return value
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, sort_keys=True, separators=(',', ':'))
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+class BuildGraph:
+    def __init__(self, artifacts, tree, db_path=DB_PATH, force=False, jobs=4):
+        self.artifacts = {a.name: a for a in artifacts}
+        self.order = [a.name for a in artifacts]
+        self.tree = tree
+        self.db = BuildDB(tree.abspath(db_path))
+        self.force = force
+        self.jobs = jobs
+
+    def digest(self, artifact):
+        h = hashlib.sha256()
+        h.update(artifact.name.encode())
+        for rel in artifact.input_files(self.tree):
+            h.update(f"in:{rel}:{self.db.file_digest(self.tree, rel)}".encode())
+        for rel in artifact.sources:
+            h.update(f"src:{rel}:{self.db.file_digest(self.tree, rel)}".encode())
+        for rel, name in artifact.config:
+            value = self.db.constant(self.tree, rel, name)
+            h.update(f"cfg:{name}:{json.dumps(value, sort_keys=True)}".encode())
+        for rel in artifact.outputs:
+            h.update(f"out:{rel}:{self.db.file_digest(self.tree, rel)}".encode())
+        return h.hexdigest()
+
+    def run(self, selected=None, ctx=None):
+        """Build stale artifacts among `selected` (default: all).
+
+        Returns {name: "built" | "fresh" | "skipped"}.
+        """
+        selected = set(self.order if selected is None else selected)
+        ctx = {} if ctx is None else ctx
+        status = {name: "skipped" for name in self.order if name not in selected}
+        pending = [name for name in self.order if name in selected]
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for name in list(pending):
+                    artifact = self.artifacts[name]
+                    if any(dep not in status for dep in artifact.deps if dep in self.artifacts):
+                        continue
+                    pending.remove(name)
+                    if not self.force and self.digest(artifact) == self.db.artifact_digest(name):
+                        status[name] = "fresh"
+                        continue
+                    print(f"\n▶️  {name}")
+                    running[pool.submit(artifact.build, self.tree, ctx)] = name
+                if not running:
+                    if pending:
+                        raise RuntimeError(f"Unsatisfiable build dependencies: {pending}")
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    recorded = future.result()
+                    status[name] = "built"
+                    # Digest again after the build: in-place steps (URL fixes,
+                    # tag injection) rewrite their own inputs.
+                    if recorded is not False:
+                        self.db.set_artifact_digest(name, self.digest(self.artifacts[name]))
+
+        self.db.save()
+        return status
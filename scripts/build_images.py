@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Image Build
+
+Responsive, modern-format versions of the landing page images. index.html
+used to load the app screenshots as full-size 1290x2796 PNGs (about 5 MB
+on a first visit) into slots that are at most ~310 CSS pixels wide.
+
+For every image in IMAGES this writes, under assets/img/:
+    <name>-<width>.avif   at each width (when Pillow has an AVIF encoder)
+    <name>-<width>.webp   at each width
+    <name>-<width>.<ext>  one fallback in the source format, middle width
+
+and then rewrites each <img src="assets/<name>.<ext>"> in index.html into
+a <picture> with AVIF/WebP srcsets, a `sizes` hint for its slot, intrinsic
+width/height (no layout shift), and loading="lazy" below the fold. The
+hero screenshot and nav logo stay eager; the hero gets fetchpriority="high".
+
+The originals are kept: og:image, JSON-LD and the favicon still use them.
+assets/img/manifest.json records the source hash and encoder settings of
+every image, so unchanged images are not re-encoded. Re-running on an
+already converted page regenerates the same <picture> markup.
+
+Requires Pillow (pip install Pillow); AVIF needs Pillow 11.2+ or the
+pillow-avif-plugin package, otherwise only WebP is produced.
+
+Usage (from the repo root):
+    python scripts/site_cli.py images
+    python scripts/site_cli.py images --force
+"""
+
+import io
+import os
+import re
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, features
+
+from site_tree import SiteTree, write_if_changed
+
+OUT_DIR = "assets/img"
+MANIFEST = f"{OUT_DIR}/manifest.json"
+PAGES = ["index.html"]
+
+# source -> output widths. Screenshots fill a 280px hero phone and ~310px
+# grid cells, so 320/640/960 covers 1x-3x screens; the logo is 48px.
+IMAGES = {
+    "assets/screenshot-sos.png": (320, 640, 960),
+    "assets/screenshot-home.png": (320, 640, 960),
+    "assets/screenshot-medical.png": (320, 640, 960),
+    "assets/screenshot-mindbreaks.png": (320, 640, 960),
+    "assets/screenshot-food-tracker.png": (320, 640, 960),
+    "assets/screenshot-watertracker.png": (320, 640, 960),
+    "assets/icon.jpeg": (48, 96, 144),
+}
+
+# `sizes` and loading for an image, by the class of the element around it
+SLOTS = {
+    "hero-phone": {"sizes": "280px", "eager": True},
+    "screenshot-frame": {"sizes": "(max-width: 1024px) 45vw, 310px", "eager": False},
+    "nav-logo": {"sizes": "48px", "eager": True},
+    "footer-brand": {"sizes": "40px", "eager": False},
+}
+DEFAULT_SLOT = {"sizes": "100vw", "eager": False}
+
+QUALITY = {"avif": 50, "webp": 75, "jpeg": 80}
+# Bump when the encoding settings change to force a rebuild
+SETTINGS = json.dumps({"quality": QUALITY, "version": 1}, sort_keys=True)
+
+_IMG_RE = re.compile(
+    r'<picture data-src="(?P<picture_src>[^"]+)">(?:(?!</picture>)[\s\S])*</picture>'
+    r'|<img src="(?P<img_src>assets/[^"/]+)"[^>]*>')
+_ALT_RE = re.compile(r'\balt="([^"]*)"')
+_SLOT_RE = re.compile(r'class="([\w-]+)"')
+
+
+def avif_available():
+    if features.check("avif"):
+        return True
+    try:
+        import pillow_avif  # noqa: F401  (registers the AVIF plugin)
+        return True
+    except ImportError:
+        return False
+
+
+def _encode(im, fmt):
+    buf = io.BytesIO()
+    if fmt == "png":
+        im.save(buf, "PNG", optimize=True)
+    elif fmt == "jpeg":
+        im.convert("RGB").save(buf, "JPEG", quality=QUALITY["jpeg"], optimize=True, progressive=True)
+    elif fmt == "webp":
+        im.save(buf, "WEBP", quality=QUALITY["webp"], method=6)
+    else:
+        im.save(buf, "AVIF", quality=QUALITY["avif"])
+    return buf.getvalue()
+
+
+def _build_one(args):
+    """Process-pool worker: every variant of one source image.
+
+    Returns (source, entry, {output relpath: bytes})."""
+    source, path, widths, formats = args
+    stem, ext = os.path.splitext(os.path.basename(source))
+    fallback_fmt = "jpeg" if ext.lower() in (".jpg", ".jpeg") else "png"
+    outputs, entry = {}, {"formats": {}}
+    with Image.open(path) as original:
+        original.load()
+        entry["width"], entry["height"] = original.size
+        widths = sorted({min(w, original.width) for w in widths})
+        resized = {}
+        for w in widths:
+            h = round(original.height * w / original.width)
+            resized[w] = original if w == original.width else original.resize((w, h), Image.LANCZOS)
+        for fmt in formats:
+            entry["formats"][fmt] = []
+            for w in widths:
+                rel = f"{OUT_DIR}/{stem}-{w}.{fmt}"
+                outputs[rel] = _encode(resized[w], fmt)
+                entry["formats"][fmt].append([w, rel])
+        w = widths[len(widths) // 2]
+        rel = f"{OUT_DIR}/{stem}-{w}{ext.lower()}"
+        outputs[rel] = _encode(resized[w], fallback_fmt)
+        entry["fallback"] = [w, rel]
+    return source, entry, outputs
+
+
+def load_manifest(tree):
+    try:
+        return json.loads(tree.read(MANIFEST))
+    except (OSError, ValueError):
+        return {}
+
+
+def build_variants(tree=None, force=False, jobs=None):
+    """Encode every image in IMAGES whose source or settings changed.
+
+    Returns the manifest ({source: entry})."""
+    tree = tree or SiteTree()
+    formats = (["avif"] if avif_available() else []) + ["webp"]
+    manifest = load_manifest(tree)
+    images = {}
+    tasks = []
+    for source, widths in IMAGES.items():
+        with open(tree.abspath(source), 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        entry = manifest.get("images", {}).get(source)
+        fresh = (entry and not force and entry["sha256"] == digest and manifest.get("settings") == SETTINGS
+                 and list(entry["formats"]) == formats
+                 and all(tree.exists(rel) for variants in entry["formats"].values() for _, rel in variants))
+        if fresh:
+            images[source] = entry
+        else:
+            tasks.append((source, tree.abspath(source), widths, formats))
+            images[source] = {"sha256": digest}
+    if "avif" not in formats:
+        print("⚠️  No AVIF encoder in this Pillow; writing WebP only (pip install pillow-avif-plugin)")
+
+    if tasks:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for source, entry, outputs in pool.map(_build_one, tasks):
+                for rel, data in outputs.items():
+                    write_if_changed(tree.abspath(rel), data)
+                images[source].update(entry)
+                width = entry["fallback"][0]
+                webp = outputs[dict(entry["formats"]["webp"])[width]]
+                print(f"  🖼️  {source}: {os.path.getsize(tree.abspath(source)) / 1024:,.0f} KB -> "
+                      f"{len(webp) / 1024:,.0f} KB (WebP, {width}w)")
+    print(f"📊 Images encoded: {len(tasks)} | Up to date: {len(IMAGES) - len(tasks)}")
+
+    manifest = {"settings": SETTINGS, "images": {src: images[src] for src in sorted(images)}}
+    tree.write(MANIFEST, json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+    return manifest["images"]
+
+
+def _srcset(variants):
+    return ", ".join(f"{rel} {w}w" for w, rel in variants)
+
+
+def picture_markup(source, entry, alt, slot):
+    """<picture> for `source` in a slot from SLOTS."""
+    fallback_w, fallback = entry["fallback"]
+    height = round(entry["height"] * fallback_w / entry["width"])
+    sources = "".join(f'<source type="image/{fmt}" srcset="{_srcset(variants)}" sizes="{slot["sizes"]}">'
+                      for fmt, variants in entry["formats"].items())
+    loading = 'loading="eager"' if slot["eager"] else 'loading="lazy" decoding="async"'
+    if slot is SLOTS["hero-phone"]:
+        loading += ' fetchpriority="high"'
+    return (f'<picture data-src="{source}">{sources}'
+            f'<img src="{fallback}" alt="{alt}" width="{fallback_w}" height="{height}" {loading}></picture>')
+
+
+def update_markup(tree, images, pages=PAGES):
+    """Point the <img> tags for IMAGES in `pages` at the built variants."""
+    changed = []
+    for page in pages:
+        html = tree.read(page)
+
+        def replace(m):
+            source = m.group("picture_src") or m.group("img_src")
+            if source not in images:
+                return m.group(0)
+            alt = _ALT_RE.search(m.group(0))
+            # The slot is the element the image sits in, i.e. the tag just before it
+            slot_class = _SLOT_RE.search(html, html.rfind("<", 0, m.start()), m.start())
+            slot = SLOTS.get(slot_class.group(1) if slot_class else "", DEFAULT_SLOT)
+            return picture_markup(source, images[source], alt.group(1) if alt else "", slot)
+
+        if tree.write(page, _IMG_RE.sub(replace, html)):
+            changed.append(page)
+    return changed
+
+
+def main(tree=None, force=False, jobs=None):
+    tree = tree or SiteTree()
+    images = build_variants(tree, force=force, jobs=jobs)
+    for page in update_markup(tree, images):
+        print(f"  ✏️  {page}")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Link Checker
+
+Checks every outbound link in the blog posts: the study and source links
+from find_relevant_studies() and any other <a href> citations, which are
+never looked at again after publish.
+
+Links are checked concurrently with asyncio. The blocking urllib requests
+run on a thread pool, so there are no extra dependencies. Concurrency is
+bounded globally (--concurrency) and per host (--per-host, plus a minimum
+delay between requests to the same host) to stay polite to the sites we
+cite. HEAD is tried first, with a GET fallback for servers that reject it.
+
+Results are cached in .site-build/links.json and re-checked only when
+stale: healthy links weekly, dead ones (404/410) daily, and timeouts and
+server errors (5xx) every few hours, as they are usually transient.
+The report (.site-build/links.md plus the JSON) lists dead and redirected
+links together with the posts that contain them.
+
+Usage (from the repo root):
+    python scripts/site_cli.py links
+    python scripts/site_cli.py links --force --concurrency 64
+"""
+
+import os
+import re
+import ssl
+import json
+import time
+import asyncio
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from site_tree import SiteTree, write_if_changed
+
+CACHE_PATH = ".site-build/links.json"
+REPORT_PATH = ".site-build/links.md"
+OWN_HOSTS = {"www.steadiday.com", "steadiday.com"}
+USER_AGENT = "Mozilla/5.0 (compatible; SteadiDayLinkChecker/1.0; +https://www.steadiday.com)"
+TIMEOUT = 15
+
+# How long a result stays fresh, by outcome
+RECHECK_AFTER = {
+    "ok": timedelta(days=7),
+    "redirect": timedelta(days=7),
+    "dead": timedelta(days=1),
+    "error": timedelta(hours=6),
+}
+# Minimum gap between two requests to the same host, in seconds
+HOST_DELAY = 0.5
+
+_HREF_RE = re.compile(r'<a\s[^>]*?href="(https?://[^"#]+)[^"]*"', re.IGNORECASE)
+
+
+def extract_links(tree, blog_dir="blog"):
+    """{url: [posts]} for every outbound link in the blog posts."""
+    links = defaultdict(list)
+    for rel in tree.blog_posts(blog_dir):
+        for url in _HREF_RE.findall(tree.read(rel)):
+            url = url.replace("&amp;", "&")
+            if urlsplit(url).hostname not in OWN_HOSTS and rel not in links[url]:
+                links[url].append(rel)
+    return dict(links)
+
+
+def fetch(url):
+    """Blocking check of one URL. Returns a cache entry (without timestamp)."""
+    context = ssl.create_default_context()
+    last_error = None
+    for method in ("HEAD", "GET"):
+        req = urllib.request.Request(url, method=method, headers={"User-Agent": USER_AGENT})
+        try:
+            with urllib.request.urlopen(req, timeout=TIMEOUT, context=context) as resp:
+                final = resp.geturl()
+                outcome = "redirect" if final.rstrip("/") != url.rstrip("/") else "ok"
+                return {"outcome": outcome, "status": resp.status, "final_url": final}
+        except urllib.error.HTTPError as e:
+            # Plenty of servers refuse HEAD (403/405/501); retry those with GET
+            if method == "HEAD" and e.code in (400, 403, 405, 406, 429, 501):
+                last_error = e
+                continue
+            # 5xx is a server having a bad day, not a dead link: re-check it soon
+            outcome = "dead" if e.code in (404, 410) else "error"
+            return {"outcome": outcome, "status": e.code, "final_url": e.geturl() or url}
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            reason = getattr(e, "reason", e)
+            return {"outcome": "error", "status": None, "final_url": url, "error": str(reason)}
+    return {"outcome": "error", "status": getattr(last_error, "code", None), "final_url": url}
+
+
+class HostLimiter:
+    """Per-host concurrency cap plus a minimum delay between requests."""
+
+    def __init__(self, per_host, delay):
+        self.per_host = per_host
+        self.delay = delay
+        self.semaphores = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        self.next_slot = defaultdict(float)
+
+    async def wait(self, host):
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self.next_slot[host])
+        self.next_slot[host] = slot + self.delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def check_all(urls, concurrency=32, per_host=2, delay=HOST_DELAY, progress=None):
+    """Check `urls` concurrently. Returns {url: entry}."""
+    loop = asyncio.get_running_loop()
+    overall = asyncio.Semaphore(concurrency)
+    hosts = HostLimiter(per_host, delay)
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        async def check(url):
+            host = urlsplit(url).hostname or ""
+            async with hosts.semaphores[host]:
+                await hosts.wait(host)
+                async with overall:
+                    results[url] = await loop.run_in_executor(pool, fetch, url)
+            if progress:
+                progress(url, results[url])
+
+        await asyncio.gather(*(check(url) for url in urls))
+    return results
+
+
+def load_cache(tree):
+    try:
+        with open(tree.abspath(CACHE_PATH), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_fresh(entry, now):
+    checked = datetime.fromisoformat(entry["checked"])
+    return now - checked < RECHECK_AFTER.get(entry["outcome"], timedelta(0))
+
+
+def run_check(tree=None, concurrency=32, per_host=2, force=False, host_delay=HOST_DELAY):
+    """Check all outbound links, update the cache and write the report."""
+    tree = tree or SiteTree()
+    links = extract_links(tree)
+    cache = load_cache(tree)
+    now = datetime.now(timezone.utc)
+    stale = [url for url in sorted(links) if force or url not in cache or not is_fresh(cache[url], now)]
+    print(f"🔗 {len(links)} outbound links in posts, {len(stale)} to check "
+          f"({len(links) - len(stale)} cached)")
+
+    def progress(url, entry):
+        if entry["outcome"] in ("dead", "error"):
+            print(f"  ❌ {entry.get('status') or entry.get('error')}: {url}")
+
+    start = time.perf_counter()
+    if stale:
+        results = asyncio.run(check_all(stale, concurrency, per_host, host_delay, progress=progress))
+        stamp = now.isoformat(timespec="seconds")
+        for url, entry in results.items():
+            cache[url] = dict(entry, checked=stamp)
+    print(f"⏱️  Checked in {time.perf_counter() - start:.1f}s")
+
+    # Forget links that no longer appear in any post
+    cache = {url: cache[url] for url in sorted(cache) if url in links}
+    os.makedirs(os.path.dirname(tree.abspath(CACHE_PATH)), exist_ok=True)
+    write_if_changed(tree.abspath(CACHE_PATH), json.dumps(cache, indent=1, sort_keys=True) + "\n")
+
+    report = {outcome: [] for outcome in ("dead", "error", "redirect")}
+    for url, entry in cache.items():
+        if entry["outcome"] in report:
+            report[entry["outcome"]].append(dict(entry, url=url, posts=links[url]))
+    write_if_changed(tree.abspath(REPORT_PATH), render_markdown(report, len(links)))
+    print(f"❌ Dead: {len(report['dead'])} | ⚠️  Errors: {len(report['error'])} | "
+          f"↪️  Redirected: {len(report['redirect'])}")
+    print(f"📝 Report: {REPORT_PATH}")
+    return report
+
+
+def render_markdown(report, total):
+    lines = ["# SteadiDay outbound link health", "", f"{total} outbound links in blog posts.", ""]
+    sections = [("dead", "Dead links"), ("error", "Unreachable / unexpected status"),
+                ("redirect", "Redirected links")]
+    for outcome, heading in sections:
+        items = report[outcome]
+        lines += [f"## {heading} ({len(items)})", ""]
+        for item in items:
+            detail = item.get("status") or item.get("error", "")
+            target = f" -> {item['final_url']}" if outcome == "redirect" else ""
+            lines.append(f"- {item['url']} ({detail}){target}")
+            lines += [f"  - `{post}`" for post in item["posts"]]
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Duplicate Audit
+
+Finds clusters of near-duplicate posts across the whole archive and turns
+them into a canonical/redirect plan. Publishing only checks a new title
+against the archive (topic_pool.is_duplicate, then the model), so overlap
+that got through, or that built up before those checks existed, stayed
+invisible: the two daytime-napping posts cover the same study from two
+angles and compete for the same searches.
+
+Each post becomes a TF-IDF vector over the search_index.tokenize() terms
+of its title, meta description and opening paragraph (plurals and -ing
+forms folded by stem()), taken from the feed metadata cache (feeds.py),
+so only new or changed posts are parsed. FIELD_WEIGHTS favours the
+title; vectors are L2-normalized, so a dot product is the cosine
+similarity.
+
+The pairwise similarity matrix is computed with NumPy in BLOCK x BLOCK
+tiles, so memory stays bounded (a few tens of MB) however large the
+archive; only each post's MAX_NEIGHBOURS best matches above the threshold
+are kept between tiles. Terms that appear in a single post are dropped
+from the tiles (they cannot contribute to any pair) after normalization.
+When the remaining vocabulary fits in HASH_DIMS columns the tiles are
+exact; past that, terms are feature-hashed into HASH_DIMS signed columns,
+pairs within HASH_MARGIN of the threshold are kept as candidates, and
+candidates are rescored exactly from the sparse vectors.
+
+Clusters are stars around a canonical post, never chains: posts are taken
+in canonical preference order (most "Related reading" links pointing at
+them in content/related.json, then oldest, since the older URL has had
+longer to collect links), and each post not yet placed becomes a
+canonical and takes in every unplaced post similar to it. Every duplicate
+is therefore directly similar to the post it would point to.
+
+Outputs:
+    .site-build/duplicates.json, .site-build/duplicates.md
+              the clusters, with scores
+    content/canonical_plan.json
+              one entry per duplicate: the canonical to point at, the
+              score, and a suggested action, "redirect" (retire the page
+              in favour of the canonical) at REDIRECT_SCORE and above,
+              else "canonical" (keep the page, set its rel=canonical).
+              New entries are "proposed"; an entry whose status was
+              changed by hand (e.g. "accepted", "rejected") is kept as is
+              on later runs, and proposals that no longer hold are dropped.
+
+Nothing is applied to the pages; the plan is for review.
+
+Usage (from the repo root):
+    python scripts/site_cli.py duplicates [--threshold 0.3]
+"""
+
+import re
+import json
+import zlib
+import html
+
+import numpy as np
+
+import feeds
+import related_posts
+import search_index
+from site_tree import SiteTree, write_if_changed
+
+JSON_REPORT = ".site-build/duplicates.json"
+MD_REPORT = ".site-build/duplicates.md"
+PLAN_PATH = "content/canonical_plan.json"
+DEFAULT_THRESHOLD = 0.3
+REDIRECT_SCORE = 0.6
+FIELD_WEIGHTS = {"title": 3, "description": 1, "summary": 1}
+BLOCK = 2048
+MAX_NEIGHBOURS = 8
+HASH_DIMS = 1024
+HASH_MARGIN = 0.1
+# Bump when the plan file format changes
+VERSION = 1
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_DOUBLED_RE = re.compile(r'([b-df-hj-np-tv-z])\1$')
+
+
+def stem(term):
+    """Crude suffix folding so "naps", "nap" and "napping" count as one term."""
+    if len(term) > 5 and term.endswith("ing"):
+        term = _DOUBLED_RE.sub(r'\1', term[:-3])
+    elif len(term) > 4 and term.endswith("ies"):
+        term = term[:-3] + "y"
+    elif len(term) > 3 and term.endswith("s") and not term.endswith(("ss", "us", "is")):
+        term = term[:-1]
+    return term
+
+
+# --- Vectors ---
+
+def post_texts(tree):
+    """[(file name, {field: text}, date)] for every post, from the feed metadata cache."""
+    records, _ = feeds.update_cache(tree, feeds.load_cache(tree))
+    posts = []
+    for rel, record in sorted(records.items()):
+        fields = {"title": record["title"], "description": record["description"],
+                  "summary": html.unescape(_TAG_RE.sub(" ", record["summary"]))}
+        posts.append((rel.rsplit("/", 1)[-1], fields, record["date"]))
+    return posts
+
+
+def vectorize(posts):
+    """Sparse L2-normalized TF-IDF rows as CSR arrays, plus the terms."""
+    docs = []
+    for _, fields, _ in posts:
+        tf = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in map(stem, search_index.tokenize(fields.get(field, ""))):
+                tf[term] = tf.get(term, 0) + weight
+        docs.append(tf)
+    vocab, df = {}, []
+    for doc in docs:
+        for term in doc:
+            if term not in vocab:
+                vocab[term] = len(vocab)
+                df.append(0)
+            df[vocab[term]] += 1
+    df = np.array(df, dtype=np.float64)
+    idf = np.log((1 + len(docs)) / (1 + df)) + 1
+    indptr = np.zeros(len(docs) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(doc) for doc in docs])
+    indices = np.fromiter((vocab[t] for doc in docs for t in doc), dtype=np.int32, count=indptr[-1])
+    tf = np.fromiter((w for doc in docs for w in doc.values()), dtype=np.float64, count=indptr[-1])
+    data = (1 + np.log(tf)) * idf[indices]
+    lengths = np.diff(indptr)
+    rows = np.repeat(np.arange(len(docs)), lengths)
+    norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=len(docs)))
+    data = (data / np.where(norms > 0, norms, 1.0)[rows]).astype(np.float32)
+    return {"indptr": indptr, "indices": indices, "data": data, "df": df,
+            "terms": list(vocab)}
+
+
+def tile_columns(vectors):
+    """Dense column and sign of every stored weight, and whether tiles are exact.
+    Terms in a single post get column -1 (dropped)."""
+    shared = vectors["df"] >= 2
+    if shared.sum() <= HASH_DIMS:
+        column = np.full(len(shared), -1, dtype=np.int64)
+        column[shared] = np.arange(int(shared.sum()))
+        sign = np.ones(len(shared), dtype=np.float32)
+        dims, exact = max(1, int(shared.sum())), True
+    else:
+        # crc32, not hash(): str hashes change between interpreter runs
+        h = np.array([zlib.crc32(t.encode("utf-8")) for t in vectors["terms"]], dtype=np.int64)
+        column = np.where(shared, h % HASH_DIMS, -1)
+        sign = np.where((h >> 16) & 1, 1.0, -1.0).astype(np.float32)
+        dims, exact = HASH_DIMS, False
+    return column[vectors["indices"]], sign[vectors["indices"]], dims, exact
+
+
+def dense_rows(vectors, cols, signs, dims, start, stop):
+    """Rows start..stop-1 as a dense (stop - start) x dims tile."""
+    lo, hi = vectors["indptr"][start], vectors["indptr"][stop]
+    rows = np.repeat(np.arange(stop - start), np.diff(vectors["indptr"][start:stop + 1]))
+    keep = cols[lo:hi] >= 0
+    flat = rows[keep] * dims + cols[lo:hi][keep]
+    weights = (vectors["data"][lo:hi] * signs[lo:hi])[keep]
+    return np.bincount(flat, weights=weights, minlength=(stop - start) * dims) \
+             .reshape(stop - start, dims).astype(np.float32)
+
+
+def exact_score(vectors, i, j):
+    ptr, idx, data = vectors["indptr"], vectors["indices"], vectors["data"]
+    a = dict(zip(idx[ptr[i]:ptr[i + 1]].tolist(), data[ptr[i]:ptr[i + 1]].tolist()))
+    return sum(w * a.get(t, 0.0) for t, w in zip(idx[ptr[j]:ptr[j + 1]].tolist(),
+                                                  data[ptr[j]:ptr[j + 1]].tolist()))
+
+
+# --- Pairs ---
+
+def _merge(best_score, best_idx, rows, scores, idx):
+    """Fold candidate (scores, idx) for `rows` into the running top MAX_NEIGHBOURS."""
+    all_scores = np.concatenate([best_score[rows], scores], axis=1)
+    all_idx = np.concatenate([best_idx[rows], idx], axis=1)
+    top = np.argsort(-all_scores, axis=1, kind="stable")[:, :MAX_NEIGHBOURS]
+    best_score[rows] = np.take_along_axis(all_scores, top, axis=1)
+    best_idx[rows] = np.take_along_axis(all_idx, top, axis=1)
+
+
+def _top_in_tile(sims, cut, offset):
+    """Each row's MAX_NEIGHBOURS best scores >= cut in a tile, as (scores, column ids)."""
+    k = min(MAX_NEIGHBOURS, sims.shape[1])
+    part = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    scores = np.take_along_axis(sims, part, axis=1)
+    scores[scores < cut] = -np.inf
+    if k < MAX_NEIGHBOURS:
+        pad = MAX_NEIGHBOURS - k
+        scores = np.pad(scores, ((0, 0), (0, pad)), constant_values=-np.inf)
+        part = np.pad(part, ((0, 0), (0, pad)), constant_values=0)
+    return scores, part + offset
+
+
+def similar_pairs(vectors, threshold=DEFAULT_THRESHOLD, block=BLOCK):
+    """{(i, j): score} for i < j, each post keeping its MAX_NEIGHBOURS best
+    matches at or above `threshold`."""
+    n = len(vectors["indptr"]) - 1
+    cols, signs, dims, exact = tile_columns(vectors)
+    cut = threshold if exact else threshold - HASH_MARGIN
+    best_score = np.full((n, MAX_NEIGHBOURS), -np.inf, dtype=np.float32)
+    best_idx = np.zeros((n, MAX_NEIGHBOURS), dtype=np.int64)
+    for a in range(0, n, block):
+        a_end = min(a + block, n)
+        tile_a = dense_rows(vectors, cols, signs, dims, a, a_end)
+        rows_a = np.arange(a, a_end)
+        for b in range(a, n, block):
+            b_end = min(b + block, n)
+            tile_b = tile_a if b == a else dense_rows(vectors, cols, signs, dims, b, b_end)
+            sims = tile_a @ tile_b.T
+            if b == a:
+                np.fill_diagonal(sims, -np.inf)
+            elif not (sims >= cut).any():
+                continue
+            _merge(best_score, best_idx, rows_a, *_top_in_tile(sims, cut, b))
+            if b != a:
+                _merge(best_score, best_idx, np.arange(b, b_end), *_top_in_tile(sims.T, cut, a))
+
+    pairs = {}
+    for i, j in zip(*np.nonzero(np.isfinite(best_score))):
+        k = int(best_idx[i, j])
+        pair = (min(i, k), max(i, k))
+        if pair in pairs:
+            continue
+        score = float(best_score[i, j]) if exact else exact_score(vectors, *pair)
+        if score >= threshold:
+            pairs[pair] = round(score, 4)
+    return pairs
+
+
+# --- Clusters and plan ---
+
+def canonical_order(names, dates, inbound):
+    """Indices by canonical preference: most inbound related links, then oldest, then name."""
+    return sorted(range(len(names)), key=lambda i: (-inbound.get(names[i], 0), dates[i] or "9999", names[i]))
+
+
+def clusters(names, dates, pairs, inbound):
+    """[{"canonical", "duplicates": [[name, score], ...]}], star-shaped around each canonical."""
+    neighbours = {}
+    for (i, j), score in pairs.items():
+        neighbours.setdefault(i, {})[j] = score
+        neighbours.setdefault(j, {})[i] = score
+    placed, found = set(), []
+    for i in canonical_order(names, dates, inbound):
+        if i in placed or i not in neighbours:
+            continue
+        members = sorted(((j, s) for j, s in neighbours[i].items() if j not in placed),
+                         key=lambda m: (-m[1], names[m[0]]))
+        if not members:
+            continue
+        placed.add(i)
+        placed.update(j for j, _ in members)
+        found.append({"canonical": names[i],
+                      "duplicates": [[names[j], s] for j, s in members]})
+    return found
+
+
+def inbound_links(tree):
+    """{post: number of posts whose "Related reading" links to it}."""
+    counts = {}
+    for links in related_posts.load_graph(tree).values():
+        for name, _ in links:
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def load_plan(tree):
+    if not tree.exists(PLAN_PATH):
+        return {}
+    data = json.loads(tree.read(PLAN_PATH))
+    return data["plan"] if data.get("version") == VERSION else {}
+
+
+def update_plan(plan, found):
+    """Fresh proposals from `found`; entries reviewed by hand are kept."""
+    updated = {name: entry for name, entry in plan.items() if entry.get("status") != "proposed"}
+    for cluster in found:
+        for name, score in cluster["duplicates"]:
+            if name in updated:
+                continue
+            updated[name] = {"canonical": cluster["canonical"], "score": score,
+                             "action": "redirect" if score >= REDIRECT_SCORE else "canonical",
+                             "status": "proposed"}
+    return updated
+
+
+def save_plan(tree, plan, threshold):
+    data = {"version": VERSION, "threshold": threshold, "plan": dict(sorted(plan.items()))}
+    return tree.write(PLAN_PATH, json.dumps(data, indent=1, ensure_ascii=False) + "\n")
+
+
+def render_markdown(found, titles, threshold, total):
+    lines = ["# SteadiDay duplicate audit", "",
+             f"{total} posts, {len(found)} clusters at similarity >= {threshold}.", ""]
+    for cluster in found:
+        canonical = cluster["canonical"]
+        lines += [f"## {titles.get(canonical, canonical)}", "", f"- canonical: `{canonical}`"]
+        lines += [f"- {score:.2f} `{name}` {titles.get(name, '')}" for name, score in cluster["duplicates"]]
+        lines.append("")
+    if not found:
+        lines.append("No near-duplicate posts found.")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def run(tree=None, threshold=DEFAULT_THRESHOLD):
+    """Audit the archive, write the reports and update the plan. Returns the clusters."""
+    tree = tree or SiteTree()
+    posts = post_texts(tree)
+    names = [name for name, _, _ in posts]
+    dates = [date for _, _, date in posts]
+    vectors = vectorize(posts)
+    pairs = similar_pairs(vectors, threshold)
+    found = clusters(names, dates, pairs, inbound_links(tree))
+    titles = {name: fields["title"] for name, fields, _ in posts}
+
+    report = {"threshold": threshold, "posts": len(posts), "pairs": len(pairs), "clusters": found}
+    write_if_changed(tree.abspath(JSON_REPORT), json.dumps(report, indent=1, ensure_ascii=False) + "\n")
+    write_if_changed(tree.abspath(MD_REPORT), render_markdown(found, titles, threshold, len(posts)))
+    plan = update_plan(load_plan(tree), found)
+    save_plan(tree, plan, threshold)
+
+    duplicates = sum(len(c["duplicates"]) for c in found)
+    print(f"🔁 Duplicates: {len(posts)} posts, {len(pairs)} similar pairs, "
+          f"{len(found)} clusters, {duplicates} posts to consolidate")
+    for cluster in found[:10]:
+        print(f"  {cluster['canonical']}")
+        for name, score in cluster["duplicates"]:
+            print(f"    {score:.2f} {name}")
+    print(f"📝 Reports: {JSON_REPORT}, {MD_REPORT} | Plan: {PLAN_PATH}")
+    return found
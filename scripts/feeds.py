@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Feeds
+
+Builds blog/rss.xml (RSS 2.0) and blog/feed.json (JSON Feed 1.1) from a
+per-post metadata cache. generate_rss_feed() used to stat and parse every
+post on every run, sort by file name (so undated pages such as
+best-medication-reminder-apps-seniors.html landed at the top) and build
+the XML with f-strings and hand-rolled escaping.
+
+The cache (.site-build/feed-meta.json) holds one record per post:
+title, description, date, hero image and an HTML summary (the first
+paragraph of the article). It is keyed by (mtime, size), so a run only
+parses posts that are new or changed; records for deleted posts are
+dropped. The newest FEED_SIZE records are picked with a heap, by date
+(article:published_time for pages without a dated file name), then
+file name.
+
+RSS is serialized with ElementTree, with the summary in content:encoded;
+JSON Feed with json. Entities in titles and descriptions are decoded
+first, so the serializers escape them exactly once. Both files are
+written only when their bytes change, and lastBuildDate comes from the
+newest post, so an unchanged archive reproduces both feeds byte for byte.
+
+Usage (from the repo root):
+    python scripts/site_cli.py build --only rss
+"""
+
+import os
+import re
+import html
+import json
+import heapq
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.etree import ElementTree as ET
+
+import responsive_images
+from site_tree import SiteTree, write_if_changed
+
+WEBSITE_URL = "https://www.steadiday.com"
+BLOG_URL = f"{WEBSITE_URL}/blog"
+CACHE_PATH = ".site-build/feed-meta.json"
+FEED_SIZE = 20
+MIN_POST_BYTES = 1024
+
+TITLE = "SteadiDay Blog - Health & Wellness for Adults 50+"
+DESCRIPTION = "Health and wellness tips for adults 50+."
+ICON = f"{WEBSITE_URL}/assets/icon.jpeg"
+# Bump when the cached record fields change
+CACHE_VERSION = 1
+
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ET.register_namespace("content", CONTENT_NS)
+ET.register_namespace("atom", ATOM_NS)
+
+_SUMMARY_RE = re.compile(r'<div class="article-content">.*?<p>(.*?)</p>', re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+
+
+def post_record(tree, relpath):
+    """Feed metadata for one post (the cached part)."""
+    meta = tree.meta(relpath)
+    summary = _SUMMARY_RE.search(tree.read(relpath))
+    return {
+        "title": html.unescape(meta["title"] or meta["filename"]),
+        "description": html.unescape(meta["description"]),
+        "date": meta["date"] or meta["published_time"][:10],
+        "image": meta["og_image"],
+        "summary": _WS_RE.sub(" ", summary.group(1)).strip() if summary else "",
+    }
+
+
+def load_cache(tree):
+    try:
+        with open(tree.abspath(CACHE_PATH), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache["posts"] if cache.get("version") == CACHE_VERSION else {}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def update_cache(tree, cache):
+    """Refresh records for new or changed posts. Returns (records, parsed)."""
+    records, parsed = {}, 0
+    for rel in tree.blog_posts():
+        try:
+            st = os.stat(tree.abspath(rel))
+        except OSError:
+            continue
+        if st.st_size < MIN_POST_BYTES:
+            continue
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = cache.get(rel)
+        if cached and cached["stamp"] == stamp:
+            records[rel] = cached
+            continue
+        records[rel] = dict(post_record(tree, rel), stamp=stamp)
+        parsed += 1
+    return records, parsed
+
+
+def newest(records, count=FEED_SIZE):
+    """The `count` newest posts as (relpath, record), newest first."""
+    return heapq.nlargest(count, records.items(), key=lambda item: (item[1]["date"], item[0]))
+
+
+def _rfc822(date):
+    return format_datetime(datetime.strptime(date, '%Y-%m-%d').replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def _url(relpath):
+    return f"{BLOG_URL}/{relpath.rsplit('/', 1)[-1]}"
+
+
+def _image(url):
+    return responsive_images.variant(url, 800) if responsive_images.is_unsplash(url) else url
+
+
+def content_html(record, url):
+    """HTML summary for content:encoded / content_html."""
+    parts = []
+    if record["image"]:
+        parts.append(f'<p><img src="{html.escape(_image(record["image"]))}" alt=""></p>')
+    parts.append(f'<p>{record["summary"] or html.escape(record["description"])}</p>')
+    parts.append(f'<p><a href="{url}">Read the full article on SteadiDay</a></p>')
+    return "".join(parts)
+
+
+def render_rss(posts):
+    rss = ET.Element("rss", {"version": "2.0"})
+    channel = ET.SubElement(rss, "channel")
+    for tag, text in (("title", TITLE), ("link", f"{BLOG_URL}/index.html"),
+                      ("description", DESCRIPTION), ("language", "en-us")):
+        ET.SubElement(channel, tag).text = text
+    dates = [record["date"] for _, record in posts if record["date"]]
+    ET.SubElement(channel, "lastBuildDate").text = _rfc822(max(dates)) if dates else ""
+    ET.SubElement(channel, f"{{{ATOM_NS}}}link",
+                  {"href": f"{BLOG_URL}/rss.xml", "rel": "self", "type": "application/rss+xml"})
+    for rel, record in posts:
+        url = _url(rel)
+        item = ET.SubElement(channel, "item")
+        ET.SubElement(item, "title").text = record["title"]
+        ET.SubElement(item, "link").text = url
+        ET.SubElement(item, "guid", {"isPermaLink": "true"}).text = url
+        ET.SubElement(item, "description").text = record["description"]
+        ET.SubElement(item, f"{{{CONTENT_NS}}}encoded").text = content_html(record, url)
+        if record["date"]:
+            ET.SubElement(item, "pubDate").text = _rfc822(record["date"])
+    ET.indent(rss, space="  ")
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(rss, encoding="unicode") + "\n"
+
+
+def render_json_feed(posts):
+    items = []
+    for rel, record in posts:
+        url = _url(rel)
+        item = {"id": url, "url": url, "title": record["title"], "summary": record["description"],
+                "content_html": content_html(record, url)}
+        if record["image"]:
+            item["image"] = _image(record["image"])
+        if record["date"]:
+            item["date_published"] = f"{record['date']}T00:00:00Z"
+        items.append(item)
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": TITLE,
+        "home_page_url": f"{BLOG_URL}/index.html",
+        "feed_url": f"{BLOG_URL}/feed.json",
+        "description": DESCRIPTION,
+        "icon": ICON,
+        "language": "en-US",
+        "items": items,
+    }
+    return json.dumps(feed, indent=1, ensure_ascii=False) + "\n"
+
+
+def build_feeds(tree=None, blog_dir="blog"):
+    """Refresh the metadata cache and write both feeds. Returns the feed's posts."""
+    tree = tree or SiteTree()
+    records, parsed = update_cache(tree, load_cache(tree))
+    os.makedirs(os.path.dirname(tree.abspath(CACHE_PATH)), exist_ok=True)
+    write_if_changed(tree.abspath(CACHE_PATH),
+                     json.dumps({"version": CACHE_VERSION, "posts": records}, sort_keys=True) + "\n")
+    posts = newest(records)
+    for name, content in (("rss.xml", render_rss(posts)), ("feed.json", render_json_feed(posts))):
+        path = f"{blog_dir}/{name}"
+        if tree.write(path, content):
+            print(f"  Feed updated: {path} ({len(posts)} posts)")
+        else:
+            print(f"  Feed unchanged: {path}")
+    print(f"  Post metadata: {parsed} parsed, {len(records) - parsed} cached")
+    return posts
@@ -10,10 +10,10 @@ Fixes:
 5. Title length (warns if over 60 characters)
 
 Usage:
-    python fix_blog_posts.py [blog_directory]
+    python scripts/fix_blog_posts.py [blog_directory]
     
 Example:
-    python fix_blog_posts.py ./blog
+    python scripts/fix_blog_posts.py ./blog
 """
 
 import os
@@ -21,16 +21,13 @@ import re
 import sys
 from pathlib import Path
 
-# The correct base URL (your custom domain)
-CORRECT_DOMAIN = "https://www.steadiday.com"
+from site_tree import write_if_changed
 
-# Wrong patterns to find and replace
-WRONG_DOMAINS = [
-    r'https://scm-solutions-llc\.github\.io/steadiday',
-    r'https://scm-solutions-llc\.github\.io',
-    r'http://scm-solutions-llc\.github\.io/steadiday',
-    r'http://scm-solutions-llc\.github\.io',
-]
+# CORRECT_DOMAIN / WRONG_DOMAINS live with the other rewrite rules
+from rewrite_rules import CORRECT_DOMAIN, WRONG_DOMAINS, RULE_SETS
+from rewrite_engine import RewriteEngine
+
+URL_ENGINE = RewriteEngine(RULE_SETS["blog-urls"])
 
 
 def check_title_length(content: str, filepath: Path) -> list:
@@ -56,17 +53,13 @@ def check_title_length(content: str, filepath: Path) -> list:
     return warnings
 
 
-def fix_urls_in_file(filepath: Path) -> tuple[bool, list[str], list[str]]:
+def fix_urls_in_content(content: str, filepath: Path) -> tuple[str, list[str], list[str]]:
     """
-    Fix all URLs in a single HTML file.
+    Fix all URLs in one page's HTML without touching the filesystem.
     
     Returns:
-        tuple: (was_modified, list_of_changes, list_of_warnings)
+        tuple: (fixed_content, list_of_changes, list_of_warnings)
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original_content = content
     changes = []
     warnings = []
     
@@ -74,46 +67,59 @@ def fix_urls_in_file(filepath: Path) -> tuple[bool, list[str], list[str]]:
     title_warnings = check_title_length(content, filepath)
     warnings.extend(title_warnings)
     
-    # Fix all wrong domain references
-    for pattern in WRONG_DOMAINS:
-        matches = re.findall(pattern, content)
-        if matches:
-            for match in set(matches):
-                changes.append(f"  Fixed URL: {match} → {CORRECT_DOMAIN}")
-            content = re.sub(pattern, CORRECT_DOMAIN, content)
-    
-    # Specifically check and fix key meta tags
-    meta_tags_to_check = [
-        ('canonical', r'<link rel="canonical" href="([^"]+)"'),
-        ('og:url', r'<meta property="og:url" content="([^"]+)"'),
-        ('twitter:url', r'<meta name="twitter:url" content="([^"]+)"'),
-        ('og:image', r'<meta property="og:image" content="([^"]+)"'),
-        ('twitter:image', r'<meta name="twitter:image" content="([^"]+)"'),
-    ]
-    
-    for tag_name, pattern in meta_tags_to_check:
-        match = re.search(pattern, content)
-        if match:
-            url = match.group(1)
-            if 'github.io' in url:
+    # Fix all wrong domain references (one scan for every pattern)
+    content, hits = URL_ENGINE.rewrite(content)
+    for domain in WRONG_DOMAINS:
+        if hits[domain]:
+            changes.append(f"  Fixed URL: {domain} → {CORRECT_DOMAIN} ({hits[domain]}x)")
+    
+    # Specifically check key meta tags (only pages that still mention github.io)
+    if 'github.io' in content:
+        meta_tags_to_check = [
+            ('canonical', r'<link rel="canonical" href="([^"]+)"'),
+            ('og:url', r'<meta property="og:url" content="([^"]+)"'),
+            ('twitter:url', r'<meta name="twitter:url" content="([^"]+)"'),
+            ('og:image', r'<meta property="og:image" content="([^"]+)"'),
+            ('twitter:image', r'<meta name="twitter:image" content="([^"]+)"'),
+        ]
+        for tag_name, pattern in meta_tags_to_check:
+            match = re.search(pattern, content)
+            if match and 'github.io' in match.group(1):
                 warnings.append(f"  ⚠️  {tag_name} still contains github.io after fix attempt")
     
+    return content, changes, warnings
+
+
+def fix_urls_in_file(filepath: Path) -> tuple[bool, list[str], list[str]]:
+    """
+    Fix all URLs in a single HTML file.
+    
+    Returns:
+        tuple: (was_modified, list_of_changes, list_of_warnings)
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        original_content = f.read()
+    
+    content, changes, warnings = fix_urls_in_content(original_content, filepath)
+    
     # Check if file was modified
     if content != original_content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_if_changed(filepath, content)
         return True, changes, warnings
     
     return False, changes, warnings
 
 
-def scan_and_fix_blog_directory(blog_dir: str) -> dict:
+def scan_and_fix_blog_directory(blog_dir: str, tree=None) -> dict:
     """
     Scan all HTML files in the blog directory and fix URLs.
+    
+    When the build pipeline passes a SiteTree, pages are read from and
+    written back through its cache (blog_dir is then repo-relative).
     """
     blog_path = Path(blog_dir)
     
-    if not blog_path.exists():
+    if tree is None and not blog_path.exists():
         print(f"❌ Error: Directory '{blog_dir}' does not exist")
         sys.exit(1)
     
@@ -125,7 +131,10 @@ def scan_and_fix_blog_directory(blog_dir: str) -> dict:
         "all_warnings": [],
     }
     
-    html_files = list(blog_path.glob("**/*.html"))
+    if tree is not None:
+        html_files = [Path(rel) for rel in tree.files_in(blog_dir, recursive=True)]
+    else:
+        html_files = list(blog_path.glob("**/*.html"))
     stats["total_files"] = len(html_files)
     
     print(f"📂 Scanning {len(html_files)} HTML files in '{blog_dir}'...")
@@ -133,7 +142,15 @@ def scan_and_fix_blog_directory(blog_dir: str) -> dict:
     print("-" * 70)
     
     for filepath in html_files:
-        modified, changes, warnings = fix_urls_in_file(filepath)
+        if tree is not None:
+            rel = filepath.as_posix()
+            original = tree.read(rel)
+            content, changes, warnings = fix_urls_in_content(original, filepath)
+            modified = content != original
+            if modified:
+                tree.write(rel, content)
+        else:
+            modified, changes, warnings = fix_urls_in_file(filepath)
         
         if modified or warnings:
             print(f"\n📄 {filepath.name}")
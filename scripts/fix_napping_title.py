@@ -1,24 +1,25 @@
 #!/usr/bin/env python3
 """
 One-shot cleanup: fix the truncated title for the napping post in
-blog/index.html and blog/rss.xml.
+blog/index.html, blog/rss.xml and the index card catalog.
 
 The post HTML itself was already fixed manually. This patches the two
 auto-generated artifacts (index card + RSS item) that still carry the
 stale truncated title from the original publish run.
 
 Safe to run multiple times — idempotent. Does nothing if the bad title
-is already gone.
+is already gone. The replacement is the "napping-title" rule set in
+rewrite_rules.py; --dry-run prints the diff instead of writing.
 
 Usage (from repo root):
-    python3 scripts/fix_napping_title.py
+    python3 scripts/fix_napping_title.py [--dry-run]
 """
 
-import os
 import sys
 
-OLD_TITLE = "Daytime Napping and Mortality Risk: What Older..."
-NEW_TITLE = "Daytime Napping and Mortality Risk: What This Means for Adults Over 50"
+from rewrite_engine import RewriteEngine
+from rewrite_rules import OLD_NAPPING_TITLE as OLD_TITLE, NEW_NAPPING_TITLE as NEW_TITLE, RULE_SETS
+from site_tree import SiteTree
 
 # RSS uses a slightly different escape situation — same string, but RSS
 # title doesn't need HTML escaping for these chars, so the literal match
@@ -27,48 +28,33 @@ NEW_TITLE = "Daytime Napping and Mortality Risk: What This Means for Adults Over
 FILES_TO_PATCH = [
     "blog/index.html",
     "blog/rss.xml",
+    "content/blog_index.json",
 ]
 
 
-def patch_file(path: str) -> bool:
-    """Replace OLD_TITLE with NEW_TITLE in `path`. Returns True if changed."""
-    if not os.path.exists(path):
-        print(f"  ⚠ {path} not found — skipping")
-        return False
-
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    occurrences = content.count(OLD_TITLE)
-    if occurrences == 0:
-        print(f"  ✓ {path}: already clean (no truncated title found)")
-        return False
-
-    new_content = content.replace(OLD_TITLE, NEW_TITLE)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(new_content)
-
-    print(f"  ✅ {path}: replaced {occurrences} occurrence(s)")
-    return True
-
-
 def main():
     print("Fixing truncated napping-post title in auto-generated files...")
     print(f"  Old: {OLD_TITLE!r}")
     print(f"  New: {NEW_TITLE!r}\n")
 
-    changed_any = False
+    tree = SiteTree()
+    dry_run = "--dry-run" in sys.argv[1:]
+    report = RewriteEngine(RULE_SETS["napping-title"]).run(tree, paths=FILES_TO_PATCH, dry_run=dry_run)
     for path in FILES_TO_PATCH:
-        if patch_file(path):
-            changed_any = True
+        if not tree.exists(path):
+            print(f"  ⚠ {path} not found — skipping")
+        elif path in report["files"]:
+            print(f"  ✅ {path}: replaced {report['files'][path]['napping-title']} occurrence(s)")
+        else:
+            print(f"  ✓ {path}: already clean (no truncated title found)")
 
     print()
-    if changed_any:
+    if report["files"] and not dry_run:
         print("Done. Commit and push:")
-        print("  git add blog/index.html blog/rss.xml")
+        print("  git add blog/index.html blog/rss.xml content/blog_index.json")
         print("  git commit -m 'fix: replace truncated napping-post title in index and RSS'")
         print("  git push")
-    else:
+    elif not report["files"]:
         print("No changes needed. All files already clean.")
 
 
@@ -7,10 +7,13 @@ Designed to run in GitHub Actions after blog posts are generated.
 
 import os
 import re
+import subprocess
 from datetime import datetime, timezone
 from xml.etree.ElementTree import Element, SubElement, tostring, ElementTree
 from xml.dom.minidom import parseString
 
+from site_tree import write_if_changed
+
 WEBSITE_URL = "https://www.steadiday.com"
 
 # Priority and change frequency settings
@@ -25,45 +28,127 @@ PAGE_CONFIG = {
 # Default config for blog posts
 BLOG_POST_CONFIG = {"priority": "0.7", "changefreq": "monthly"}
 
+# Blog listing pages from blog_index.py (blog/page/<n>/, blog/category/<slug>/)
+LISTING_CONFIG = {"priority": "0.5", "changefreq": "weekly"}
+
 # Featured/pillar content gets higher priority
 PILLAR_POSTS = [
     "best-medication-reminder-apps-seniors.html",
 ]
 
 
-def get_lastmod(filepath):
-    """Get the last modified date of a file from git or filesystem."""
+_git_dates = {}
+
+
+def git_commit_dates(root='.'):
+    """Map repo-relative path -> date (UTC) of the last commit touching it.
+
+    One `git log` for the whole repo instead of a subprocess per page.
+    """
+    if root not in _git_dates:
+        dates = {}
+        try:
+            result = subprocess.run(
+                ["git", "-C", root, "log", "--format=%x00%cd", "--date=format-local:%Y-%m-%d", "--name-only"],
+                capture_output=True, text=True, timeout=60, env={**os.environ, "TZ": "UTC"}
+            )
+            if result.returncode == 0:
+                current = None
+                for line in result.stdout.splitlines():
+                    if line.startswith('\x00'):
+                        current = line[1:11]  # YYYY-MM-DD
+                    elif line and current and line not in dates:
+                        dates[line] = current
+        except Exception:
+            pass
+        _git_dates[root] = dates
+    return _git_dates[root]
+
+
+def git_dirty_files(root='.'):
+    """Repo-relative paths that are modified, added or untracked (not cached:
+    the build writes pages between runs of this)."""
     try:
-        # Try git log first (more accurate for deployed files)
-        import subprocess
         result = subprocess.run(
-            ["git", "log", "-1", "--format=%cI", filepath],
-            capture_output=True, text=True, timeout=5
+            ["git", "-C", root, "status", "--porcelain", "-z", "--untracked-files=all"],
+            capture_output=True, text=True, timeout=60
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()[:10]  # YYYY-MM-DD
     except Exception:
-        pass
+        return set()
+    if result.returncode != 0:
+        return set()
+    dirty, fields = set(), iter(result.stdout.split('\x00'))
+    for entry in fields:
+        if entry:
+            dirty.add(entry[3:])
+            if entry[0] in 'RC':
+                next(fields, None)  # the rename source
+    return dirty
+
+
+def get_lastmod(filepath, root='.', dirty=()):
+    """Get the last modified date of a file (repo-relative) from git or filesystem.
+
+    Deterministic order of preference so rebuilding the sitemap without
+    content changes reproduces it byte for byte: today for files in `dirty`
+    (uncommitted changes, which the publish commit dates today), git commit
+    date, then the YYYY-MM-DD prefix of a post filename, then filesystem mtime.
+    """
+    relpath = filepath.replace(os.sep, '/')
+    if relpath.startswith('./'):
+        relpath = relpath[2:]
+    if relpath in dirty:
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    # Try git log first (more accurate for deployed files)
+    date = git_commit_dates(root).get(relpath)
+    if date:
+        return date
+
+    # New, not-yet-committed posts carry their publish date in the name
+    date_match = re.match(r'(\d{4}-\d{2}-\d{2})-', os.path.basename(relpath))
+    if date_match:
+        return date_match.group(1)
     
     # Fall back to filesystem modification time
-    if os.path.exists(filepath):
-        mtime = os.path.getmtime(filepath)
+    path = os.path.join(root, relpath)
+    if os.path.exists(path):
+        mtime = os.path.getmtime(path)
         return datetime.fromtimestamp(mtime, tz=timezone.utc).strftime('%Y-%m-%d')
     
     return datetime.now(timezone.utc).strftime('%Y-%m-%d')
 
 
-def find_all_pages():
-    """Find all HTML pages that should be in the sitemap."""
+def find_all_pages(tree=None):
+    """Find all HTML pages that should be in the sitemap.
+
+    With a SiteTree (from the build pipeline) the file listing comes from
+    the tree's single walk instead of fresh listdir calls.
+    """
     pages = []
     
+    if tree is not None:
+        top_level = tree.files_in('.')
+        blog_files = [rel.split('/', 1)[1] for rel in tree.files_in('blog')]
+        listings = [rel for rel in tree.files_in('blog', recursive=True)
+                    if rel.endswith('/index.html') and rel.count('/') > 1]
+        dirty = git_dirty_files(tree.root)
+        lastmod = lambda rel: get_lastmod(rel, tree.root, dirty)
+    else:
+        top_level = sorted(os.listdir('.'))
+        blog_files = os.listdir('blog') if os.path.isdir('blog') else []
+        listings = sorted(os.path.join(dirpath, 'index.html').replace(os.sep, '/')
+                          for sub in ('blog/page', 'blog/category')
+                          for dirpath, _, filenames in os.walk(sub) if 'index.html' in filenames)
+        dirty = git_dirty_files()
+        lastmod = lambda rel: get_lastmod(rel, dirty=dirty)
+
     # Top-level pages
-    for filename in os.listdir('.'):
+    for filename in top_level:
         if filename.endswith('.html') and not filename.startswith('_'):
             config = PAGE_CONFIG.get(filename, {"priority": "0.5", "changefreq": "monthly"})
             pages.append({
                 "url": f"{WEBSITE_URL}/{filename}" if filename != "index.html" else WEBSITE_URL + "/",
-                "lastmod": get_lastmod(filename),
+                "lastmod": lastmod(filename),
                 "changefreq": config["changefreq"],
                 "priority": config["priority"],
                 "filepath": filename,
@@ -71,22 +156,32 @@ def find_all_pages():
     
     # Blog index
     blog_index = "blog/index.html"
-    if os.path.exists(blog_index):
+    if "index.html" in blog_files:
         config = PAGE_CONFIG.get(blog_index, {"priority": "0.8", "changefreq": "daily"})
         pages.append({
             "url": f"{WEBSITE_URL}/blog/",
-            "lastmod": get_lastmod(blog_index),
+            "lastmod": lastmod(blog_index),
             "changefreq": config["changefreq"],
             "priority": config["priority"],
             "filepath": blog_index,
         })
     
+    # Blog listing pages (pagination and categories)
+    for filepath in listings:
+        pages.append({
+            "url": f"{WEBSITE_URL}/{filepath[:-len('index.html')]}",
+            "lastmod": lastmod(filepath),
+            "changefreq": LISTING_CONFIG["changefreq"],
+            "priority": LISTING_CONFIG["priority"],
+            "filepath": filepath,
+        })
+
     # Blog posts
     blog_dir = "blog"
-    if os.path.isdir(blog_dir):
-        for filename in sorted(os.listdir(blog_dir), reverse=True):
+    if blog_files:
+        for filename in sorted(blog_files, reverse=True):
             if filename.endswith('.html') and filename != 'index.html':
-                filepath = os.path.join(blog_dir, filename)
+                filepath = f"{blog_dir}/{filename}"
                 
                 # Pillar content gets higher priority
                 is_pillar = filename in PILLAR_POSTS
@@ -94,7 +189,7 @@ def find_all_pages():
                 
                 pages.append({
                     "url": f"{WEBSITE_URL}/blog/{filename}",
-                    "lastmod": get_lastmod(filepath),
+                    "lastmod": lastmod(filepath),
                     "changefreq": config["changefreq"],
                     "priority": config["priority"],
                     "filepath": filepath,
@@ -138,12 +233,13 @@ def generate_sitemap(pages):
     return xml_content
 
 
-def main():
+def main(tree=None):
+    """Regenerate sitemap.xml. Returns the page list for downstream steps."""
     print("=" * 50)
     print("🗺️  SteadiDay Sitemap Generator")
     print("=" * 50)
     
-    pages = find_all_pages()
+    pages = find_all_pages(tree)
     print(f"\n📄 Found {len(pages)} pages:")
     for page in pages:
         print(f"   {page['url']} (priority: {page['priority']})")
@@ -151,11 +247,17 @@ def main():
     sitemap_xml = generate_sitemap(pages)
     
     output_path = "sitemap.xml"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(sitemap_xml)
+    if tree is not None:
+        changed = tree.write(output_path, sitemap_xml)
+    else:
+        changed = write_if_changed(output_path, sitemap_xml)
     
-    print(f"\n✅ Sitemap written to {output_path}")
+    if changed:
+        print(f"\n✅ Sitemap written to {output_path}")
+    else:
+        print(f"\n✔️  Sitemap unchanged: {output_path}")
     print(f"   Total URLs: {len(pages)}")
+    return pages
 
 
 if __name__ == "__main__":
@@ -4,64 +4,74 @@ Inject Google Ads gtag + App Store conversion tracking into all HTML files.
 
 What it does:
 1. Finds every .html file in the repo
-2. Injects the gtag.js base snippet after <head> (if not already present)
-3. Injects an App Store click conversion tracker before </body> (if not already present)
-4. Replaces any old placeholder conversion labels with the real one
+2. Puts the gtag snippet from tracking.py after <head>, merging any gtag
+   blocks already on the page into it (their tag IDs are kept)
+3. Puts the App Store click conversion snippet before </body>, replacing
+   older conversion snippets (and their stale conversion labels)
 
-Safe to run multiple times - skips files that already have the tags.
+With --mode deferred (the default, see tracking.py) gtag.js is only fetched
+after the first interaction or once the page is idle; --mode eager restores
+the standard snippet. Safe to run multiple times - pages that already carry
+the current snippets are left byte-identical.
+
+Incremental mode (--incremental) keeps a ledger in .site-build/ of every
+processed page: path -> (mtime, size, content hash, snippet version). Pages
+whose stat or hash and snippet config are unchanged since the last run are
+not even read, so re-running after one new post touches one file. The
+remaining pages are processed in a process pool; rewrites are atomic, and
+pages that are not valid UTF-8 are reported and left alone rather than
+decoded lossily.
+
+Usage:
+    python scripts/inject_gtag.py [root] [--incremental] [--jobs N] [--mode deferred|eager]
 """
 
 import os
-import sys
 import re
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from site_tree import write_if_changed
+# The tag ID and the snippets themselves (conversion label included) are shared with the
+# blog post template
+from tracking import GTAG_ID, MODE, MODES, CONVERSION_SNIPPET, gtag_snippet
 
 # --- Configuration ---
 
-GTAG_ID = "AW-17929124014"
-
-# The conversion event snippet from Google Ads
-CONVERSION_LABEL = "AW-17929124014/gtKACKzG_Y8cEK7xouVC"
-
-# Old placeholder to find and replace in already-injected files
-OLD_PLACEHOLDER = "AW-17929124014/REPLACE_WITH_YOUR_CONVERSION_LABEL"
-
-GTAG_SNIPPET = f'''<!-- Google tag (gtag.js) -->
-<script async src="https://www.googletagmanager.com/gtag/js?id={GTAG_ID}"></script>
-<script>
-  window.dataLayer = window.dataLayer || [];
-  function gtag(){{dataLayer.push(arguments);}}
-  gtag('js', new Date());
-  gtag('config', '{GTAG_ID}');
-</script>'''
-
-CONVERSION_SNIPPET = f'''<!-- Google Ads: App Store click conversion tracking -->
-<script>
-  document.addEventListener('DOMContentLoaded', function() {{
-    // Track clicks on all App Store links as conversions
-    var links = document.querySelectorAll('a[href*="apps.apple.com"]');
-    for (var i = 0; i < links.length; i++) {{
-      links[i].addEventListener('click', function() {{
-        if (typeof gtag === 'function') {{
-          gtag('event', 'conversion', {{
-            'send_to': '{CONVERSION_LABEL}',
-            'event_callback': function() {{
-              // Allow the link to proceed after tracking
-            }}
-          }});
-        }}
-      }});
-    }}
-  }});
-</script>'''
-
-# --- Markers to detect existing injections ---
-
-GTAG_MARKER = f"googletagmanager.com/gtag/js?id={GTAG_ID}"
-CONVERSION_MARKER = "App Store click conversion tracking"
+# Recognized tracking blocks, whatever their vintage: the standard snippet
+# (one or more gtag.js loaders + the dataLayer bootstrap, possibly under a
+# comment), our deferred snippet, and every conversion snippet this repo
+# has shipped. They are replaced by the current snippets, so changing mode
+# or label re-tags pages that are already tagged.
+_CONFIG_RE = re.compile(r"gtag\(\s*'config'\s*,\s*'([\w-]+)'\s*\)")
+_GTAG_BLOCK_RE = re.compile(
+    r"(?:<!--(?:(?!-->)[\s\S])*-->\s*)?"
+    r"(?:<script async src=\"https://www\.googletagmanager\.com/gtag/js\?id=[\w-]+\"></script>\s*)+"
+    r"<script>\s*window\.dataLayer\s*=\s*window\.dataLayer\s*\|\|\s*\[\];\s*"
+    r"function gtag\(\)\s*\{\s*dataLayer\.push\(arguments\);\s*\}\s*gtag\('js',\s*new Date\(\)\);\s*"
+    r"(?:gtag\('config',\s*'[\w-]+'\);\s*)+</script>"
+    r"|<!-- Google tag \(gtag\.js\), loaded on first interaction or when idle -->\s*"
+    r"<script>(?:(?!</script>)[\s\S])*</script>")
+_CONVERSION_BLOCK_RE = re.compile(
+    r"(?:<!--\s*GTAG_CONVERSION_INJECTED\s*-->\s*(?:<!--[^>]*App Store click conversion tracking[^>]*-->\s*)?"
+    r"|<!--[^>]*App Store click conversion tracking[^>]*-->\s*)"
+    r"<script>(?:(?!</script>)[\s\S])*</script>")
+
+
+def snippet_version(mode=MODE):
+    """Changes whenever the injected markup or the rules that place it change,
+    which invalidates every ledger entry."""
+    return hashlib.sha256('\0'.join([gtag_snippet(mode=mode), CONVERSION_SNIPPET, _GTAG_BLOCK_RE.pattern,
+                                      _CONVERSION_BLOCK_RE.pattern]).encode('utf-8')).hexdigest()[:12]
+
+
+LEDGER_PATH = ".site-build/gtag-ledger.json"
 
 # --- File discovery ---
 
-SKIP_DIRS = {'.git', 'node_modules', '.github', '__pycache__'}
+SKIP_DIRS = {'.git', 'node_modules', '.github', '__pycache__', '.site-build', '_site'}
 
 
 def find_html_files(root_dir):
@@ -75,70 +85,202 @@ def find_html_files(root_dir):
     return html_files
 
 
-def inject_into_file(filepath):
-    """Inject gtag and conversion snippets into a single HTML file."""
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
+def _replace_blocks(content, pattern, snippet):
+    """Replace the first match of `pattern` with `snippet` and drop the rest,
+    along with the whitespace before them. None if nothing matched."""
+    parts, pos = [], 0
+    for m in pattern.finditer(content):
+        if pos == 0:
+            parts += [content[:m.start()], snippet]
+        else:
+            parts.append(content[pos:m.start()].rstrip())
+        pos = m.end()
+    return "".join(parts) + content[pos:] if parts else None
 
-    modified = False
 
-    # 1. Inject gtag after <head>
-    if GTAG_MARKER not in content:
-        # Try <head> with attributes first, then plain <head>
-        for tag in ['<head>', '<HEAD>']:
-            if tag in content:
-                content = content.replace(tag, tag + '\n' + GTAG_SNIPPET, 1)
-                modified = True
-                break
-        else:
-            # Try regex-style match for <head ...>
-            head_match = re.search(r'<head[^>]*>', content, re.IGNORECASE)
-            if head_match:
-                insert_pos = head_match.end()
-                content = content[:insert_pos] + '\n' + GTAG_SNIPPET + content[insert_pos:]
-                modified = True
-
-    # 2. Replace placeholder conversion label if present
-    if OLD_PLACEHOLDER in content:
-        content = content.replace(OLD_PLACEHOLDER, CONVERSION_LABEL)
-        modified = True
-
-    # 3. Inject conversion tracking before </body>
-    if CONVERSION_MARKER not in content:
+def inject_into_content(content, mode=MODE):
+    """Normalize one page's tracking to the current gtag and conversion snippets.
+
+    Existing gtag blocks are merged into one snippet (keeping every tag ID
+    they configured) and existing conversion blocks into one; pages without
+    them get the snippets after <head> and before </body>. Returns
+    (new_content, modified). Pure string transform so the build pipeline
+    can run it against its in-memory copy of the page.
+    """
+    original = content
+
+    # 1. gtag, after <head>
+    config_ids = []
+    for block in _GTAG_BLOCK_RE.finditer(content):
+        config_ids += [i for i in _CONFIG_RE.findall(block.group(0)) if i not in config_ids]
+    if GTAG_ID not in config_ids:
+        config_ids.insert(0, GTAG_ID)
+    snippet = gtag_snippet(config_ids, mode)
+    replaced = _replace_blocks(content, _GTAG_BLOCK_RE, snippet)
+    if replaced is not None:
+        content = replaced
+    else:
+        head_match = re.search(r'<head[^>]*>', content, re.IGNORECASE)
+        if head_match:
+            content = content[:head_match.end()] + '\n' + snippet + content[head_match.end():]
+
+    # 2. Conversion tracking, before </body>
+    replaced = _replace_blocks(content, _CONVERSION_BLOCK_RE, CONVERSION_SNIPPET)
+    if replaced is not None:
+        content = replaced
+    else:
         for tag in ['</body>', '</BODY>']:
             if tag in content:
                 content = content.replace(tag, CONVERSION_SNIPPET + '\n' + tag, 1)
-                modified = True
                 break
 
-    if modified:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True
-    return False
+    return content, content != original
+
+
+def inject_into_file(filepath, known_digest=None, mode=MODE):
+    """Inject gtag and conversion snippets into a single HTML file.
+
+    Returns (status, digest): status is "injected", "skipped" (already
+    tagged), "unchanged" (content hash equals `known_digest`) or
+    "undecodable"; digest is the sha256 of the file as left on disk.
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_digest:
+        return "unchanged", digest
+    try:
+        content = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return "undecodable", None
 
+    content, modified = inject_into_content(content, mode)
+    if modified and write_if_changed(filepath, content):
+        return "injected", hashlib.sha256(content.encode('utf-8')).hexdigest()
+    return "skipped", digest
 
-def main():
-    root = sys.argv[1] if len(sys.argv) > 1 else '.'
-    html_files = find_html_files(root)
 
-    if not html_files:
+def _inject_worker(args):
+    return inject_into_file(*args)
+
+
+class Ledger:
+    """Pages already processed with the current snippets.
+
+    Entries are [mtime_ns, size, sha256, snippet_version]; a page is current
+    when its stat matches and it was processed with the current snippet
+    version (which depends on the loading mode).
+    """
+
+    def __init__(self, path, mode=MODE):
+        self.path = path
+        self.version = snippet_version(mode)
+        self.files = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.files = json.load(f).get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    def _entry(self, rel):
+        entry = self.files.get(rel)
+        return entry if entry and entry[3] == self.version else None
+
+    def is_current(self, rel, abspath):
+        entry = self._entry(rel)
+        if not entry:
+            return False
+        try:
+            st = os.stat(abspath)
+        except OSError:
+            return False
+        return entry[:2] == [st.st_mtime_ns, st.st_size]
+
+    def known_digest(self, rel):
+        """Hash recorded for `rel`, to skip pages whose stat changed but content did not."""
+        entry = self._entry(rel)
+        return entry[2] if entry else None
+
+    def record(self, rel, abspath, digest):
+        st = os.stat(abspath)
+        self.files[rel] = [st.st_mtime_ns, st.st_size, digest, self.version]
+
+    def save(self, existing):
+        # Drop pages that no longer exist
+        self.files = {rel: e for rel, e in self.files.items() if rel in existing}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        write_if_changed(self.path, json.dumps({"files": self.files}, sort_keys=True, separators=(',', ':')))
+
+
+def main(root=None, tree=None, incremental=False, jobs=None, mode=MODE):
+    """Inject into every page under `root`.
+
+    When the build pipeline passes a SiteTree, pages come from (and are
+    written back through) its cache instead of a fresh os.walk + read.
+    With `incremental`, pages recorded as current in the ledger are skipped
+    without being read.
+    """
+    if root is None:
+        parser = argparse.ArgumentParser(description="Inject gtag + conversion tracking into HTML pages")
+        parser.add_argument("root", nargs="?", default=".", help="Site root (default: .)")
+        parser.add_argument("--incremental", action="store_true",
+                            help="Skip pages unchanged since the last run (ledger in .site-build/)")
+        parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+        parser.add_argument("--mode", choices=MODES, default=MODE,
+                            help=f"How pages load gtag.js (default: {MODE}, see tracking.py)")
+        args = parser.parse_args()
+        root, incremental, jobs, mode = args.root, args.incremental, args.jobs, args.mode
+
+    if tree is not None:
+        rel_files = tree.html_files()
+        abspath = tree.abspath
+    else:
+        rel_files = sorted(os.path.relpath(p, root).replace(os.sep, '/') for p in find_html_files(root))
+        abspath = lambda rel: os.path.join(root, *rel.split('/'))
+
+    if not rel_files:
         print(f"No .html files found in {os.path.abspath(root)}")
         return
 
-    injected = 0
-    skipped = 0
+    ledger = Ledger(os.path.join(root, *LEDGER_PATH.split('/')), mode) if incremental else None
+    todo = [rel for rel in rel_files if not (ledger and ledger.is_current(rel, abspath(rel)))]
+    counts = {"injected": 0, "skipped": 0, "unchanged": 0, "undecodable": 0}
+    counts["unchanged"] = len(rel_files) - len(todo)
 
-    for filepath in html_files:
-        rel = os.path.relpath(filepath, root)
-        if inject_into_file(filepath):
-            print(f"  Injected: {rel}")
-            injected += 1
+    def results():
+        if tree is not None:
+            # In-process: the tree's cache is shared with the other build steps
+            for rel in todo:
+                content, changed = inject_into_content(tree.read(rel), mode)
+                if changed:
+                    changed = tree.write(rel, content)
+                yield rel, ("injected" if changed else "skipped"), hashlib.sha256(content.encode('utf-8')).hexdigest()
+        elif len(todo) > 1 and jobs != 1:
+            tasks = [(abspath(rel), ledger.known_digest(rel) if ledger else None, mode) for rel in todo]
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                chunksize = max(1, len(tasks) // ((jobs or os.cpu_count() or 1) * 4))
+                for rel, (status, digest) in zip(todo, pool.map(_inject_worker, tasks, chunksize=chunksize)):
+                    yield rel, status, digest
         else:
+            for rel in todo:
+                yield (rel,) + inject_into_file(abspath(rel), ledger.known_digest(rel) if ledger else None, mode)
+
+    for rel, status, digest in results():
+        counts[status] += 1
+        if status == "injected":
+            print(f"  Injected: {rel}")
+        elif status == "skipped":
             print(f"  Skipped (already has tags): {rel}")
-            skipped += 1
+        elif status == "undecodable":
+            print(f"  ⚠️  Not valid UTF-8, left untouched: {rel}")
+        if ledger and digest:
+            ledger.record(rel, abspath(rel), digest)
 
-    print(f"\nDone! {injected} files updated, {skipped} already had tags.")
+    if ledger:
+        ledger.save(set(rel_files))
+    print(f"\nDone! {counts['injected']} files updated, {counts['skipped']} already had tags"
+          + (f", {counts['unchanged']} unchanged since last run" if incremental else "")
+          + (f", {counts['undecodable']} not valid UTF-8" if counts['undecodable'] else "") + ".")
 
 
 if __name__ == '__main__':
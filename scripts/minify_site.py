@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Minify & Page-Weight Budget
+
+Writes a minified, deployable copy of the site to _site/ and reports what
+every page weighs. The committed pages keep the indentation of the Python
+string templates (index.html alone is ~88 KB), but they stay that way on
+purpose: inject_gtag.py, the rewrite rules and `site_cli.py rerender` all
+read and compare the committed HTML. Minification is an output stage that
+runs after generation and injection, on a copy, and _site/ is what GitHub
+Pages serves: .github/workflows/deploy-pages.yml builds it from main and
+deploys it after every push and publish.
+
+What is minified:
+    HTML   comments dropped (except conditional comments); whitespace runs
+           collapsed to one character, newline-preserving, so inline
+           layout is unchanged; whitespace between tags removed inside
+           <head>; tags re-spaced outside quoted attribute values
+    CSS    styles.css, blog/post.*.css and <style> blocks: comments and
+           whitespace around punctuation removed, strings left alone
+    JS     inline <script>: indentation, blank lines and whole-line //
+           comments removed; newlines are kept so ASI never changes
+    JSON   <script type="application/ld+json"> re-serialized compactly
+
+<pre> and <textarea> are copied verbatim, as are scripts with a template
+literal (a backtick) or a src. Everything else the site serves (images,
+XML, robots.txt, CNAME, ...) is copied unchanged; files no longer in the
+site are removed from _site/.
+
+Each output is checked against BUDGETS (minified bytes, first matching
+pattern wins). The report in .site-build/size-report.md (+ .json) lists
+before/after/gzip sizes and the change since the previous report, so page
+weight regressions show up in every build.
+
+Usage (from the repo root):
+    python scripts/site_cli.py minify
+    python scripts/site_cli.py minify --strict     # exit 1 when over budget
+"""
+
+import os
+import re
+import gzip
+import json
+import fnmatch
+
+from site_tree import SiteTree, write_if_changed
+
+OUT_DIR = "_site"
+REPORT_JSON = ".site-build/size-report.json"
+REPORT_MD = ".site-build/size-report.md"
+
+# Repo content that is not part of the served site
+EXCLUDE_DIRS = {'.git', 'node_modules', '.github', '__pycache__', '.site-build', OUT_DIR,
+                'scripts', 'content'}
+SERVED_EXTENSIONS = {'.html', '.css', '.js', '.xml', '.txt', '.json', '.webmanifest',
+                     '.png', '.jpg', '.jpeg', '.webp', '.avif', '.gif', '.svg', '.ico',
+                     '.woff', '.woff2'}
+SERVED_FILES = {'CNAME'}
+
+# Minified-byte budgets; the first matching pattern applies
+BUDGETS = [
+    ("index.html", 72 * 1024),
+    ("blog/index.html", 48 * 1024),
+    ("blog/*.html", 32 * 1024),
+    ("*.html", 32 * 1024),
+    ("*.css", 16 * 1024),
+]
+
+_WS = r'[ \t\r\n\f]'  # HTML whitespace; \s would also eat &nbsp; characters
+_WS_RE = re.compile(_WS + '+')
+_RAW_RE = re.compile(r'(<(pre|textarea|script|style)\b(?:"[^"]*"|\'[^\']*\'|[^\'">])*>)(.*?)(</\2' + _WS + r'*>)',
+                     re.DOTALL | re.IGNORECASE)
+_COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+_TAG_RE = re.compile(r'<[a-zA-Z/!](?:"[^"]*"|\'[^\']*\'|[^\'">])*>')
+_TAG_PART_RE = re.compile(r'("[^"]*"|\'[^\']*\')|' + _WS + '+')
+_BETWEEN_TAGS_RE = re.compile('>' + _WS + '+<')
+_TYPE_RE = re.compile(r'\btype="([^"]*)"', re.IGNORECASE)
+_SRC_RE = re.compile(r'\bsrc=', re.IGNORECASE)
+_CSS_TOKEN_RE = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.DOTALL)
+_CSS_PUNCT_RE = re.compile(r' ?([{};,>]) ?')
+
+
+def _collapse(match):
+    return "\n" if "\n" in match.group(0) else " "
+
+
+def minify_css(css):
+    """Drop comments and insignificant whitespace; strings are untouched."""
+    def code(text):
+        text = _CSS_PUNCT_RE.sub(r'\1', _WS_RE.sub(" ", text))
+        return text.replace(": ", ":").replace(";}", "}")
+
+    parts, pending, pos = [], [], 0
+    for m in _CSS_TOKEN_RE.finditer(css):
+        pending.append(css[pos:m.start()])
+        pos = m.end()
+        if m.group(1):
+            parts += [code("".join(pending)), m.group(1)]
+            pending = []
+        else:
+            pending.append(" ")  # a comment separates tokens like whitespace
+    pending.append(css[pos:])
+    parts.append(code("".join(pending)))
+    return "".join(parts).strip()
+
+
+def minify_js(js):
+    """Line-preserving inline script minification (no parser, so no ASI risk)."""
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _minify_raw(open_tag, name, body):
+    name = name.lower()
+    if name == "style":
+        return minify_css(body)
+    if name != "script" or _SRC_RE.search(open_tag) or "`" in body:
+        return body
+    script_type = _TYPE_RE.search(open_tag)
+    script_type = script_type.group(1).lower() if script_type else ""
+    if script_type.endswith("json"):
+        try:
+            data = json.dumps(json.loads(body), ensure_ascii=False, separators=(",", ":"))
+            return data.replace("</", "<\\/")
+        except ValueError:
+            return body
+    if script_type in ("", "text/javascript", "module"):
+        return minify_js(body)
+    return body
+
+
+def _minify_markup(html, in_head):
+    html = _COMMENT_RE.sub("", html)
+    html = _TAG_RE.sub(lambda m: _TAG_PART_RE.sub(lambda p: p.group(1) or " ", m.group(0))
+                       .replace(" >", ">").replace(" />", "/>"), html)
+    html = _WS_RE.sub(_collapse, html)
+    # Nothing in <head> renders, so whitespace between its tags can go entirely
+    return _BETWEEN_TAGS_RE.sub("><", html).strip() if in_head else html
+
+
+def minify_html(html):
+    """Minify a page. <pre>/<textarea> content is preserved byte for byte."""
+    head_end = html.lower().find("</head>")
+    out, pos = [], 0
+
+    def markup(start, end):
+        if start < head_end:
+            split = min(end, head_end)
+            return _minify_markup(html[start:split], True) + _minify_markup(html[split:end], False)
+        return _minify_markup(html[start:end], False)
+
+    for m in _RAW_RE.finditer(html):
+        out.append(markup(pos, m.start()))
+        open_tag, name, body, close = m.groups()
+        out.append(_TAG_PART_RE.sub(lambda p: p.group(1) or " ", open_tag).replace(" >", ">"))
+        out.append(_minify_raw(open_tag, name, body))
+        out.append(close)
+        pos = m.end()
+    out.append(markup(pos, len(html)))
+    return "".join(out).strip() + "\n"
+
+
+def served_files(tree):
+    """Repo-relative paths of every file the site serves, sorted."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(tree.root):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDE_DIRS and not d.startswith('.'))
+        rel_dir = os.path.relpath(dirpath, tree.root)
+        for f in filenames:
+            if f in SERVED_FILES or os.path.splitext(f)[1].lower() in SERVED_EXTENSIONS:
+                rel = f if rel_dir == '.' else f"{rel_dir}/{f}"
+                found.append(rel.replace(os.sep, '/'))
+    return sorted(found)
+
+
+def budget_for(relpath):
+    for pattern, limit in BUDGETS:
+        if fnmatch.fnmatchcase(relpath, pattern):
+            return limit
+    return None
+
+
+def _minified(tree, rel):
+    if rel.endswith(".html"):
+        return minify_html(tree.read(rel))
+    return minify_css(tree.read(rel)) + "\n"
+
+
+def _load_report(tree):
+    try:
+        with open(tree.abspath(REPORT_JSON), 'r', encoding='utf-8') as f:
+            return {row["path"]: row for row in json.load(f)["pages"]}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def _remove_stale(tree, keep):
+    out_root = tree.abspath(OUT_DIR)
+    removed = 0
+    for dirpath, _, filenames in os.walk(out_root, topdown=False):
+        for f in filenames:
+            rel = os.path.relpath(os.path.join(dirpath, f), out_root).replace(os.sep, '/')
+            if rel not in keep:
+                os.unlink(os.path.join(dirpath, f))
+                removed += 1
+        if dirpath != out_root and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+    return removed
+
+
+def build_dist(tree=None):
+    """Write the minified site to _site/ and the size report. Returns the report."""
+    tree = tree or SiteTree()
+    previous = _load_report(tree)
+    files = served_files(tree)
+    rows, written = [], 0
+    for rel in files:
+        if rel.endswith((".html", ".css")):
+            data = _minified(tree, rel).encode('utf-8')
+            original = tree.size(rel)
+            limit = budget_for(rel)
+            rows.append({
+                "path": rel,
+                "original": original,
+                "minified": len(data),
+                "gzip": len(gzip.compress(data, 9)),
+                "budget": limit,
+                "previous": previous.get(rel, {}).get("minified"),
+                "over_budget": limit is not None and len(data) > limit,
+            })
+        else:
+            with open(tree.abspath(rel), 'rb') as f:
+                data = f.read()
+        written += write_if_changed(tree.abspath(f"{OUT_DIR}/{rel}"), data)
+    removed = _remove_stale(tree, set(files))
+
+    report = {
+        "totals": {key: sum(row[key] for row in rows) for key in ("original", "minified", "gzip")},
+        "over_budget": [row["path"] for row in rows if row["over_budget"]],
+        "pages": rows,
+    }
+    os.makedirs(os.path.dirname(tree.abspath(REPORT_JSON)), exist_ok=True)
+    write_if_changed(tree.abspath(REPORT_JSON), json.dumps(report, indent=1) + "\n")
+    write_if_changed(tree.abspath(REPORT_MD), render_markdown(report))
+
+    totals = report["totals"]
+    print(f"📦 {OUT_DIR}/: {len(files)} files ({written} written, {removed} removed)")
+    print(f"📉 HTML/CSS: {totals['original'] / 1024:,.0f} KB -> {totals['minified'] / 1024:,.0f} KB "
+          f"minified, {totals['gzip'] / 1024:,.0f} KB gzipped")
+    for row in rows:
+        if row["over_budget"]:
+            print(f"  ❌ {row['path']}: {row['minified']:,} bytes (budget {row['budget']:,})")
+    print(f"📝 Report: {REPORT_MD}")
+    return report
+
+
+def _kb(n):
+    return f"{n / 1024:,.1f}"
+
+
+def render_markdown(report):
+    totals = report["totals"]
+    lines = ["# SteadiDay page weight", "",
+             f"HTML/CSS: {_kb(totals['original'])} KB source, {_kb(totals['minified'])} KB minified, "
+             f"{_kb(totals['gzip'])} KB gzipped.", ""]
+    if report["over_budget"]:
+        lines += [f"**Over budget ({len(report['over_budget'])}):** "
+                  + ", ".join(f"`{p}`" for p in report["over_budget"]), ""]
+    lines += ["| File | Source KB | Minified KB | Gzip KB | Saved | Change | Budget KB |",
+              "|---|---:|---:|---:|---:|---:|---:|"]
+    for row in sorted(report["pages"], key=lambda r: -r["minified"]):
+        saved = 1 - row["minified"] / row["original"] if row["original"] else 0
+        change = "new" if row["previous"] is None else f"{row['minified'] - row['previous']:+,} B"
+        budget = _kb(row["budget"]) if row["budget"] else "-"
+        flag = " ❌" if row["over_budget"] else ""
+        lines.append(f"| `{row['path']}`{flag} | {_kb(row['original'])} | {_kb(row['minified'])} | "
+                     f"{_kb(row['gzip'])} | {saved:.0%} | {change} | {budget} |")
+    return "\n".join(lines) + "\n"
+
+
+def main(tree=None, strict=False):
+    report = build_dist(tree)
+    if strict and report["over_budget"]:
+        raise SystemExit(1)
+    return report
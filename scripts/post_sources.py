@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Post Sources
+
+Structured source records for blog posts, so post HTML can be rebuilt from
+data instead of being patched with regexes.
+
+Each post has one JSON record in content/posts/<post name>.json:
+
+    {
+      "filename": "2026-05-14-smart-home-devices-that-help.html",
+      "front_matter": {"title", "meta_description", "keywords", "read_time",
+                       "category", "date", "slug", "hero_image"},
+      "body": "<p>...</p> [IMAGE_1] ... [VIDEO] ...",
+      "media": {"images": [{"url", "alt", "layout"}],
+                "video": {"id", "title", "channel"} | null}
+    }
+
+generate_blog.py writes a record for every new post. For posts published
+before records existed, `bootstrap` extracts one from the live HTML and
+keeps it only if rendering it reproduces that HTML byte for byte. Posts
+that were hand-edited away from the template stay HTML-only.
+
+`rerender` renders every record through generate_blog.create_blog_html()
+plus the gtag injection the build applies, in a process pool, adds the
+post's "Related reading" block from content/related.json
+(related_posts.py), and writes only the posts whose bytes changed. It is
+also the "posts" step of `site_cli.py build`, which runs it when a record,
+content/related.json, the card catalog, POST_CSS or the template code
+changed.
+
+Usage (from the repo root):
+    python scripts/site_cli.py rerender --bootstrap   # create missing records
+    python scripts/site_cli.py rerender               # rebuild posts from records
+"""
+
+import os
+import re
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from site_tree import SiteTree
+
+SOURCES_DIR = "content/posts"
+
+FRONT_MATTER_KEYS = ["title", "meta_description", "keywords", "read_time",
+                     "category", "date", "slug", "hero_image"]
+
+_H1_RE = re.compile(r'<header class="article-header"><h1>(.*?)</h1>')
+_READ_TIME_RE = re.compile(r'&bull; (\d+) min read</div>')
+_BODY_START = '<article class="article-container"><div class="article-content">\n        '
+_BODY_END = '\n        <div class="cta-box">'
+_FIGURE_RE = re.compile(
+    r'<figure class="article-image(?: (float-left|float-right))?"><img src="([^"]+)" '
+    r'(?:srcset="[^"]*" sizes="[^"]*" width="\d+" height="\d+" )?'
+    r'alt="([^"]*)" loading="lazy"(?: decoding="async")?><figcaption>([^<]*)</figcaption></figure>')
+_VIDEO_RE = re.compile(
+    r'<div class="video-container video-facade" data-video-id="([\w-]+)" data-title="([^"]*)">'
+    r'(?:(?!</div>).)*</div><p class="video-caption">Video: \2 -- ([^<]*)</p>')
+
+
+def source_path(filename):
+    """Repo-relative path of the source record for a post file name."""
+    return f"{SOURCES_DIR}/{os.path.splitext(filename)[0]}.json"
+
+
+def make_record(post_data, filename):
+    """Source record for a post dict as produced by generate_blog_post()."""
+    return {
+        "filename": filename,
+        "front_matter": {k: post_data.get(k, "") for k in FRONT_MATTER_KEYS},
+        "body": post_data["body"],
+        "media": post_data["media"],
+    }
+
+
+def record_to_post(record):
+    """Inverse of make_record(): the post dict create_blog_html() expects."""
+    post = dict(record["front_matter"])
+    post.update(filename=record["filename"], body=record["body"], media=record["media"])
+    return post
+
+
+def dump_record(record):
+    return json.dumps(record, indent=2, ensure_ascii=False) + "\n"
+
+
+def save_source(post_data, filename, tree=None):
+    """Write the source record for a freshly generated post. Returns its path."""
+    tree = tree or SiteTree()
+    path = source_path(filename)
+    tree.write(path, dump_record(make_record(post_data, filename)))
+    return path
+
+
+def render_record(record):
+    """Final post HTML for a record: template + media, then gtag injection."""
+    import generate_blog
+    import inject_gtag
+    html, filename = generate_blog.create_blog_html(record_to_post(record))
+    html, _ = inject_gtag.inject_into_content(html)
+    return html, filename
+
+
+def with_related(tree, filename, html, graph=None, cards=None):
+    """`html` with the post's related reading block from the related-posts graph."""
+    import blog_index
+    import related_posts
+    graph = related_posts.load_graph(tree) if graph is None else graph
+    cards = blog_index.load_cards(tree) if cards is None else cards
+    return related_posts.set_block(html, related_posts.render_block(graph.get(filename, []), cards))
+
+
+def _render_file(path):
+    """Process-pool worker: parse one record and render it."""
+    with open(path, 'r', encoding='utf-8') as f:
+        record = json.load(f)
+    return render_record(record)
+
+
+def list_sources(tree):
+    directory = tree.abspath(SOURCES_DIR)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(f"{SOURCES_DIR}/{name}" for name in os.listdir(directory) if name.endswith('.json'))
+
+
+def rerender(tree=None, jobs=None):
+    """Rebuild every post that has a source record. Returns (rendered, written)."""
+    tree = tree or SiteTree()
+    paths = [tree.abspath(rel) for rel in list_sources(tree)]
+    if not paths:
+        print(f"⚠️  No post sources in {SOURCES_DIR}/ (run `rerender --bootstrap` first)")
+        return 0, 0
+    import blog_index
+    import post_styles
+    import related_posts
+    post_styles.write_stylesheet(tree)
+    graph, cards = related_posts.load_graph(tree), blog_index.load_cards(tree)
+    written = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        chunksize = max(1, len(paths) // ((jobs or os.cpu_count() or 1) * 4))
+        for html, filename in pool.map(_render_file, paths, chunksize=chunksize):
+            html = with_related(tree, filename, html, graph, cards)
+            if tree.write(f"blog/{filename}", html):
+                written += 1
+                print(f"  ✏️  blog/{filename}")
+    return len(paths), written
+
+
+def index_categories(tree):
+    """{post file name: category} from the blog index card catalog."""
+    import blog_index
+    return {name: card["category"] for name, card in blog_index.load_cards(tree).items()}
+
+
+def extract_record(tree, relpath, category=""):
+    """Best-effort source record for an existing post, or None if it does
+    not follow the generator's template closely enough to parse."""
+    import related_posts
+    html = related_posts.strip_block(tree.read(relpath))
+    meta = tree.meta(relpath)
+    h1 = _H1_RE.search(html)
+    read_time = _READ_TIME_RE.search(html)
+    start = html.find(_BODY_START)
+    end = html.rfind(_BODY_END)
+    date = meta["date"] or meta["published_time"][:10]
+    if not (h1 and read_time and date and 0 <= start < end):
+        return None
+
+    images = []
+
+    def figure_to_placeholder(m):
+        layout, url, alt, caption = m.groups()
+        if caption != alt:
+            return m.group(0)
+        images.append({"url": url, "alt": alt, "layout": layout or "full"})
+        return f"[IMAGE_{len(images)}]"
+
+    body = _FIGURE_RE.sub(figure_to_placeholder, html[start + len(_BODY_START):end])
+    video = None
+    videos = _VIDEO_RE.findall(body)
+    if len(videos) == 1 and "[VIDEO]" not in body:
+        video_id, title, channel = videos[0]
+        video = {"id": video_id, "title": title, "channel": channel}
+        body = _VIDEO_RE.sub("[VIDEO]", body)
+
+    filename = meta["filename"]
+    return {
+        "filename": filename,
+        "front_matter": {
+            "title": h1.group(1),
+            "meta_description": meta["description"],
+            "keywords": meta["keywords"],
+            "read_time": read_time.group(1),
+            "category": category,
+            "date": date,
+            "slug": meta["slug"],
+            "hero_image": meta["og_image"],
+        },
+        "body": body,
+        "media": {"images": images, "video": video},
+    }
+
+
+def bootstrap(tree=None):
+    """Create source records for posts that have none. Returns (created, skipped)."""
+    import blog_index
+    import related_posts
+    tree = tree or SiteTree()
+    categories = index_categories(tree)
+    graph, cards = related_posts.load_graph(tree), blog_index.load_cards(tree)
+    existing = set(list_sources(tree))
+    created, skipped = 0, []
+    for rel in tree.blog_posts():
+        filename = rel.rsplit('/', 1)[-1]
+        path = source_path(filename)
+        if path in existing:
+            continue
+        record = extract_record(tree, rel, categories.get(filename, ""))
+        # Only keep records that reproduce the live page exactly; anything
+        # else has been hand-edited and would be clobbered by a re-render.
+        if record is None or with_related(tree, filename, render_record(record)[0], graph, cards) != tree.read(rel):
+            skipped.append(rel)
+            continue
+        tree.write(path, dump_record(record))
+        created += 1
+        print(f"  📄 {path}")
+    for rel in skipped:
+        print(f"  ⏭️  {rel}: does not round-trip through the template, left as HTML")
+    return created, skipped
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Post Styles
+
+The blog post stylesheet, shared by every post instead of being inlined in
+each one. generate_blog.get_html_template() used to carry ~4 KB of CSS in a
+<style> block that every article view downloaded again and that pushed the
+<h1> past the first 8 KB of the page.
+
+Posts now get:
+  - the above-the-fold rules (nav, breadcrumbs, hero, article header)
+    inlined as critical CSS, so the first paint needs no extra request;
+  - the full stylesheet as blog/post.<hash>.css, loaded without blocking
+    render. The name changes whenever the CSS does, so browsers and CDNs
+    can cache it indefinitely and repeat visits never refetch it.
+
+Edit POST_CSS here, then run `site_cli.py rerender` (posts with sources)
+and `site_cli.py rewrite --rules post-css` (HTML-only posts) to roll the
+change out; both write the new stylesheet.
+"""
+
+import re
+import hashlib
+
+from site_tree import SiteTree
+
+POST_CSS = """\
+:root{--cream:#FFFBF5;--teal:#1A8A7D;--teal-dark:#147568;--teal-light:#E8F5F3;--navy:#1E3A5F;--navy-light:#2D4A6F;--charcoal:#2D3436;--charcoal-light:#5A6266;--white:#FFFFFF;}
+*{margin:0;padding:0;box-sizing:border-box;}
+body{font-family:'Source Sans 3',-apple-system,sans-serif;font-size:1.125rem;line-height:1.8;color:var(--charcoal);background:var(--cream);}
+h1,h2,h3{font-family:'Merriweather',Georgia,serif;color:var(--navy);line-height:1.3;}
+a{color:var(--teal);text-decoration:none;}a:hover{color:var(--teal-dark);text-decoration:underline;}
+.nav{background:var(--white);padding:1rem 0;border-bottom:1px solid rgba(30,58,95,0.1);position:sticky;top:0;z-index:100;}
+.nav-container{max-width:900px;margin:0 auto;padding:0 2rem;display:flex;justify-content:space-between;align-items:center;}.nav a{font-weight:600;}
+.breadcrumbs{max-width:900px;margin:0 auto;padding:1rem 2rem;font-size:0.9rem;}
+.breadcrumbs a{color:var(--charcoal-light);}.breadcrumbs span{color:var(--charcoal-light);margin:0 0.5rem;}.breadcrumbs .current{color:var(--navy);font-weight:500;}
+.hero-image{width:100%;height:auto;max-height:450px;object-fit:cover;}
+.article-header{background:linear-gradient(135deg,var(--navy) 0%,var(--navy-light) 100%);color:var(--white);padding:3rem 2rem;text-align:center;}
+.article-header h1{max-width:800px;margin:0 auto 1rem;font-size:2.25rem;color:var(--white);}.article-meta{font-size:1rem;opacity:0.9;}
+.article-container{max-width:750px;margin:0 auto;padding:3rem 2rem;background:var(--white);}
+.article-content h2{font-size:1.6rem;margin:2.5rem 0 1rem;}.article-content p{margin-bottom:1.5rem;}
+.article-content ul,.article-content ol{margin:1.5rem 0;padding-left:2rem;}.article-content li{margin-bottom:0.75rem;}
+.article-image{width:100%;margin:2rem 0;border-radius:12px;overflow:hidden;}
+.article-image img{width:100%;height:auto;display:block;}
+.article-image figcaption{font-size:0.9rem;color:var(--charcoal-light);text-align:center;padding:0.75rem 1rem;background:var(--cream);font-style:italic;}
+.article-image.float-left{float:left;width:45%;margin:0.5rem 1.5rem 1rem 0;}.article-image.float-right{float:right;width:45%;margin:0.5rem 0 1rem 1.5rem;}.article-image.full{width:100%;float:none;clear:both;}.article-content h2{clear:both;}
+.video-container{position:relative;width:100%;padding-bottom:56.25%;height:0;margin:2rem 0;border-radius:12px;overflow:hidden;box-shadow:0 4px 15px rgba(0,0,0,0.1);}
+.video-container iframe{position:absolute;top:0;left:0;width:100%;height:100%;border:0;}
+.video-play{position:absolute;top:0;left:0;width:100%;height:100%;display:block;background:#000;}.video-play img{width:100%;height:100%;object-fit:cover;}
+.video-play-icon{position:absolute;top:50%;left:50%;width:68px;height:48px;margin:-24px 0 0 -34px;background:#CC0000;border-radius:12px;}.video-play-icon::after{content:'';position:absolute;top:14px;left:27px;border-style:solid;border-width:10px 0 10px 17px;border-color:transparent transparent transparent #FFFFFF;}
+.video-play:hover .video-play-icon,.video-play:focus-visible .video-play-icon{background:#FF0000;}.video-play:focus-visible{outline:3px solid var(--teal);outline-offset:-3px;}
+.video-caption{font-size:0.9rem;color:var(--charcoal-light);text-align:center;padding:0.75rem;font-style:italic;}
+.cta-box{background:linear-gradient(135deg,var(--teal) 0%,var(--teal-dark) 100%);color:var(--white);padding:2rem;border-radius:12px;text-align:center;margin:2.5rem 0;}
+.cta-box h3{margin-bottom:0.75rem;font-size:1.35rem;color:var(--white);}.cta-box p{color:rgba(255,255,255,0.9)!important;margin-bottom:1rem;}
+.cta-button{display:inline-block;background:var(--white);color:var(--teal);padding:0.875rem 2rem;border-radius:8px;text-decoration:none;font-weight:600;}
+.cta-button:hover{opacity:0.9;text-decoration:none;transform:translateY(-2px);}
+.back-to-blog{max-width:750px;margin:0 auto;padding:1.5rem 2rem;text-align:center;background:var(--white);}
+.footer{text-align:center;padding:2rem;color:var(--charcoal-light);font-size:0.9rem;background:var(--white);border-top:1px solid rgba(30,58,95,0.1);}
+@media(max-width:768px){.article-header h1{font-size:1.75rem;}.article-header{padding:2rem 1.5rem;}.article-container{padding:2rem 1.5rem;}.hero-image{max-height:280px;}.article-image.float-left,.article-image.float-right{float:none;width:100%;margin:2rem 0;}}
+"""
+
+# Selectors needed to render the first screen of a post
+CRITICAL_SELECTORS = (":root", "*", "body", "h1", "h2", "h3", "a", ".nav", ".breadcrumbs",
+                      ".hero-image", ".article-header", ".article-meta")
+
+CRITICAL_STYLE_ID = "post-critical-css"
+
+
+def _rules(css):
+    """Top-level rules of `css` as (prelude, body) pairs; handles one level of @media."""
+    rules, depth, start, prelude = [], 0, 0, ""
+    for i, ch in enumerate(css):
+        if ch == "{":
+            if depth == 0:
+                prelude, start = css[start:i].strip(), i + 1
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append((prelude, css[start:i].strip()))
+                start = i + 1
+    return rules
+
+
+def _is_critical(selector_list):
+    """True if every selector in the list starts with one of CRITICAL_SELECTORS."""
+    for sel in selector_list.split(","):
+        head = sel.split()[0]
+        if head != ":root":
+            head = head.split(":")[0]
+        if head not in CRITICAL_SELECTORS:
+            return False
+    return True
+
+
+def critical_css(css=POST_CSS):
+    """The subset of `css` that styles the first screen, minified onto one line."""
+    out = []
+    for prelude, body in _rules(css):
+        if prelude.startswith("@media"):
+            inner = "".join(f"{p}{{{b}}}" for p, b in _rules(body) if _is_critical(p))
+            if inner:
+                out.append(f"{prelude}{{{inner}}}")
+        elif _is_critical(prelude):
+            out.append(f"{prelude}{{{body}}}")
+    return "".join(out)
+
+
+def stylesheet_name(css=POST_CSS):
+    return f"post.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]}.css"
+
+
+def style_tags():
+    """The <head> markup that replaces the old inline <style> block."""
+    href = stylesheet_name()
+    return (f'<style id="{CRITICAL_STYLE_ID}">{critical_css()}</style>\n'
+            f'    <link rel="stylesheet" href="{href}" media="print" onload="this.media=\'all\'">'
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+
+def write_stylesheet(tree=None, blog_dir="blog"):
+    """Make sure blog/post.<hash>.css exists. Returns its repo-relative path."""
+    tree = tree or SiteTree()
+    path = f"{blog_dir}/{stylesheet_name()}"
+    tree.write(path, POST_CSS)
+    return path
+
+
+# --- Migration of existing posts (the "post-css" rewrite rule set) ---
+
+def _normalize(css):
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>()])\s*", r"\1", css).replace(";}", "}").strip()
+
+
+# Inline <style> blocks from earlier versions of the post template that are
+# equivalent to POST_CSS (same rules, older formatting), by normalized hash.
+LEGACY_INLINE_CSS = {
+    "a2d1a69b0115fe38",  # spaced-out template, March-April 2026 posts
+}
+
+
+def _is_post_css(css):
+    normalized = _normalize(css)
+    return (normalized == _normalize(POST_CSS)
+            or hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16] in LEGACY_INLINE_CSS)
+
+
+def migrate_inline_style(match):
+    """Rewrite-rule replacement: inline post CSS -> shared stylesheet tags."""
+    return style_tags() if _is_post_css(match.group(1)) else match.group(0)
+
+
+def migrate_hashed_style(match):
+    """Rewrite-rule replacement: point an older post.<hash>.css block at the current one."""
+    return style_tags()
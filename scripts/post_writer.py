@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Post Writer
+
+The half of the blog generator that talks to the model: topic ideas from
+the news, the semantic duplicate check, image, video and study searches,
+and the article prompt itself, with the writing styles and the fallback
+image and video pools the prompts draw from.
+
+It used to live in generate_blog.py, which every site script imports for
+get_existing_posts() or create_blog_html(); importing it meant importing
+the anthropic SDK (most of a second and a half of startup) and evaluating
+every prompt constant, even to re-render a post or rebuild the RSS feed.
+generate_blog.py now imports this module only when it publishes, and the
+SDK itself is only imported by new_client() and call_with_retry(), so this
+module is cheap to import too. generate_blog still re-exports the names
+that moved here, on first access.
+
+Usage (from the repo root):
+    python scripts/site_cli.py publish [topic] [--news]
+"""
+
+import random, re, json, time, urllib.request
+from datetime import datetime
+
+import related_posts
+import responsive_images
+from generate_blog import (BLOG_BASE_URL, DEFAULT_HERO, IMAGE_LAYOUT_PATTERNS, VALID_CATEGORIES,
+                           is_valid_unsplash_url, render_body)
+from topic_pool import is_duplicate
+
+CLAUDE_MODEL = "claude-sonnet-4-6"
+
+WRITING_STYLES = [
+    {"name": "narrative", "instruction": """WRITING STYLE: Open with a short, vivid scene or anecdote (you can invent a composite character like "When Maria, 62, noticed..."). Weave practical advice into the story. Use transitions like "Here's the thing..." or "What surprised researchers was..." to move between sections. Close by returning to the opening character or scene. Do NOT use bullet points for the main advice — embed it in flowing paragraphs. This should read like a magazine feature, not a how-to list."""},
+    {"name": "myth_busting", "instruction": """WRITING STYLE: Structure this as a myth-busting piece. Open with "You've probably heard that..." and then challenge 4-5 common misconceptions about the topic. Each section should be framed as a common belief followed by the evidence-based reality. Use a conversational, slightly surprising tone. Close with a clear "bottom line" takeaway."""},
+    {"name": "qa_format", "instruction": """WRITING STYLE: Frame this as answering real questions people ask their doctors. Open with "These are the questions we hear most often about [topic]." Each section heading should be a specific question in natural language (e.g., "Is it normal to wake up at 3 AM every night?"). Answer each question directly in the first sentence, then expand with evidence and practical steps."""},
+    {"name": "day_in_life", "instruction": """WRITING STYLE: Walk through a typical day showing where the topic fits into real life. Open with a morning scenario and move through the day chronologically. Each section is a time of day with practical, specific advice woven in. This should feel like a friend sharing their routine, not a lecture."""},
+    {"name": "news_hook", "instruction": """WRITING STYLE: Open with a recent finding, guideline change, or health news item related to the topic (reference a real source if possible). Use the news as a hook to explain what changed, why it matters for adults 50+, and what to do about it. Sections should progress: what happened, why it matters, what the evidence says, what you can do today. This should read like health journalism, not a pamphlet."""},
+    {"name": "lessons_learned", "instruction": """WRITING STYLE: Frame this as practical lessons — "5 things I wish I'd known about [topic] sooner." Use first-person plural ("we") to create warmth. Each section is a genuine insight, not obvious advice. Include at least one counterintuitive point. Use phrases like "What most people get wrong is..." This should feel like wisdom from someone who's been through it."""},
+]
+
+
+def new_client():
+    """An Anthropic client (ANTHROPIC_API_KEY from the environment)."""
+    import anthropic
+    return anthropic.Anthropic()
+
+
+def call_with_retry(func, max_retries=7, base_delay=30):
+    from anthropic import APIStatusError
+    for attempt in range(max_retries + 1):
+        try:
+            return func()
+        except APIStatusError as e:
+            if e.status_code in (429, 529) or e.status_code >= 500:
+                if attempt == max_retries:
+                    raise
+                delay = base_delay * (2 ** attempt)
+                print(f"  API error {e.status_code} (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay}s...")
+                time.sleep(delay)
+            else:
+                raise
+
+
+def check_semantic_duplicate(client, new_title, existing_posts):
+    if not existing_posts:
+        return False, ""
+    existing_info = [p['title'] + (f" — {p['meta_desc']}" if p.get('meta_desc') else "") for p in existing_posts if p['title']]
+    if not existing_info:
+        return False, ""
+    posts_list = "\n".join([f"- {info}" for info in existing_info[:25]])
+    prompt = f"""You are a blog content deduplication checker. Be STRICT about catching thematic overlap.
+
+PROPOSED NEW POST TITLE: "{new_title}"
+
+EXISTING POSTS (title + summary):
+{posts_list}
+
+Would the proposed post cover substantially the same ground as any existing post?
+Reply with ONLY: UNIQUE or DUPLICATE OF: [existing title]"""
+
+    msg = call_with_retry(lambda: client.messages.create(model=CLAUDE_MODEL, max_tokens=200, messages=[{"role": "user", "content": prompt}]))
+    result = msg.content[0].text.strip()
+    return (True, result) if result.startswith("DUPLICATE") else (False, "")
+
+
+def get_content_summaries(existing_posts, limit=15):
+    summaries = [f"- [{p.get('category', 'Wellness')}] \"{p['title']}\"" + (f" — {p['meta_desc']}" if p.get('meta_desc') else "") for p in existing_posts[:limit] if p['title']]
+    return "\n".join(summaries) if summaries else "None yet."
+
+
+def generate_news_driven_topic(client, existing_posts, excluded_categories=None):
+    content_summaries = get_content_summaries(existing_posts)
+    month, year = datetime.now().strftime('%B'), datetime.now().strftime('%Y')
+    category_note = f"\nDO NOT use these categories (used recently): {', '.join(excluded_categories)}" if excluded_categories else ""
+
+    prompt = f"""Search for health news, medical studies, or updated clinical guidelines published
+in the last 2 weeks (it is currently {month} {year}) that are relevant to adults over 50.
+
+Good sources: NIH, CDC, Mayo Clinic, AARP, JAMA, The Lancet, NEJM, BMJ, Harvard Health,
+Johns Hopkins, WHO, FDA, AHA, Alzheimer's Association.
+
+Find a SPECIFIC, RECENT story — not evergreen advice. Good hooks include: new study findings,
+updated treatment guidelines, seasonal health alerts, new FDA actions, public health trends.
+
+EXISTING POSTS (do NOT duplicate):
+{content_summaries}
+{category_note}
+
+Frame the topic through "what this means for your daily life." Present only evidence-based,
+factual information — no political opinions or editorial commentary.
+
+TITLE RULES (CRITICAL):
+- The title MUST be a COMPLETE, GRAMMATICAL phrase or sentence.
+- Target length: 50-60 characters. Hard maximum: 65 characters.
+- NEVER use ellipses ("...") or any trailing punctuation that suggests truncation.
+- If the full idea will not fit, SHORTEN the wording — do NOT cut off mid-thought.
+- A short complete title ("Why Morning Naps May Be a Warning Sign") is better than
+  a long fragment ("Daytime Napping and Mortality Risk: What Older...").
+
+FORMAT:
+TOPIC: [specific description referencing the actual study/guideline]
+TITLE: [complete title, 50-65 chars, NO ellipses, NO truncation, compelling not clinical]
+KEYWORD: [primary SEO keyword phrase]
+CATEGORY: [exactly one of: {"|".join(VALID_CATEGORIES)}]
+        Pick the MOST SPECIFIC category that fits. Use 'Wellness' ONLY when no other
+        category fits. Examples: testosterone for men over 50 -> 'Men's Health' (NOT
+        'Wellness'); vitamin D and brain protection -> 'Brain Health' (NOT 'Wellness');
+        new Alzheimer's treatment -> 'Brain Health' (NOT 'Wellness'); dental screening
+        -> 'Preventive Care' (NOT 'Wellness').
+ANGLE: [what makes this timely — cite the specific source and date]
+SOURCE: [the news source, journal, or organization]"""
+
+    msg = call_with_retry(lambda: client.messages.create(model=CLAUDE_MODEL, max_tokens=1000, tools=[{"type": "web_search_20250305", "name": "web_search"}], messages=[{"role": "user", "content": prompt}]))
+    response_text = "".join(block.text for block in msg.content if hasattr(block, 'text'))
+    topic = re.search(r'TOPIC:\s*(.+?)(?:\n|$)', response_text)
+    title = re.search(r'TITLE:\s*(.+?)(?:\n|$)', response_text)
+    kw = re.search(r'KEYWORD:\s*(.+?)(?:\n|$)', response_text)
+    cat = re.search(r'CATEGORY:\s*(.+?)(?:\n|$)', response_text)
+    angle = re.search(r'ANGLE:\s*(.+?)(?:\n|$)', response_text)
+    source = re.search(r'SOURCE:\s*(.+?)(?:\n|$)', response_text)
+    c = cat.group(1).strip() if cat else "Wellness"
+    if c not in VALID_CATEGORIES: c = "Wellness"
+    result = {"topic": topic.group(1).strip() if topic else "Health tips for adults 50+", "keyword": kw.group(1).strip() if kw else "health tips seniors", "category": c, "suggested_title": title.group(1).strip() if title else "", "angle": angle.group(1).strip() if angle else "", "source": source.group(1).strip() if source else ""}
+    print(f"  News source: {result.get('source', 'N/A')}")
+    return result
+
+
+# =============================================================================
+# Image and video pools (fallback only — dynamic search is the primary source)
+# =============================================================================
+
+CATEGORY_IMAGES = {
+    "Mental Wellness": ["https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=800&q=80","https://images.unsplash.com/photo-1499209974431-9dddcece7f88?w=800&q=80","https://images.unsplash.com/photo-1474418397713-7ede21d49118?w=800&q=80"],
+    "Medication Tips": ["https://images.unsplash.com/photo-1584308666744-24d5c474f2ae?w=800&q=80","https://images.unsplash.com/photo-1587854692152-cbe660dbde88?w=800&q=80","https://images.unsplash.com/photo-1631549916768-4119b2e5f926?w=800&q=80"],
+    "Healthy Aging": ["https://images.unsplash.com/photo-1447452001602-7090c7ab2db3?w=800&q=80","https://images.unsplash.com/photo-1516307365426-bea591f05011?w=800&q=80","https://images.unsplash.com/photo-1511632765486-a01980e01a18?w=800&q=80"],
+    "Exercise": ["https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=800&q=80","https://images.unsplash.com/photo-1486218119243-13883505764c?w=800&q=80","https://images.unsplash.com/photo-1538805060514-97d9cc17730c?w=800&q=80"],
+    "Nutrition": ["https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=800&q=80","https://images.unsplash.com/photo-1490645935967-10de6ba17061?w=800&q=80","https://images.unsplash.com/photo-1498837167922-ddd27525d352?w=800&q=80"],
+    "Sleep": ["https://images.unsplash.com/photo-1541781774459-bb2af2f05b55?w=800&q=80","https://images.unsplash.com/photo-1515894203077-9cd36032142f?w=800&q=80","https://images.unsplash.com/photo-1531353826977-0941b4779a1c?w=800&q=80"],
+    "Heart Health": ["https://images.unsplash.com/photo-1505576399279-565b52d4ac71?w=800&q=80","https://images.unsplash.com/photo-1559757148-5c350d0d3c56?w=800&q=80","https://images.unsplash.com/photo-1628348070889-cb656235b4eb?w=800&q=80"],
+    "Brain Health": ["https://images.unsplash.com/photo-1559757175-5700dde675bc?w=800&q=80","https://images.unsplash.com/photo-1606761568499-6d2451b23c66?w=800&q=80","https://images.unsplash.com/photo-1503676260728-1c00da094a0b?w=800&q=80"],
+    "Safety": ["https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=800&q=80","https://images.unsplash.com/photo-1581093458791-9d42e3c7e117?w=800&q=80","https://images.unsplash.com/photo-1584515933487-779824d29309?w=800&q=80"],
+    "Wellness": ["https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=800&q=80","https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=800&q=80","https://images.unsplash.com/photo-1545205597-3d9d02c29597?w=800&q=80"],
+    "Technology": ["https://images.unsplash.com/photo-1516321318423-f06f85e504b3?w=800&q=80","https://images.unsplash.com/photo-1573883431205-98b5f10aaedb?w=800&q=80","https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=800&q=80"],
+    "Chronic Conditions": ["https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=800&q=80","https://images.unsplash.com/photo-1559234938-b60fff04894d?w=800&q=80","https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=800&q=80"],
+    "Relationships": ["https://images.unsplash.com/photo-1511632765486-a01980e01a18?w=800&q=80","https://images.unsplash.com/photo-1529156069898-49953e39b3ac?w=800&q=80","https://images.unsplash.com/photo-1517048676732-d65bc937f952?w=800&q=80"],
+    "Women's Health": ["https://images.unsplash.com/photo-1559234938-b60fff04894d?w=800&q=80","https://images.unsplash.com/photo-1494790108377-be9c29b29330?w=800&q=80","https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=800&q=80"],
+    "Men's Health": ["https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=800&q=80","https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?w=800&q=80","https://images.unsplash.com/photo-1538805060514-97d9cc17730c?w=800&q=80"],
+    "Preventive Care": ["https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=800&q=80","https://images.unsplash.com/photo-1576091160399-112ba8d25d1d?w=800&q=80","https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=800&q=80"],
+}
+
+# Hero and inline images use dynamic Unsplash search as primary source.
+# These hardcoded pools are the fallback — kept intentionally lean since
+# the dynamic search handles variety. 10 hero + 12 inline per category.
+HERO_IMAGES = {cat: urls[:10] if len(urls) > 10 else urls for cat, urls in {
+    "Mental Wellness": ["https://images.unsplash.com/photo-1518241353330-0f7941c2d9b5?w=1200&q=80","https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=1200&q=80","https://images.unsplash.com/photo-1499209974431-9dddcece7f88?w=1200&q=80","https://images.unsplash.com/photo-1474418397713-7ede21d49118?w=1200&q=80","https://images.unsplash.com/photo-1507525428034-b723cf961d3e?w=1200&q=80","https://images.unsplash.com/photo-1529693662653-9d480530a697?w=1200&q=80","https://images.unsplash.com/photo-1470252649378-9c29740c9fa8?w=1200&q=80","https://images.unsplash.com/photo-1501854140801-50d01698950b?w=1200&q=80","https://images.unsplash.com/photo-1475924156734-496f6cac6ec1?w=1200&q=80","https://images.unsplash.com/photo-1464822759023-fed622ff2c3b?w=1200&q=80","https://images.unsplash.com/photo-1502082553048-f009c37129b9?w=1200&q=80","https://images.unsplash.com/photo-1433086966358-54859d0ed716?w=1200&q=80"],
+    "Medication Tips": ["https://images.unsplash.com/photo-1584308666744-24d5c474f2ae?w=1200&q=80","https://images.unsplash.com/photo-1587854692152-cbe660dbde88?w=1200&q=80","https://images.unsplash.com/photo-1631549916768-4119b2e5f926?w=1200&q=80","https://images.unsplash.com/photo-1585435557343-3b092031a831?w=1200&q=80","https://images.unsplash.com/photo-1471864190281-a93a3070b6de?w=1200&q=80","https://images.unsplash.com/photo-1576602976047-174e57a47881?w=1200&q=80","https://images.unsplash.com/photo-1550831107-1553da8c8464?w=1200&q=80","https://images.unsplash.com/photo-1607619056574-7b8d3ee536b2?w=1200&q=80","https://images.unsplash.com/photo-1583912267550-d974311a9a6e?w=1200&q=80","https://images.unsplash.com/photo-1576091160399-112ba8d25d1d?w=1200&q=80"],
+    "Healthy Aging": ["https://images.unsplash.com/photo-1447452001602-7090c7ab2db3?w=1200&q=80","https://images.unsplash.com/photo-1516307365426-bea591f05011?w=1200&q=80","https://images.unsplash.com/photo-1511632765486-a01980e01a18?w=1200&q=80","https://images.unsplash.com/photo-1517457373958-b7bdd4587205?w=1200&q=80","https://images.unsplash.com/photo-1454418747937-bd95bb945625?w=1200&q=80","https://images.unsplash.com/photo-1600880292203-757bb62b4baf?w=1200&q=80","https://images.unsplash.com/photo-1559234938-b60fff04894d?w=1200&q=80","https://images.unsplash.com/photo-1494790108377-be9c29b29330?w=1200&q=80","https://images.unsplash.com/photo-1581579438747-104c53d7fbc4?w=1200&q=80","https://images.unsplash.com/photo-1529156069898-49953e39b3ac?w=1200&q=80"],
+    "Exercise": ["https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=1200&q=80","https://images.unsplash.com/photo-1486218119243-13883505764c?w=1200&q=80","https://images.unsplash.com/photo-1538805060514-97d9cc17730c?w=1200&q=80","https://images.unsplash.com/photo-1552196563-55cd4e45efb3?w=1200&q=80","https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=1200&q=80","https://images.unsplash.com/photo-1518611012118-696072aa579a?w=1200&q=80","https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?w=1200&q=80","https://images.unsplash.com/photo-1571019614242-c5c5dee9f50b?w=1200&q=80","https://images.unsplash.com/photo-1607962837359-5e7e89f86776?w=1200&q=80","https://images.unsplash.com/photo-1517963879433-6ad2b056d712?w=1200&q=80"],
+    "Nutrition": ["https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=1200&q=80","https://images.unsplash.com/photo-1490645935967-10de6ba17061?w=1200&q=80","https://images.unsplash.com/photo-1498837167922-ddd27525d352?w=1200&q=80","https://images.unsplash.com/photo-1540189549336-e6e99c3679fe?w=1200&q=80","https://images.unsplash.com/photo-1504674900247-0877df9cc836?w=1200&q=80","https://images.unsplash.com/photo-1490818387583-1baba5e638af?w=1200&q=80","https://images.unsplash.com/photo-1467003909585-2f8a72700288?w=1200&q=80","https://images.unsplash.com/photo-1543362906-acfc16c67564?w=1200&q=80","https://images.unsplash.com/photo-1547592180-85f173990554?w=1200&q=80","https://images.unsplash.com/photo-1505253716362-afaea1d3d1af?w=1200&q=80"],
+    "Sleep": ["https://images.unsplash.com/photo-1541781774459-bb2af2f05b55?w=1200&q=80","https://images.unsplash.com/photo-1515894203077-9cd36032142f?w=1200&q=80","https://images.unsplash.com/photo-1531353826977-0941b4779a1c?w=1200&q=80","https://images.unsplash.com/photo-1455642305367-68834a1da7ab?w=1200&q=80","https://images.unsplash.com/photo-1520206183501-b80df61043c2?w=1200&q=80","https://images.unsplash.com/photo-1495197359483-d092478c170a?w=1200&q=80","https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=1200&q=80","https://images.unsplash.com/photo-1522771739844-6a9f6d5f14af?w=1200&q=80","https://images.unsplash.com/photo-1505693416388-ac5ce068fe85?w=1200&q=80","https://images.unsplash.com/photo-1540518614846-7eded433c457?w=1200&q=80"],
+    "Heart Health": ["https://images.unsplash.com/photo-1505576399279-565b52d4ac71?w=1200&q=80","https://images.unsplash.com/photo-1559757148-5c350d0d3c56?w=1200&q=80","https://images.unsplash.com/photo-1628348070889-cb656235b4eb?w=1200&q=80","https://images.unsplash.com/photo-1498837167922-ddd27525d352?w=1200&q=80","https://images.unsplash.com/photo-1490645935967-10de6ba17061?w=1200&q=80","https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?w=1200&q=80","https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=1200&q=80","https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=1200&q=80","https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=1200&q=80","https://images.unsplash.com/photo-1547592180-85f173990554?w=1200&q=80"],
+    "Brain Health": ["https://images.unsplash.com/photo-1559757175-5700dde675bc?w=1200&q=80","https://images.unsplash.com/photo-1606761568499-6d2451b23c66?w=1200&q=80","https://images.unsplash.com/photo-1503676260728-1c00da094a0b?w=1200&q=80","https://images.unsplash.com/photo-1456406644174-8ddd4cd52a06?w=1200&q=80","https://images.unsplash.com/photo-1507413245164-6160d8298b31?w=1200&q=80","https://images.unsplash.com/photo-1434030216411-0b793f4b4173?w=1200&q=80","https://images.unsplash.com/photo-1513475382585-d06e58bcb0e0?w=1200&q=80","https://images.unsplash.com/photo-1488190211105-8b0e65b80b4e?w=1200&q=80","https://images.unsplash.com/photo-1522202176988-66273c2fd55f?w=1200&q=80","https://images.unsplash.com/photo-1456513080510-7bf3a84b82f8?w=1200&q=80"],
+    "Safety": ["https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=1200&q=80","https://images.unsplash.com/photo-1581093458791-9d42e3c7e117?w=1200&q=80","https://images.unsplash.com/photo-1584515933487-779824d29309?w=1200&q=80","https://images.unsplash.com/photo-1576091160399-112ba8d25d1d?w=1200&q=80","https://images.unsplash.com/photo-1550831107-1553da8c8464?w=1200&q=80","https://images.unsplash.com/photo-1584432810601-6c7f27d2362b?w=1200&q=80","https://images.unsplash.com/photo-1612531386530-97286d97c2d2?w=1200&q=80","https://images.unsplash.com/photo-1530497610245-94d3c16cda28?w=1200&q=80","https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=1200&q=80","https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=1200&q=80"],
+    "Wellness": ["https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=1200&q=80","https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=1200&q=80","https://images.unsplash.com/photo-1545205597-3d9d02c29597?w=1200&q=80","https://images.unsplash.com/photo-1501854140801-50d01698950b?w=1200&q=80","https://images.unsplash.com/photo-1470252649378-9c29740c9fa8?w=1200&q=80","https://images.unsplash.com/photo-1475924156734-496f6cac6ec1?w=1200&q=80","https://images.unsplash.com/photo-1507525428034-b723cf961d3e?w=1200&q=80","https://images.unsplash.com/photo-1529693662653-9d480530a697?w=1200&q=80","https://images.unsplash.com/photo-1464822759023-fed622ff2c3b?w=1200&q=80","https://images.unsplash.com/photo-1441974231531-c6227db76b6e?w=1200&q=80"],
+    "Technology": ["https://images.unsplash.com/photo-1516321318423-f06f85e504b3?w=1200&q=80","https://images.unsplash.com/photo-1573883431205-98b5f10aaedb?w=1200&q=80","https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=1200&q=80","https://images.unsplash.com/photo-1519389950473-47ba0277781c?w=1200&q=80","https://images.unsplash.com/photo-1488590528505-98d2b5aba04b?w=1200&q=80","https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=1200&q=80","https://images.unsplash.com/photo-1531297484001-80022131f5a1?w=1200&q=80","https://images.unsplash.com/photo-1550751827-4bd374c3f58b?w=1200&q=80","https://images.unsplash.com/photo-1483058712412-4245e9b90334?w=1200&q=80","https://images.unsplash.com/photo-1504868584819-f8e8b4b6d7e3?w=1200&q=80"],
+    "Chronic Conditions": ["https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=1200&q=80","https://images.unsplash.com/photo-1559234938-b60fff04894d?w=1200&q=80","https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=1200&q=80","https://images.unsplash.com/photo-1576091160399-112ba8d25d1d?w=1200&q=80","https://images.unsplash.com/photo-1550831107-1553da8c8464?w=1200&q=80","https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=1200&q=80","https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=1200&q=80","https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=1200&q=80","https://images.unsplash.com/photo-1583912267550-d974311a9a6e?w=1200&q=80","https://images.unsplash.com/photo-1607619056574-7b8d3ee536b2?w=1200&q=80"],
+    "Relationships": ["https://images.unsplash.com/photo-1511632765486-a01980e01a18?w=1200&q=80","https://images.unsplash.com/photo-1529156069898-49953e39b3ac?w=1200&q=80","https://images.unsplash.com/photo-1517048676732-d65bc937f952?w=1200&q=80","https://images.unsplash.com/photo-1516307365426-bea591f05011?w=1200&q=80","https://images.unsplash.com/photo-1447452001602-7090c7ab2db3?w=1200&q=80","https://images.unsplash.com/photo-1517457373958-b7bdd4587205?w=1200&q=80","https://images.unsplash.com/photo-1530268729831-4b0b9e170218?w=1200&q=80","https://images.unsplash.com/photo-1474418397713-7ede21d49118?w=1200&q=80","https://images.unsplash.com/photo-1454418747937-bd95bb945625?w=1200&q=80","https://images.unsplash.com/photo-1600880292203-757bb62b4baf?w=1200&q=80"],
+    "Women's Health": ["https://images.unsplash.com/photo-1559234938-b60fff04894d?w=1200&q=80","https://images.unsplash.com/photo-1494790108377-be9c29b29330?w=1200&q=80","https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=1200&q=80","https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=1200&q=80","https://images.unsplash.com/photo-1499209974431-9dddcece7f88?w=1200&q=80","https://images.unsplash.com/photo-1545205597-3d9d02c29597?w=1200&q=80","https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=1200&q=80","https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=1200&q=80","https://images.unsplash.com/photo-1474418397713-7ede21d49118?w=1200&q=80","https://images.unsplash.com/photo-1581579438747-104c53d7fbc4?w=1200&q=80"],
+    "Men's Health": ["https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=1200&q=80","https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?w=1200&q=80","https://images.unsplash.com/photo-1538805060514-97d9cc17730c?w=1200&q=80","https://images.unsplash.com/photo-1552196563-55cd4e45efb3?w=1200&q=80","https://images.unsplash.com/photo-1486218119243-13883505764c?w=1200&q=80","https://images.unsplash.com/photo-1517963879433-6ad2b056d712?w=1200&q=80","https://images.unsplash.com/photo-1507525428034-b723cf961d3e?w=1200&q=80","https://images.unsplash.com/photo-1505576399279-565b52d4ac71?w=1200&q=80","https://images.unsplash.com/photo-1464822759023-fed622ff2c3b?w=1200&q=80","https://images.unsplash.com/photo-1518611012118-696072aa579a?w=1200&q=80"],
+    "Preventive Care": ["https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=1200&q=80","https://images.unsplash.com/photo-1576091160399-112ba8d25d1d?w=1200&q=80","https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=1200&q=80","https://images.unsplash.com/photo-1550831107-1553da8c8464?w=1200&q=80","https://images.unsplash.com/photo-1583912267550-d974311a9a6e?w=1200&q=80","https://images.unsplash.com/photo-1573883431205-98b5f10aaedb?w=1200&q=80","https://images.unsplash.com/photo-1559234938-b60fff04894d?w=1200&q=80","https://images.unsplash.com/photo-1584515933487-779824d29309?w=1200&q=80","https://images.unsplash.com/photo-1530497610245-94d3c16cda28?w=1200&q=80","https://images.unsplash.com/photo-1607619056574-7b8d3ee536b2?w=1200&q=80"],
+}.items()}
+
+# Inline images: dynamic search is primary; these are fallback only
+# Using 8 per category as fallback — dynamic search provides the real variety
+INLINE_IMAGES = {cat: imgs for cat, imgs in {
+    "Mental Wellness": [{"url":"https://images.unsplash.com/photo-1499209974431-9dddcece7f88?w=800&q=80","alt":"Person relaxing"},{"url":"https://images.unsplash.com/photo-1508672019048-805c876b67e2?w=800&q=80","alt":"Peaceful scene"},{"url":"https://images.unsplash.com/photo-1515377905703-c4788e51af15?w=800&q=80","alt":"Sunlight through trees"},{"url":"https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=800&q=80","alt":"Journaling"},{"url":"https://images.unsplash.com/photo-1506252374453-ef5237291d83?w=800&q=80","alt":"Garden path"},{"url":"https://images.unsplash.com/photo-1500904156668-a21764a29575?w=800&q=80","alt":"Cozy reading"},{"url":"https://images.unsplash.com/photo-1446511437394-d789541e7f95?w=800&q=80","alt":"Walking in nature"},{"url":"https://images.unsplash.com/photo-1502082553048-f009c37129b9?w=800&q=80","alt":"Sunlit forest"}],
+    "Medication Tips": [{"url":"https://images.unsplash.com/photo-1587854692152-cbe660dbde88?w=800&q=80","alt":"Pill organizer"},{"url":"https://images.unsplash.com/photo-1576602976047-174e57a47881?w=800&q=80","alt":"Healthcare professional"},{"url":"https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=800&q=80","alt":"Doctor consultation"},{"url":"https://images.unsplash.com/photo-1550831107-1553da8c8464?w=800&q=80","alt":"Pharmacy"},{"url":"https://images.unsplash.com/photo-1585435557343-3b092031a831?w=800&q=80","alt":"Medication and water"},{"url":"https://images.unsplash.com/photo-1573883431205-98b5f10aaedb?w=800&q=80","alt":"Health app"},{"url":"https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=800&q=80","alt":"Patient care"},{"url":"https://images.unsplash.com/photo-1583912267550-d974311a9a6e?w=800&q=80","alt":"Health checklist"}],
+    "Healthy Aging": [{"url":"https://images.unsplash.com/photo-1516307365426-bea591f05011?w=800&q=80","alt":"Active senior"},{"url":"https://images.unsplash.com/photo-1517457373958-b7bdd4587205?w=800&q=80","alt":"Couple walking"},{"url":"https://images.unsplash.com/photo-1511632765486-a01980e01a18?w=800&q=80","alt":"Laughing together"},{"url":"https://images.unsplash.com/photo-1600880292203-757bb62b4baf?w=800&q=80","alt":"Conversation"},{"url":"https://images.unsplash.com/photo-1581579438747-104c53d7fbc4?w=800&q=80","alt":"Morning stretch"},{"url":"https://images.unsplash.com/photo-1529156069898-49953e39b3ac?w=800&q=80","alt":"Friends outdoors"},{"url":"https://images.unsplash.com/photo-1517048676732-d65bc937f952?w=800&q=80","alt":"Group discussion"},{"url":"https://images.unsplash.com/photo-1530268729831-4b0b9e170218?w=800&q=80","alt":"Community"}],
+    "Exercise": [{"url":"https://images.unsplash.com/photo-1571019614242-c5c5dee9f50b?w=800&q=80","alt":"Stretching"},{"url":"https://images.unsplash.com/photo-1552196563-55cd4e45efb3?w=800&q=80","alt":"Walking"},{"url":"https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=800&q=80","alt":"Yoga"},{"url":"https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?w=800&q=80","alt":"Jogging"},{"url":"https://images.unsplash.com/photo-1517963879433-6ad2b056d712?w=800&q=80","alt":"Swimming"},{"url":"https://images.unsplash.com/photo-1574680096145-d05b474e2155?w=800&q=80","alt":"Balance"},{"url":"https://images.unsplash.com/photo-1599058945522-28d584b6f0ff?w=800&q=80","alt":"Tai chi"},{"url":"https://images.unsplash.com/photo-1545389336-cf090694435e?w=800&q=80","alt":"Gentle stretching"}],
+    "Nutrition": [{"url":"https://images.unsplash.com/photo-1490645935967-10de6ba17061?w=800&q=80","alt":"Meal prep"},{"url":"https://images.unsplash.com/photo-1498837167922-ddd27525d352?w=800&q=80","alt":"Fresh produce"},{"url":"https://images.unsplash.com/photo-1504674900247-0877df9cc836?w=800&q=80","alt":"Home cooking"},{"url":"https://images.unsplash.com/photo-1467003909585-2f8a72700288?w=800&q=80","alt":"Salmon"},{"url":"https://images.unsplash.com/photo-1547592180-85f173990554?w=800&q=80","alt":"Spices"},{"url":"https://images.unsplash.com/photo-1546069901-ba9599a7e63c?w=800&q=80","alt":"Healthy toast"},{"url":"https://images.unsplash.com/photo-1484980972926-edee96e0960d?w=800&q=80","alt":"Berry bowl"},{"url":"https://images.unsplash.com/photo-1455619452474-d2be8b1e70cd?w=800&q=80","alt":"Warm soup"}],
+    "Sleep": [{"url":"https://images.unsplash.com/photo-1515894203077-9cd36032142f?w=800&q=80","alt":"Peaceful bedroom"},{"url":"https://images.unsplash.com/photo-1495197359483-d092478c170a?w=800&q=80","alt":"Comfortable bed"},{"url":"https://images.unsplash.com/photo-1520206183501-b80df61043c2?w=800&q=80","alt":"Moonlit scene"},{"url":"https://images.unsplash.com/photo-1507652313519-d4e9174996dd?w=800&q=80","alt":"Evening reading"},{"url":"https://images.unsplash.com/photo-1505693416388-ac5ce068fe85?w=800&q=80","alt":"Herbal tea"},{"url":"https://images.unsplash.com/photo-1540518614846-7eded433c457?w=800&q=80","alt":"Soft pillows"},{"url":"https://images.unsplash.com/photo-1445991842772-097fea258e7b?w=800&q=80","alt":"Sunset"},{"url":"https://images.unsplash.com/photo-1513694203232-719a280e022f?w=800&q=80","alt":"Relaxing bath"}],
+    "Heart Health": [{"url":"https://images.unsplash.com/photo-1559757148-5c350d0d3c56?w=800&q=80","alt":"Healthy lifestyle"},{"url":"https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=800&q=80","alt":"Cardio"},{"url":"https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=800&q=80","alt":"Heart-healthy meal"},{"url":"https://images.unsplash.com/photo-1490818387583-1baba5e638af?w=800&q=80","alt":"Green smoothie"},{"url":"https://images.unsplash.com/photo-1547592180-85f173990554?w=800&q=80","alt":"Herbs"},{"url":"https://images.unsplash.com/photo-1538805060514-97d9cc17730c?w=800&q=80","alt":"Active walk"},{"url":"https://images.unsplash.com/photo-1504674900247-0877df9cc836?w=800&q=80","alt":"Nutritious food"},{"url":"https://images.unsplash.com/photo-1467003909585-2f8a72700288?w=800&q=80","alt":"Omega-3 foods"}],
+    "Brain Health": [{"url":"https://images.unsplash.com/photo-1503676260728-1c00da094a0b?w=800&q=80","alt":"Learning"},{"url":"https://images.unsplash.com/photo-1456406644174-8ddd4cd52a06?w=800&q=80","alt":"Reading"},{"url":"https://images.unsplash.com/photo-1606761568499-6d2451b23c66?w=800&q=80","alt":"Puzzles"},{"url":"https://images.unsplash.com/photo-1434030216411-0b793f4b4173?w=800&q=80","alt":"Focus"},{"url":"https://images.unsplash.com/photo-1488190211105-8b0e65b80b4e?w=800&q=80","alt":"Notes"},{"url":"https://images.unsplash.com/photo-1522202176988-66273c2fd55f?w=800&q=80","alt":"Group learning"},{"url":"https://images.unsplash.com/photo-1453928582365-b6ad33cbcf64?w=800&q=80","alt":"Thinking"},{"url":"https://images.unsplash.com/photo-1456513080510-7bf3a84b82f8?w=800&q=80","alt":"Book and coffee"}],
+    "Safety": [{"url":"https://images.unsplash.com/photo-1581093458791-9d42e3c7e117?w=800&q=80","alt":"Home safety"},{"url":"https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=800&q=80","alt":"Well-lit home"},{"url":"https://images.unsplash.com/photo-1584515933487-779824d29309?w=800&q=80","alt":"Emergency kit"},{"url":"https://images.unsplash.com/photo-1576091160399-112ba8d25d1d?w=800&q=80","alt":"Checkup"},{"url":"https://images.unsplash.com/photo-1584432810601-6c7f27d2362b?w=800&q=80","alt":"Protection"},{"url":"https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=800&q=80","alt":"Doctor"},{"url":"https://images.unsplash.com/photo-1573883431205-98b5f10aaedb?w=800&q=80","alt":"Health app"},{"url":"https://images.unsplash.com/photo-1612531386530-97286d97c2d2?w=800&q=80","alt":"Safety equipment"}],
+    "Wellness": [{"url":"https://images.unsplash.com/photo-1545205597-3d9d02c29597?w=800&q=80","alt":"Mindfulness"},{"url":"https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=800&q=80","alt":"Yoga"},{"url":"https://images.unsplash.com/photo-1501854140801-50d01698950b?w=800&q=80","alt":"Nature"},{"url":"https://images.unsplash.com/photo-1475924156734-496f6cac6ec1?w=800&q=80","alt":"Morning mist"},{"url":"https://images.unsplash.com/photo-1441974231531-c6227db76b6e?w=800&q=80","alt":"Forest"},{"url":"https://images.unsplash.com/photo-1518459031867-a89b944bffe4?w=800&q=80","alt":"Outdoor wellness"},{"url":"https://images.unsplash.com/photo-1519823551278-64ac92734fb1?w=800&q=80","alt":"Journaling"},{"url":"https://images.unsplash.com/photo-1502082553048-f009c37129b9?w=800&q=80","alt":"Sunlit trees"}],
+    "Technology": [{"url":"https://images.unsplash.com/photo-1516321318423-f06f85e504b3?w=800&q=80","alt":"Laptop"},{"url":"https://images.unsplash.com/photo-1573883431205-98b5f10aaedb?w=800&q=80","alt":"Health app"},{"url":"https://images.unsplash.com/photo-1519389950473-47ba0277781c?w=800&q=80","alt":"Workspace"},{"url":"https://images.unsplash.com/photo-1488590528505-98d2b5aba04b?w=800&q=80","alt":"Screen"},{"url":"https://images.unsplash.com/photo-1550751827-4bd374c3f58b?w=800&q=80","alt":"Digital security"},{"url":"https://images.unsplash.com/photo-1517430816045-df4b7de11d1d?w=800&q=80","alt":"Smartphone"},{"url":"https://images.unsplash.com/photo-1498049794561-7780e7231661?w=800&q=80","alt":"Connected devices"},{"url":"https://images.unsplash.com/photo-1504868584819-f8e8b4b6d7e3?w=800&q=80","alt":"Monitor"}],
+    "Chronic Conditions": [{"url":"https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=800&q=80","alt":"Medical consultation"},{"url":"https://images.unsplash.com/photo-1559234938-b60fff04894d?w=800&q=80","alt":"Healthy choices"},{"url":"https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=800&q=80","alt":"Exercise"},{"url":"https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=800&q=80","alt":"Anti-inflammatory foods"},{"url":"https://images.unsplash.com/photo-1583912267550-d974311a9a6e?w=800&q=80","alt":"Tracking"},{"url":"https://images.unsplash.com/photo-1573883431205-98b5f10aaedb?w=800&q=80","alt":"Health monitoring"},{"url":"https://images.unsplash.com/photo-1607619056574-7b8d3ee536b2?w=800&q=80","alt":"Daily routine"},{"url":"https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=800&q=80","alt":"Gentle yoga"}],
+    "Relationships": [{"url":"https://images.unsplash.com/photo-1511632765486-a01980e01a18?w=800&q=80","alt":"Family"},{"url":"https://images.unsplash.com/photo-1529156069898-49953e39b3ac?w=800&q=80","alt":"Friends outdoors"},{"url":"https://images.unsplash.com/photo-1517048676732-d65bc937f952?w=800&q=80","alt":"Conversation"},{"url":"https://images.unsplash.com/photo-1517457373958-b7bdd4587205?w=800&q=80","alt":"Walking together"},{"url":"https://images.unsplash.com/photo-1530268729831-4b0b9e170218?w=800&q=80","alt":"Community"},{"url":"https://images.unsplash.com/photo-1600880292203-757bb62b4baf?w=800&q=80","alt":"Heartfelt talk"},{"url":"https://images.unsplash.com/photo-1516321318423-f06f85e504b3?w=800&q=80","alt":"Video call"},{"url":"https://images.unsplash.com/photo-1474418397713-7ede21d49118?w=800&q=80","alt":"Togetherness"}],
+    "Women's Health": [{"url":"https://images.unsplash.com/photo-1559234938-b60fff04894d?w=800&q=80","alt":"Healthy choices"},{"url":"https://images.unsplash.com/photo-1544367567-0f2fcb009e0b?w=800&q=80","alt":"Yoga practice"},{"url":"https://images.unsplash.com/photo-1494790108377-be9c29b29330?w=800&q=80","alt":"Confident woman"},{"url":"https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=800&q=80","alt":"Nutritious meal"},{"url":"https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=800&q=80","alt":"Active lifestyle"},{"url":"https://images.unsplash.com/photo-1506126613408-eca07ce68773?w=800&q=80","alt":"Morning wellness"},{"url":"https://images.unsplash.com/photo-1581579438747-104c53d7fbc4?w=800&q=80","alt":"Stretching"},{"url":"https://images.unsplash.com/photo-1499209974431-9dddcece7f88?w=800&q=80","alt":"Self-care moment"}],
+    "Men's Health": [{"url":"https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?w=800&q=80","alt":"Outdoor run"},{"url":"https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=800&q=80","alt":"Strength training"},{"url":"https://images.unsplash.com/photo-1538805060514-97d9cc17730c?w=800&q=80","alt":"Trail walk"},{"url":"https://images.unsplash.com/photo-1505576399279-565b52d4ac71?w=800&q=80","alt":"Heart-healthy food"},{"url":"https://images.unsplash.com/photo-1517963879433-6ad2b056d712?w=800&q=80","alt":"Swimming"},{"url":"https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=800&q=80","alt":"Doctor visit"},{"url":"https://images.unsplash.com/photo-1552196563-55cd4e45efb3?w=800&q=80","alt":"Morning walk"},{"url":"https://images.unsplash.com/photo-1507525428034-b723cf961d3e?w=800&q=80","alt":"Beach fitness"}],
+    "Preventive Care": [{"url":"https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=800&q=80","alt":"Medical visit"},{"url":"https://images.unsplash.com/photo-1576091160399-112ba8d25d1d?w=800&q=80","alt":"Health checkup"},{"url":"https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=800&q=80","alt":"Patient care"},{"url":"https://images.unsplash.com/photo-1583912267550-d974311a9a6e?w=800&q=80","alt":"Health tracking"},{"url":"https://images.unsplash.com/photo-1573883431205-98b5f10aaedb?w=800&q=80","alt":"Health app"},{"url":"https://images.unsplash.com/photo-1550831107-1553da8c8464?w=800&q=80","alt":"Pharmacy consultation"},{"url":"https://images.unsplash.com/photo-1559234938-b60fff04894d?w=800&q=80","alt":"Wellness choices"},{"url":"https://images.unsplash.com/photo-1584515933487-779824d29309?w=800&q=80","alt":"Preparedness"}],
+}.items()}
+
+CATEGORY_VIDEOS = {
+    "Mental Wellness": [{"id":"inpok4MKVLM","title":"5-Minute Meditation","channel":"Goodful"},{"id":"ZToicYcHIOU","title":"Breathing for Stress Relief","channel":"Therapy in a Nutshell"},{"id":"SEfs5TJZ6Nk","title":"How to Practice Mindfulness","channel":"Psych Hub"},{"id":"O-6f5wQXSu8","title":"Managing Anxiety","channel":"Therapy in a Nutshell"}],
+    "Medication Tips": [{"id":"xLUaVeKhbK8","title":"Managing Multiple Medications","channel":"AARP"},{"id":"Ry_bVsdcYvM","title":"Organize Your Medications","channel":"Walgreens"},{"id":"QB1kk0p_E0I","title":"Understanding Prescriptions","channel":"Cleveland Clinic"}],
+    "Healthy Aging": [{"id":"3PycZtfns_U","title":"Secrets to Healthy Aging","channel":"Mayo Clinic"},{"id":"TUqEu0mBMr8","title":"Staying Active as You Age","channel":"AARP"},{"id":"dVHMj6Fy_04","title":"Aging Well","channel":"TED"}],
+    "Exercise": [{"id":"6cJuPmYp7lE","title":"Gentle Morning Stretch","channel":"SilverSneakers"},{"id":"8Oh3q4BC4y8","title":"Seated Exercises","channel":"More Life Health"},{"id":"sRZ4IqwvHH8","title":"Balance Exercises","channel":"Bob & Brad"},{"id":"3YStJaRSeg0","title":"Full Body Workout","channel":"HASfit"}],
+    "Nutrition": [{"id":"fqhYBTg73fw","title":"Healthy Eating Tips","channel":"AARP"},{"id":"TRov4mMb_B4","title":"Mediterranean Diet","channel":"Cleveland Clinic"},{"id":"vBEI3JXxLJM","title":"Anti-Inflammatory Foods","channel":"Dr. Eric Berg DC"},{"id":"BSnsLGJzmGE","title":"Protein for Older Adults","channel":"Cleveland Clinic"}],
+    "Sleep": [{"id":"t0kACis_dJE","title":"Sleep Hygiene Tips","channel":"Mayo Clinic"},{"id":"LFBjI3RA2JI","title":"Fall Asleep Faster","channel":"Cleveland Clinic"},{"id":"nm1TxQj9IsQ","title":"Why We Sleep","channel":"TED"}],
+    "Heart Health": [{"id":"pBrEhtfrVsE","title":"Heart Healthy Tips","channel":"AHA"},{"id":"RQSl6Dnsf68","title":"Understanding Blood Pressure","channel":"Cleveland Clinic"},{"id":"LXb3EKWsInQ","title":"Heart-Healthy Foods","channel":"Mayo Clinic"},{"id":"dBnniua6-oM","title":"Signs of Heart Disease","channel":"Cleveland Clinic"}],
+    "Brain Health": [{"id":"LNHBMFCzznE","title":"Keep Your Brain Sharp","channel":"AARP"},{"id":"pIlTb6SjR_g","title":"Memory Tips","channel":"TED-Ed"},{"id":"f7Dl6a9i0wY","title":"Brain Foods","channel":"Cleveland Clinic"},{"id":"teVE3VGrBhM","title":"Neuroplasticity","channel":"TED-Ed"}],
+    "Safety": [{"id":"8Gq3D_YOYew","title":"Fall Prevention","channel":"Bob & Brad"},{"id":"TLWGn5HD_0I","title":"Home Safety Checklist","channel":"AARP"},{"id":"7TXEZ_dUQqE","title":"Emergency Preparedness","channel":"FEMA"}],
+    "Wellness": [{"id":"inpok4MKVLM","title":"Morning Meditation","channel":"Goodful"},{"id":"6cJuPmYp7lE","title":"Full Body Stretch","channel":"SilverSneakers"},{"id":"SEfs5TJZ6Nk","title":"Intro to Mindfulness","channel":"Psych Hub"}],
+    "Technology": [{"id":"xLUaVeKhbK8","title":"Staying Connected","channel":"AARP"},{"id":"TLWGn5HD_0I","title":"Online Safety Tips","channel":"AARP"},{"id":"3PycZtfns_U","title":"Digital Health Tools","channel":"Mayo Clinic"}],
+    "Chronic Conditions": [{"id":"QB1kk0p_E0I","title":"Managing Chronic Conditions","channel":"Cleveland Clinic"},{"id":"TRov4mMb_B4","title":"Nutrition for Chronic Health","channel":"Cleveland Clinic"},{"id":"sRZ4IqwvHH8","title":"Exercise with Chronic Pain","channel":"Bob & Brad"}],
+    "Relationships": [{"id":"inpok4MKVLM","title":"Mindful Communication","channel":"Goodful"},{"id":"TUqEu0mBMr8","title":"Staying Active Together","channel":"AARP"},{"id":"3PycZtfns_U","title":"Connection and Health","channel":"Mayo Clinic"}],
+    "Women's Health": [{"id":"3PycZtfns_U","title":"Women's Wellness","channel":"Mayo Clinic"},{"id":"TRov4mMb_B4","title":"Nutrition After 50","channel":"Cleveland Clinic"},{"id":"t0kACis_dJE","title":"Sleep and Hormones","channel":"Mayo Clinic"}],
+    "Men's Health": [{"id":"pBrEhtfrVsE","title":"Heart Health for Men","channel":"AHA"},{"id":"sRZ4IqwvHH8","title":"Strength and Balance","channel":"Bob & Brad"},{"id":"RQSl6Dnsf68","title":"Blood Pressure Basics","channel":"Cleveland Clinic"}],
+    "Preventive Care": [{"id":"QB1kk0p_E0I","title":"Health Screenings Guide","channel":"Cleveland Clinic"},{"id":"3PycZtfns_U","title":"Preventive Wellness","channel":"Mayo Clinic"},{"id":"TLWGn5HD_0I","title":"Health Checklist","channel":"AARP"}],
+}
+
+STEADIDAY_FEATURES = {"free": ["Emergency SOS button","Fall Detection","Trusted Contacts","Medication reminders","Apple Health integration","Food and water logging","Mind Breaks games","Calendar sync","Magnifier tool","Find My Car","Flashlight"]}
+
+# Unified image-dedup set, populated from recent post HTML on startup
+# and updated as new images are picked. Compared by base URL (no query string)
+# so the same photo at ?w=800 and ?w=1200 counts as a duplicate.
+_used_images = set()
+
+
+def remember_used_images(urls):
+    """Add base URLs (get_recently_used_images()) to the dedup set."""
+    _used_images.update(urls)
+
+
+_base_unsplash_url = responsive_images.base_unsplash_url
+
+
+def find_unsplash_images(client, topic, category, count=6):
+    prompt = f"""Search Unsplash for {count} photos that SPECIFICALLY match this blog topic:
+"{topic}"
+
+CRITICAL: The images must visually represent THIS topic. Examples:
+- "Photo sharing with grandchildren" -> grandparents on tablet, video call, looking at phone together
+- "Dental health" -> smiling person, dental checkup, toothbrush, healthy teeth
+- "Blood pressure" -> blood pressure monitor, doctor visit, heart health
+- "Medication routine" -> pill organizer, pharmacy, medicine bottles
+- "Balance exercises" -> person doing balance exercises, yoga, physical therapy
+- "Sleep tips" -> peaceful bedroom, person sleeping, nighttime routine
+
+NEVER return generic nature, yoga, or meditation photos unless the topic is literally about those things.
+
+Requirements:
+- Each URL from images.unsplash.com
+- Each alt text must describe what the photo ACTUALLY shows
+- Varied subjects, not all the same scene
+- Warm and positive for adults 50+
+- URL format: https://images.unsplash.com/photo-XXXXX?w=800&q=80
+
+Return ONLY a JSON array: [{{"url":"https://images.unsplash.com/photo-XXXXX?w=800&q=80","alt":"What this photo actually shows"}}]
+Or NONE if you cannot find good topic-specific matches."""
+    try:
+        msg = call_with_retry(lambda: client.messages.create(model=CLAUDE_MODEL, max_tokens=1000, tools=[{"type":"web_search_20250305","name":"web_search"}], messages=[{"role":"user","content":prompt}]))
+        response_text = "".join(block.text for block in msg.content if hasattr(block,'text'))
+        if "NONE" in response_text: return None
+        json_match = re.search(r'\[[\s\S]*?\]', response_text)
+        if json_match:
+            try:
+                parsed = json.loads(json_match.group())
+            except json.JSONDecodeError:
+                return None
+            valid = [
+                img for img in parsed
+                if isinstance(img, dict)
+                and "url" in img and "alt" in img
+                and is_valid_unsplash_url(img["url"])  # reject hallucinated IDs
+            ]
+            if len(valid) < 3:
+                return None
+            # Prefer images not used in the last 15 posts; if too few are
+            # fresh, accept some reuse rather than ship without images.
+            fresh = [img for img in valid
+                     if _base_unsplash_url(img["url"]) not in _used_images]
+            return fresh if len(fresh) >= 3 else valid
+        return None
+    except Exception as e:
+        print(f"  ⚠ Dynamic image search failed: {e}")
+        return None
+
+def search_hero_image(client, topic):
+    """Search for a topic-specific hero image. Returns URL or None.
+    Validates the URL format (rejects LLM hallucinations) and skips URLs
+    already used by recent posts."""
+    prompt = f"""Find ONE high-quality Unsplash landscape photo for the hero banner of a blog about:
+"{topic}"
+
+The image MUST visually represent this specific topic. Examples:
+- "Dental Care" -> someone smiling, dental office, healthy teeth
+- "Heart Health" -> cardiovascular, active lifestyle, heart-healthy food
+- "Photo Sharing" -> grandparents with tablet, family video call, sharing photos
+
+Do NOT return generic yoga/nature/meditation unless the topic is literally about that.
+Format: https://images.unsplash.com/photo-XXXXX?w=1200&q=80
+Return ONLY the URL or NONE."""
+    try:
+        msg = call_with_retry(lambda: client.messages.create(
+            model=CLAUDE_MODEL, max_tokens=500,
+            tools=[{"type":"web_search_20250305","name":"web_search"}],
+            messages=[{"role":"user","content":prompt}]))
+        response = "".join(b.text for b in msg.content if hasattr(b,'text'))
+        if "NONE" in response: return None
+        m = re.search(r'https://images\.unsplash\.com/[^\s"\']+', response)
+        url = m.group(0) if m else None
+        if not is_valid_unsplash_url(url):
+            # Reject hallucinated IDs (e.g. photo-nUQIh8RH2XQ from the
+            # testosterone post). The looser legacy regex passed these through.
+            if url:
+                print(f"  ⚠ Hero search returned invalid URL format: {url}")
+            return None
+        if _base_unsplash_url(url) in _used_images:
+            print(f"  ⚠ Hero search returned a URL already in use, skipping")
+            return None
+        return url
+    except Exception as e:
+        print(f"  ⚠ Hero search failed: {e}")
+        return None
+
+def get_images_for_category(category, topic=None, client=None):
+    """Build the hero + inline image set for a blog post.
+
+    Fallback chain for hero (first that succeeds wins):
+      1. Dedicated hero search (topic-specific, validated URL, dedup-checked).
+      2. Promote the first inline image (also topic-specific) — and remove it
+         from the inline list so the same photo doesn't appear twice on the
+         page. Resized from ?w=800 to ?w=1200 for banner display.
+      3. Category-pool fallback (topic-adjacent within the category).
+      4. DEFAULT_HERO (clearly decorative, no false topic-relevance).
+    """
+    global _used_images
+
+    hero = None
+    inline = []
+
+    if client and topic:
+        # Inline search runs first so we have candidates available for
+        # hero-promotion fallback if the dedicated hero search fails.
+        print("  🔍 Searching for topic-specific inline images...")
+        n = random.choice([3, 4, 5])
+        dynamic_images = find_unsplash_images(client, topic, category, count=n + 2)
+        if dynamic_images:
+            inline = random.sample(dynamic_images, min(n, len(dynamic_images)))
+            print(f"  ✅ Found {len(inline)} topic-specific inline images")
+            for img in inline:
+                _used_images.add(_base_unsplash_url(img["url"]))
+        else:
+            print("  ⚠ No topic-specific inline images found.")
+
+        # Dedicated hero search.
+        print("  🔍 Searching for topic-specific hero image...")
+        hero = search_hero_image(client, topic)
+        if hero:
+            print("  ✅ Found topic-specific hero")
+            _used_images.add(_base_unsplash_url(hero))
+
+    # Fallback 1: promote first inline image to hero.
+    if not hero and inline:
+        promoted_url = inline[0]["url"].replace("w=800", "w=1200")
+        if is_valid_unsplash_url(promoted_url):
+            hero = promoted_url
+            _used_images.add(_base_unsplash_url(hero))
+            inline = inline[1:]
+            print("  📎 Hero search failed — promoted first inline image to hero")
+
+    # Fallback 2: category pool (topic-adjacent within the category).
+    if not hero:
+        pool = HERO_IMAGES.get(category) or HERO_IMAGES.get("Wellness", [])
+        for candidate in pool:
+            if _base_unsplash_url(candidate) not in _used_images:
+                hero = candidate
+                _used_images.add(_base_unsplash_url(hero))
+                print(f"  📎 Hero from {category} category pool")
+                break
+
+    # Fallback 3: brand-safe abstract gradient.
+    if not hero:
+        hero = DEFAULT_HERO
+        print("  📎 Using DEFAULT_HERO (search and pools exhausted)")
+
+    return {"hero": hero, "inline": inline}
+
+def get_category_thumbnail(category):
+    options = CATEGORY_IMAGES.get(category, CATEGORY_IMAGES["Wellness"])
+    return random.choice(options) if isinstance(options, list) else options
+
+def verify_youtube_video(video_id):
+    try:
+        req = urllib.request.Request(f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json", headers={"User-Agent":"Mozilla/5.0"})
+        with urllib.request.urlopen(req, timeout=10) as resp: return resp.status == 200
+    except urllib.error.HTTPError: return False
+    except: return True
+
+def find_youtube_video(client, topic, category):
+    prompt = f"""Find ONE YouTube video relevant to: "{topic}" (Category: {category})
+From reputable health channels (Mayo Clinic, Cleveland Clinic, AARP, etc.), under 15 min.
+Return ONLY: VIDEO_ID: [id]\nVIDEO_TITLE: [title]\nVIDEO_CHANNEL: [channel]\nOr: VIDEO_ID: NONE"""
+    try:
+        msg = call_with_retry(lambda: client.messages.create(model=CLAUDE_MODEL, max_tokens=500, tools=[{"type":"web_search_20250305","name":"web_search"}], messages=[{"role":"user","content":prompt}]))
+        response_text = "".join(block.text for block in msg.content if hasattr(block,'text'))
+        vid_match = re.search(r'VIDEO_ID:\s*(\S+)', response_text)
+        title_match = re.search(r'VIDEO_TITLE:\s*(.+?)(?:\n|$)', response_text)
+        channel_match = re.search(r'VIDEO_CHANNEL:\s*(.+?)(?:\n|$)', response_text)
+        if vid_match and vid_match.group(1).strip() != "NONE":
+            video_id = vid_match.group(1).strip()
+            if 10 <= len(video_id) <= 12 and verify_youtube_video(video_id):
+                return {"id":video_id,"title":title_match.group(1).strip() if title_match else "Health Tips","channel":channel_match.group(1).strip() if channel_match else "Health Channel"}
+            else: print(f"  Dynamic video {video_id} unavailable, using fallback")
+        print("  Could not find dynamic video, using fallback")
+    except Exception as e: print(f"  Video search failed: {e}, using fallback")
+    return None
+
+def find_relevant_studies(client, topic, category):
+    """Search for 2-3 real, linkable studies/sources relevant to the topic.
+    Returns a list of dicts: [{"title": "...", "url": "...", "finding": "..."}]
+    """
+    prompt = f"""Find 2-3 recent, reputable medical studies, clinical guidelines, or health organization
+publications relevant to this topic: "{topic}" (Category: {category})
+
+Good sources: PubMed (pubmed.ncbi.nlm.nih.gov), NIH, CDC, Mayo Clinic, Cleveland Clinic,
+JAMA, The Lancet, NEJM, BMJ, Harvard Health, Johns Hopkins, WHO, AHA, Alzheimer's Association,
+AARP, WebMD research pages.
+
+Requirements:
+- Each must have a REAL, working URL that goes directly to the source
+- Published within the last 3 years
+- Relevant to adults 50+
+- Include the key finding or recommendation
+
+Return ONLY a JSON array with no other text:
+[{{"title": "Study or article title", "url": "https://...", "finding": "Key finding in one sentence"}}]
+
+If you cannot find suitable sources, return: NONE"""
+
+    try:
+        msg = call_with_retry(lambda: client.messages.create(
+            model=CLAUDE_MODEL, max_tokens=800,
+            tools=[{"type": "web_search_20250305", "name": "web_search"}],
+            messages=[{"role": "user", "content": prompt}]
+        ))
+        response_text = "".join(block.text for block in msg.content if hasattr(block, 'text'))
+        if "NONE" in response_text:
+            return []
+        json_match = re.search(r'\[[\s\S]*?\]', response_text)
+        if json_match:
+            studies = json.loads(json_match.group())
+            valid = [s for s in studies if isinstance(s, dict) and "url" in s and "title" in s and s["url"].startswith("http")]
+            if valid:
+                print(f"  📚 Found {len(valid)} relevant studies/sources")
+                return valid[:3]
+        return []
+    except Exception as e:
+        print(f"  ⚠ Study search failed: {e}")
+        return []
+
+
+def internal_links_instruction(topic, keyword, category, tree=None):
+    """Prompt section listing real posts to link to (related_posts.candidates)."""
+    links = related_posts.candidates(f"{topic} {keyword}", category, tree=tree)
+    if not links:
+        return ""
+    links_list = "\n".join(f"  - \"{title}\" — URL: {BLOG_BASE_URL}/{name}" for name, title in links)
+    return f"""
+INTERNAL LINKS (existing SteadiDay articles, most related first):
+{links_list}
+Link 2-3 of these where they genuinely fit, with <a href="URL">descriptive link text</a>.
+Do NOT link to any other steadiday.com/blog/ URL — other pages do not exist."""
+
+
+def generate_blog_post(topic_data, existing_posts, client, tree=None):
+    topic, keyword, category = topic_data["topic"], topic_data["keyword"], topic_data.get("category","Wellness")
+    images = get_images_for_category(category, topic=topic, client=client)
+    print("  Searching for relevant YouTube video...")
+    video = find_youtube_video(client, topic, category)
+    if video is None:
+        print("  No verified video found. Publishing without video.")
+    else: print(f"  Found video: {video['title']} by {video['channel']}")
+
+    # Search for relevant studies to link in the article
+    print("  Searching for relevant studies and sources...")
+    studies = find_relevant_studies(client, topic, category)
+    studies_instruction = ""
+    if studies:
+        studies_list = "\n".join([f"  - \"{s['title']}\" — {s.get('finding','')} — URL: {s['url']}" for s in studies])
+        studies_instruction = f"""
+STUDIES TO REFERENCE (link to these with <a href="URL" target="_blank" rel="noopener">text</a>):
+{studies_list}
+Weave these naturally into the text as evidence. Use the actual URL in hyperlinks.
+Do NOT just list sources at the end — embed them where the evidence supports your point."""
+    else:
+        studies_instruction = """
+Include at least 2 hyperlinks to reputable sources (NIH, Mayo Clinic, CDC, AHA, etc.) using
+<a href="URL" target="_blank" rel="noopener">descriptive link text</a> format.
+Reference specific studies, guidelines, or data where relevant."""
+    links_instruction = internal_links_instruction(topic, keyword, category, tree=tree)
+
+    num_images = len(images["inline"])
+    feature = random.choice(STEADIDAY_FEATURES["free"])
+    style = random.choice(WRITING_STYLES)
+    print(f"  Writing style: {style['name']}")
+    img_ph = "\n".join([f"After section {i+2}, insert exactly: [IMAGE_{i+1}]" for i in range(num_images)])
+    content_summaries = get_content_summaries(existing_posts)
+    angle_instruction = ""
+    if topic_data.get('angle'): angle_instruction = f"\nANGLE: {topic_data['angle']}"
+    if topic_data.get('source'): angle_instruction += f"\nSOURCE: {topic_data['source']}"
+    prompt = f"""You are a health and wellness writer for SteadiDay, an app for adults 50+.
+Write a blog post about: "{topic}"
+{angle_instruction}
+
+{style['instruction']}
+
+TONE GUIDELINES:
+- Write like a knowledgeable friend, not a textbook
+- Vary sentence length — mix short punchy with longer flowing
+- Use contractions naturally (you'll, it's, don't)
+- Include specific, concrete details and real numbers
+- Avoid clichés like "in today's world" or "it's no secret"
+- DO NOT start paragraphs with "In fact," "Additionally," "Furthermore," "Moreover"
+- Use conversational transitions, not formal connectors
+- Evidence-based only — no political opinions
+{studies_instruction}
+{links_instruction}
+
+EXISTING POSTS (do NOT duplicate):
+{content_summaries}
+
+TITLE RULES (CRITICAL):
+- The title MUST be a COMPLETE, GRAMMATICAL phrase or sentence.
+- Target length: 50-60 characters. Hard maximum: 65 characters.
+- NEVER use ellipses ("...") or any trailing punctuation that suggests truncation.
+- If the full idea will not fit, SHORTEN the wording — do NOT cut off mid-thought.
+- A short complete title ("Why Morning Naps May Be a Warning Sign") is better than
+  a long fragment ("Daytime Napping and Mortality Risk: What Older...").
+- Include the primary keyword naturally.
+
+SEO REQUIREMENTS:
+- META_DESCRIPTION must include the keyword and a compelling reason to click (150-160 chars)
+- Use the primary keyword in the first paragraph and at least 2 section headings
+- Include 2-3 internal links from INTERNAL LINKS, if given (never invent blog URLs)
+- Primary keyword for SEO: "{keyword}"
+
+CONTENT REQUIREMENTS:
+1. 1000-1500 words, 6-7 sections with <h2> tags
+2. Mention SteadiDay's {feature} feature naturally (it's free)
+3. Include at least 2 specific statistics with their sources
+4. Advice must be DISTINCT from existing posts
+
+MEDIA PLACEHOLDERS:
+{img_ph}
+After section 4: [VIDEO]
+
+FORMAT:
+TITLE: [complete title, 50-65 chars, NO ellipses, NO truncation]
+META_DESCRIPTION: [150-160 chars, include keyword]
+KEYWORDS: keyword1, keyword2, {keyword}
+READ_TIME: X
+CONTENT:
+<p>Opening...</p>
+<h2>Section Title</h2>
+<p>Content...</p>"""
+    msg = call_with_retry(lambda: client.messages.create(model=CLAUDE_MODEL, max_tokens=4500, messages=[{"role":"user","content":prompt}]))
+    r = msg.content[0].text
+    title_match = re.search(r'TITLE:\s*(.+?)(?:\n|$)', r)
+    title = title_match.group(1).strip() if title_match else topic
+    meta = (re.search(r'META_DESCRIPTION:\s*(.+?)(?:\n|$)', r) or type('',(),{'group':lambda s,n:f"Tips about {topic} for adults 50+"})).group(1).strip()
+    kws = (re.search(r'KEYWORDS:\s*(.+?)(?:\n|$)', r) or type('',(),{'group':lambda s,n:keyword})).group(1).strip()
+    rt = (re.search(r'READ_TIME:\s*(\d+)', r) or type('',(),{'group':lambda s,n:"7"})).group(1)
+    content_match = re.search(r'CONTENT:\s*(.+)', r, re.DOTALL)
+    content = content_match.group(1).strip() if content_match else r
+
+    # Soft warning only — NEVER truncate. A bad-but-complete title is
+    # infinitely better than a fragment ending in "...". Google SERP
+    # truncation is pixel-based (~580px, roughly 60-70 chars), so we ship
+    # over-long titles as-is and log them for prompt tuning if recurring.
+    if len(title) > 65:
+        print(f"  ⚠ Title is {len(title)} chars (target: 50-60, max: 65). Shipping as-is.")
+        print(f"  ⚠ Over-long title: {title!r}")
+
+    # Safety net: if the model still returned trailing ellipses despite the
+    # prompt, strip them rather than publish "...". This is belt-and-suspenders.
+    if title.endswith("...") or title.endswith("…"):
+        cleaned = title.rstrip(". ").rstrip("…").rstrip()
+        print(f"  ⚠ Model returned trailing ellipses. Stripping: {title!r} -> {cleaned!r}")
+        title = cleaned
+
+    layout = random.choice(IMAGE_LAYOUT_PATTERNS)
+    media = {"images":[{"url":img["url"],"alt":img["alt"],"layout":layout[i % len(layout)]} for i, img in enumerate(images["inline"])],
+             "video":{"id":video["id"],"title":video["title"],"channel":video["channel"]} if video else None}
+    # Keep the body with its [IMAGE_n]/[VIDEO] placeholders: it is what gets
+    # stored in the post source, so media markup can change on re-render.
+    body = re.sub(r'\[IMAGE_(\d+)\]', lambda m: m.group(0) if int(m.group(1)) <= num_images else '', content)
+    if not video: body = body.replace("[VIDEO]",'')
+    slug = '-'.join(re.sub(r'[^a-z0-9\s]','',title.lower()).split()[:5])
+    return {"title":title,"meta_description":meta,"keywords":kws,"read_time":rt,"body":body,"media":media,"content":render_body(body, media),"slug":slug,"category":category,"hero_image":images["hero"],"video":video,"num_images":num_images,"date":datetime.now().strftime('%Y-%m-%d')}
+
+
+def check_duplicate(client, title, slug, existing_posts):
+    dup,reason,_ = is_duplicate(title,slug,existing_posts)
+    if dup: return True,reason
+    sem_dup,sem_reason = check_semantic_duplicate(client,title,existing_posts)
+    return (True,sem_reason) if sem_dup else (False,"")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Publish
+
+Runs every artifact producer against one working tree, then stages the
+result as one commit and pushes it once. Previously the blog generator,
+sitemap, gtag injection, CTA updater and index rebuild workflows each ran
+`git add`/`commit` on their own, then `pull --rebase` and up to three
+`git push` retries. They also triggered each other through workflow_run
+and push paths, so one post meant several CI runs in a row, all racing to
+push to main.
+
+A publish:
+    1. syncs        fetches the branch and fast-forwards to it, so the build
+                    starts from what is on the remote
+    2. produces     either writes a post with generate_blog.main(), which
+                    runs the build pipeline itself, or (--build-only) just
+                    runs the pipeline (site_cli.run_build, minus IndexNow)
+    3. plans        lists the changed files under PUBLISH_PATHS; changes
+                    anywhere else (scripts, workflows) are reported and
+                    left out
+    4. commits      stages exactly the planned files as one commit
+    5. pushes       `git push <remote> HEAD:<branch>`. If someone pushed in
+                    the meantime, the commit is rebased once and pushed
+                    again; a conflict aborts the rebase and fails the run
+                    rather than guessing which generated file wins
+
+--dry-run stops after step 3 and prints the planned file set. Nothing is
+fetched, committed or pushed, but the producers still run and leave their
+output in the working tree. In post mode that includes calling the model
+(the Buttondown draft is skipped), so use --build-only for a free check.
+
+The remote can be a name or a path, so a publish can run against a local
+bare repo instead of GitHub (tests/test_publish.py does):
+    git init --bare /tmp/site.git
+    git push /tmp/site.git HEAD:main
+    python scripts/site_cli.py publish --build-only --remote /tmp/site.git
+
+Without a configured git identity (as on a fresh CI runner) the commit is
+made as github-actions[bot].
+
+Usage (from the repo root):
+    python scripts/site_cli.py publish [topic] [--news]    # write a post, commit, push
+    python scripts/site_cli.py publish --build-only [--force] [-m MESSAGE]
+    python scripts/site_cli.py publish --build-only --dry-run
+"""
+
+import subprocess
+
+from site_tree import SiteTree
+
+DEFAULT_REMOTE = "origin"
+DEFAULT_BRANCH = "main"
+# Everything the producers write that belongs in the repo. Top-level pages
+# (*.html in the repo root) are published too.
+PUBLISH_PATHS = ["blog/", "content/", "assets/fonts/", "sitemap.xml", "sw.js"]
+BUILD_MESSAGE = "🔧 Rebuild site artifacts"
+BOT_NAME = "github-actions[bot]"
+BOT_EMAIL = "github-actions[bot]@users.noreply.github.com"
+
+
+class PublishError(RuntimeError):
+    pass
+
+
+def git(tree, *args, input=None, check=True):
+    """Run git in the tree's repo. Returns the CompletedProcess."""
+    result = subprocess.run(["git", "-C", tree.root, *args], input=input,
+                            capture_output=True, text=True)
+    if check and result.returncode != 0:
+        raise PublishError(f"git {args[0]} failed: {result.stderr.strip() or result.stdout.strip()}")
+    return result
+
+
+def publishable(path):
+    return path.startswith(tuple(PUBLISH_PATHS)) or ("/" not in path and path.endswith(".html"))
+
+
+def changed_files(tree):
+    """[(status, path)] for every changed, deleted or untracked file, from
+    `git status --porcelain -z`."""
+    fields = git(tree, "status", "--porcelain", "-z", "--untracked-files=all").stdout.split("\0")
+    changes, i = [], 0
+    while i < len(fields):
+        entry = fields[i]
+        i += 1
+        if not entry:
+            continue
+        status, path = entry[:2], entry[3:]
+        if status[0] in "RC":
+            i += 1  # the rename source follows
+        changes.append((status.strip() or "M", path))
+    return changes
+
+
+def plan(tree):
+    """(files to publish, files left out), each as [(status, path)]."""
+    changes = changed_files(tree)
+    return ([c for c in changes if publishable(c[1])],
+            [c for c in changes if not publishable(c[1])])
+
+
+def print_plan(files, left_out):
+    print(f"\n📦 Publish plan: {len(files)} files")
+    for status, path in files:
+        print(f"  {status:>2} {path}")
+    if left_out:
+        print(f"⚠️  Not published (outside {', '.join(PUBLISH_PATHS)}, *.html): {len(left_out)} files")
+        for status, path in left_out:
+            print(f"  {status:>2} {path}")
+
+
+def sync(tree, remote, branch):
+    """Fast-forward to the remote branch before producing anything."""
+    git(tree, "fetch", remote, branch)
+    merged = git(tree, "merge", "--ff-only", "FETCH_HEAD", check=False)
+    if merged.returncode != 0:
+        raise PublishError(f"Cannot fast-forward to {remote}/{branch}: {merged.stderr.strip()}")
+
+
+def identity(tree):
+    """-c options for the bot identity when git has none configured."""
+    if git(tree, "config", "user.email", check=False).stdout.strip():
+        return []
+    return ["-c", f"user.name={BOT_NAME}", "-c", f"user.email={BOT_EMAIL}"]
+
+
+def commit(tree, files, message):
+    """Stage exactly `files` (additions, changes and deletions) and commit. Returns the sha."""
+    git(tree, "add", "-A", "--pathspec-from-file=-", "--pathspec-file-nul",
+        input="\0".join(":(literal)" + path for _, path in files))
+    git(tree, *identity(tree), "commit", "-q", "-m", message)
+    return git(tree, "rev-parse", "HEAD").stdout.strip()
+
+
+def push(tree, remote, branch):
+    """Push HEAD; if the remote moved on, rebase once onto it and push again."""
+    if git(tree, "push", "-q", remote, f"HEAD:{branch}", check=False).returncode == 0:
+        return
+    print(f"  {remote}/{branch} moved on, rebasing the publish commit...")
+    git(tree, "fetch", remote, branch)
+    rebased = git(tree, *identity(tree), "rebase", "--autostash", "FETCH_HEAD", check=False)
+    if rebased.returncode != 0:
+        git(tree, "rebase", "--abort", check=False)
+        raise PublishError(f"Publish commit conflicts with {remote}/{branch}; re-run the publish")
+    git(tree, "push", "-q", remote, f"HEAD:{branch}")
+
+
+def run(tree=None, post_args=None, message=None, dry_run=False, push_to=DEFAULT_REMOTE, branch=DEFAULT_BRANCH,
+        force=False):
+    """Produce, commit and push. `post_args` are generate_blog arguments
+    (None for a build-only publish, `force` as in `build --force`);
+    `push_to` None commits without pushing. Returns the commit sha, or None
+    when there was nothing to publish."""
+    tree = tree or SiteTree()
+    if not dry_run and push_to:
+        sync(tree, push_to, branch)
+
+    if post_args is None:
+        import site_cli
+        site_cli.run_build(tree, skip=["indexnow"], force=force)
+        message = message or BUILD_MESSAGE
+    else:
+        import generate_blog
+        post, _ = generate_blog.main(post_args, tree=tree, notify=not dry_run)
+        message = message or f"📝 Auto-publish blog: {post['title']}"
+
+    files, left_out = plan(tree)
+    print_plan(files, left_out)
+    if dry_run:
+        print("\n🔍 Dry run: nothing committed or pushed")
+        return None
+    if not files:
+        print("\n✅ Nothing to publish")
+        return None
+
+    sha = commit(tree, files, message)
+    print(f"\n📝 Committed {sha[:7]}: {message}")
+    if push_to:
+        push(tree, push_to, branch)
+        sha = git(tree, "rev-parse", "HEAD").stdout.strip()
+        print(f"🚀 Pushed {sha[:7]} to {push_to} {branch}")
+    return sha
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Related Posts
+
+Picks related articles for every post from the archive's titles and
+descriptions, and renders them as a "Related reading" list at the end of
+each article. The same model gives the generator real internal-link
+candidates for a new post; the prompt used to ask for "2-3 internal links
+to related posts" without saying which URLs exist, so the links it got
+back were guesses.
+
+Each post (title + description from the card catalog, see blog_index.py)
+becomes a TF-IDF vector over search_index.tokenize() terms: sublinear term
+frequency, smoothed IDF, L2-normalized. The vectors are stored sparse as
+NumPy postings per term, so a post's cosine similarity to the whole archive
+is one bincount over the postings of its ~20 terms. Posts with no term in
+common never match; among the rest a post in the same category gets
+CATEGORY_BOOST and one in a RELATED_CATEGORIES neighbour gets
+RELATED_CATEGORY_BOOST. The top RELATED_COUNT become its neighbours.
+
+The graph is kept in content/related.json:
+
+    {"version": 1, "posts": {"<post>.html": [["<neighbour>.html", score], ...]}}
+
+A build only computes what changed instead of all pairs: neighbours for
+each new post, then its reverse links (every post whose weakest neighbour
+scores below the new post takes it in), and fresh neighbours for posts that
+linked to a removed post. Only those posts' "Related reading" blocks are
+rewritten. Scores of untouched posts are not recomputed as the IDF drifts;
+`site_cli.py related --full` recomputes every pair.
+
+The block sits between <!--RELATED_START--> and <!--RELATED_END--> on the
+line before the post's CTA box, and uses the article's own h2/ul styles.
+post_sources.py re-applies it when posts are re-rendered.
+
+Usage (from the repo root):
+    python scripts/site_cli.py build --only related
+    python scripts/site_cli.py related [--full]
+"""
+
+import re
+import html
+import json
+import math
+from collections import Counter
+
+import numpy as np
+
+import blog_index
+import search_index
+from site_tree import SiteTree
+
+GRAPH_PATH = "content/related.json"
+RELATED_COUNT = 3
+PROMPT_CANDIDATES = 5
+CATEGORY_BOOST = 0.15
+RELATED_CATEGORY_BOOST = 0.05
+# Bump when the scoring changes; the next build recomputes every pair
+VERSION = 1
+
+RELATED_CATEGORIES = {
+    "Mental Wellness": ["Wellness","Sleep","Brain Health","Relationships"],
+    "Medication Tips": ["Safety","Wellness","Healthy Aging","Chronic Conditions"],
+    "Healthy Aging": ["Exercise","Wellness","Nutrition","Technology"],
+    "Exercise": ["Healthy Aging","Heart Health","Wellness","Chronic Conditions"],
+    "Nutrition": ["Heart Health","Healthy Aging","Wellness","Chronic Conditions"],
+    "Sleep": ["Mental Wellness","Wellness","Brain Health"],
+    "Heart Health": ["Exercise","Nutrition","Wellness"],
+    "Brain Health": ["Mental Wellness","Healthy Aging","Exercise"],
+    "Safety": ["Medication Tips","Healthy Aging","Technology"],
+    "Wellness": ["Mental Wellness","Exercise","Nutrition","Relationships"],
+    "Technology": ["Safety","Healthy Aging","Relationships"],
+    "Chronic Conditions": ["Medication Tips","Exercise","Nutrition","Wellness"],
+    "Relationships": ["Mental Wellness","Wellness","Healthy Aging"],
+    "Women's Health": ["Nutrition","Exercise","Preventive Care","Wellness"],
+    "Men's Health": ["Exercise","Heart Health","Preventive Care","Wellness"],
+    "Preventive Care": ["Healthy Aging","Medication Tips","Women's Health","Men's Health"],
+}
+
+START_MARKER, END_MARKER = "<!--RELATED_START-->", "<!--RELATED_END-->"
+_BLOCK_RE = re.compile(r'\n[ \t]*' + START_MARKER + '.*?' + END_MARKER, re.DOTALL)
+# Before the (last) CTA box, on its own line and at its indentation
+_CTA_RE = re.compile(r'\n([ \t]*)<div class="cta-box">')
+
+
+# --- Model ---
+
+def _text(card):
+    return f"{html.unescape(card['title'])} {html.unescape(card['excerpt'])}"
+
+
+def build_model(entries):
+    """Sparse TF-IDF model of [(file name, card)]."""
+    docs = [Counter(search_index.tokenize(_text(card))) for _, card in entries]
+    df = Counter(term for doc in docs for term in doc)
+    n = len(docs)
+    idf = {term: math.log((1 + n) / (1 + count)) + 1 for term, count in df.items()}
+    vectors, postings = [], {}
+    for i, doc in enumerate(docs):
+        weights = {term: (1 + math.log(tf)) * idf[term] for term, tf in doc.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vector = {term: w / norm for term, w in weights.items()}
+        vectors.append(vector)
+        for term, w in vector.items():
+            postings.setdefault(term, ([], []))
+            postings[term][0].append(i)
+            postings[term][1].append(w)
+    categories = sorted({card["category"] for _, card in entries})
+    codes = {c: k for k, c in enumerate(categories)}
+    boost = np.zeros((len(categories), len(categories)), dtype=np.float32)
+    for c, k in codes.items():
+        for other in RELATED_CATEGORIES.get(c, []):
+            if other in codes:
+                boost[k, codes[other]] = RELATED_CATEGORY_BOOST
+        boost[k, k] = CATEGORY_BOOST
+    return {
+        "names": [name for name, _ in entries],
+        "index": {name: i for i, (name, _) in enumerate(entries)},
+        "vectors": vectors,
+        "idf": idf,
+        "postings": {t: (np.array(d, dtype=np.int32), np.array(w, dtype=np.float32))
+                     for t, (d, w) in postings.items()},
+        "codes": codes,
+        "category": np.array([codes[card["category"]] for _, card in entries], dtype=np.int32),
+        "boost": boost,
+    }
+
+
+def similarities(model, vector):
+    """Cosine similarity of a sparse {term: weight} vector to every post."""
+    ids, weights = [], []
+    for term, w in vector.items():
+        if term in model["postings"]:
+            d, pw = model["postings"][term]
+            ids.append(d)
+            weights.append(pw * w)
+    if not ids:
+        return np.zeros(len(model["names"]), dtype=np.float32)
+    return np.bincount(np.concatenate(ids), weights=np.concatenate(weights),
+                       minlength=len(model["names"])).astype(np.float32)
+
+
+def _top(model, scores, count, exclude=None):
+    """[(name, score)] of the `count` best scores > 0; ties go to the newer post."""
+    if exclude is not None:
+        scores[exclude] = 0
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > count:
+        cut = np.partition(scores[candidates], -count)[-count]
+        candidates = candidates[scores[candidates] >= cut]
+    # entries are newest first, so the lower index wins a tie
+    order = candidates[np.lexsort((candidates, -scores[candidates]))][:count]
+    return [[model["names"][i], round(float(scores[i]), 4)] for i in order]
+
+
+def neighbours(model, i, count=RELATED_COUNT):
+    sims = similarities(model, model["vectors"][i])
+    scores = np.where(sims > 0, sims + model["boost"][model["category"][i], model["category"]], 0)
+    return _top(model, scores, count, exclude=i)
+
+
+def _add_reverse_links(model, graph, i):
+    """Offer post i to every post it beats the weakest neighbour of. Returns the posts changed."""
+    name = model["names"][i]
+    sims = similarities(model, model["vectors"][i])
+    # Scored from each other post's side: the boost depends on its category
+    scores = np.where(sims > 0, sims + model["boost"][model["category"], model["category"][i]], 0)
+    scores[i] = 0
+    changed = []
+    for j in np.flatnonzero(scores > 0):
+        other = model["names"][j]
+        current = graph.get(other, [])
+        score = round(float(scores[j]), 4)
+        if len(current) >= RELATED_COUNT and score <= current[-1][1]:
+            continue
+        updated = sorted([n for n in current if n[0] != name] + [[name, score]],
+                         key=lambda n: (-n[1], model["index"].get(n[0], len(model["names"]))))[:RELATED_COUNT]
+        if updated != current:
+            graph[other] = updated
+            changed.append(other)
+    return changed
+
+
+# --- Graph ---
+
+def load_graph(tree):
+    if not tree.exists(GRAPH_PATH):
+        return {}
+    data = json.loads(tree.read(GRAPH_PATH))
+    return data["posts"] if data.get("version") == VERSION else {}
+
+
+def save_graph(tree, graph):
+    data = {"version": VERSION, "posts": dict(sorted(graph.items()))}
+    tree.write(GRAPH_PATH, json.dumps(data, indent=1, ensure_ascii=False) + "\n")
+
+
+def update(tree, entries, full=False):
+    """Bring the graph up to date with `entries` (blog_index.collect()).
+    Returns (graph, changed post names)."""
+    model = build_model(entries)
+    names = model["names"]
+    graph = {} if full else load_graph(tree)
+    if not graph:
+        graph = {name: neighbours(model, i) for i, name in enumerate(names)}
+        return graph, set(names)
+
+    changed = set()
+    removed = set(graph) - set(names)
+    for name in removed:
+        del graph[name]
+    stale = [name for name, links in graph.items() if any(n in removed for n, _ in links)]
+    added = [name for name in names if name not in graph]
+    for name in stale + added:
+        graph[name] = neighbours(model, model["index"][name])
+        changed.add(name)
+    for name in added:
+        changed.update(_add_reverse_links(model, graph, model["index"][name]))
+    return graph, changed
+
+
+def candidates(text, category, tree=None, count=PROMPT_CANDIDATES):
+    """[(file name, title)] of existing posts most related to a planned post's text."""
+    tree = tree or SiteTree()
+    entries = blog_index.collect(tree)
+    if not entries:
+        return []
+    model = build_model(entries)
+    terms = Counter(search_index.tokenize(text))
+    weights = {t: (1 + math.log(tf)) * model["idf"][t] for t, tf in terms.items() if t in model["idf"]}
+    norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+    sims = similarities(model, {t: w / norm for t, w in weights.items()})
+    code = model["codes"].get(category)
+    boost = model["boost"][code, model["category"]] if code is not None else 0
+    scores = np.where(sims > 0, sims + boost, 0)
+    titles = dict(entries)
+    return [(name, html.unescape(titles[name]["title"])) for name, _ in _top(model, scores, count)]
+
+
+# --- Rendering ---
+
+def render_block(links, cards):
+    """The "Related reading" section for a post's [[neighbour, score], ...]."""
+    items = "".join(f'<li><a href="{name}">{cards[name]["title"]}</a></li>'
+                    for name, _ in links if name in cards)
+    if not items:
+        return ""
+    return f'<section class="related-reading"><h2>Related reading</h2><ul>{items}</ul></section>'
+
+
+def strip_block(page):
+    return _BLOCK_RE.sub("", page, count=1)
+
+
+def set_block(page, block):
+    """The page with its related block replaced (or removed when `block` is empty).
+    Pages without a CTA box are left without one."""
+    page = strip_block(page)
+    ctas = list(_CTA_RE.finditer(page)) if block else []
+    if not ctas:
+        return page
+    pos, indent = ctas[-1].start(), ctas[-1].group(1)
+    return page[:pos] + "\n" + indent + START_MARKER + block + END_MARKER + page[pos:]
+
+
+def build(tree=None, full=False):
+    """Update the graph and rewrite the related block of every affected post.
+    Returns the number of posts written."""
+    tree = tree or SiteTree()
+    entries = blog_index.collect(tree)
+    graph, changed = update(tree, entries, full=full)
+    save_graph(tree, graph)
+    cards = dict(entries)
+    written = 0
+    for name in sorted(changed):
+        rel = f"{blog_index.BLOG_DIR}/{name}"
+        if tree.write(rel, set_block(tree.read(rel), render_block(graph.get(name, []), cards))):
+            written += 1
+            print(f"  🔗 {rel}")
+    print(f"🔗 Related posts: {len(graph)} posts, {len(changed)} updated, {written} pages written")
+    return written
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Responsive Images
+
+Responsive markup for the Unsplash photos in blog posts and on the blog
+index. Posts used to load the hero as one ?w=1200 image and inline photos
+as one ?w=800 image, with no width/height, so phones downloaded
+desktop-sized files and the page jumped as each photo arrived.
+
+Every Unsplash URL is now requested through the imgix parameters Unsplash
+supports: a fixed 3:2 crop (w, h, fit=crop) so the intrinsic size is known
+up front, and fm=webp&auto=format so browsers get WebP (or AVIF) instead
+of JPEG. The helpers here build:
+  - img_attrs():       src/srcset/sizes/width/height for an <img>
+  - hero_preload():    a <link rel="preload"> for the hero, the LCP element
+  - card_img():        a lazy-loaded <img> for blog index cards
+  - card_background(): an image-set() background (cards before blog_index.py)
+
+generate_blog.py uses them for new posts; the "responsive-images" rewrite
+rule set (scripts/rewrite_rules.py) retrofits existing posts and cards.
+Photos from other hosts are left as plain src URLs.
+"""
+
+import re
+
+UNSPLASH_PREFIX = "https://images.unsplash.com/"
+ASPECT = (3, 2)
+QUALITY = 80
+
+HERO_WIDTHS = (480, 800, 1200, 1600)
+HERO_SIZES = "100vw"
+INLINE_WIDTHS = (400, 600, 800, 1200)
+# Figures are full-width in the 750px article column, or 45% of it when
+# floated; both go full-width on phones.
+INLINE_SIZES = {
+    "full": "(max-width: 768px) 100vw, 690px",
+    "float": "(max-width: 768px) 100vw, 310px",
+}
+# Index cards are 340-500px wide and 200px tall (cover)
+CARD_WIDTHS = (600, 1200)
+CARD_IMG_WIDTHS = (400, 600, 800, 1200)
+CARD_SIZES = {
+    "card": "(max-width: 768px) 100vw, 370px",
+    # The featured card spans the grid, image in the left ~half
+    "featured": "(max-width: 900px) 100vw, 560px",
+}
+
+_FIGURE_CLASS_RE = re.compile(r'<figure class="([^"]*)"')
+
+
+def base_unsplash_url(url):
+    """Strip the query string. The same photo at different sizes
+    (e.g. ?w=800 vs ?w=1200) should count as one URL."""
+    return url.split('?')[0] if url else url
+
+
+def is_unsplash(url):
+    return bool(url) and url.startswith(UNSPLASH_PREFIX)
+
+
+def height_for(width, aspect=ASPECT):
+    return round(width * aspect[1] / aspect[0])
+
+
+def variant(url, width, aspect=ASPECT):
+    """`url` cropped to `aspect` at `width` pixels, as WebP/AVIF where supported."""
+    return (f"{base_unsplash_url(url)}?w={width}&h={height_for(width, aspect)}"
+            f"&fit=crop&crop=entropy&fm=webp&auto=format&q={QUALITY}")
+
+
+def srcset(url, widths):
+    return ", ".join(f"{variant(url, w)} {w}w" for w in widths)
+
+
+def img_attrs(url, widths, sizes):
+    """src/srcset/sizes/width/height attributes for an <img> of `url`."""
+    if not is_unsplash(url):
+        return f'src="{url}"'
+    default = widths[-2] if len(widths) > 1 else widths[0]
+    return (f'src="{variant(url, default)}" srcset="{srcset(url, widths)}" sizes="{sizes}" '
+            f'width="{default}" height="{height_for(default)}"')
+
+
+def hero_preload(url):
+    """<head> line preloading the hero at the width the browser will pick."""
+    if not is_unsplash(url):
+        return ""
+    return (f'    <link rel="preload" as="image" imagesrcset="{srcset(url, HERO_WIDTHS)}" '
+            f'imagesizes="{HERO_SIZES}" fetchpriority="high">\n')
+
+
+def hero_img(url, alt):
+    return f'<img {img_attrs(url, HERO_WIDTHS, HERO_SIZES)} alt="{alt}" class="hero-image" fetchpriority="high">'
+
+
+def inline_img(url, alt, layout="full"):
+    sizes = INLINE_SIZES["full" if layout == "full" else "float"]
+    return f'<img {img_attrs(url, INLINE_WIDTHS, sizes)} alt="{alt}" loading="lazy" decoding="async">'
+
+
+def card_img(url, featured=False, eager=False):
+    """Cover image for a blog index card. Decorative: the card's title is its text."""
+    sizes = CARD_SIZES["featured" if featured else "card"]
+    loading = 'loading="eager" fetchpriority="high"' if eager else 'loading="lazy" decoding="async"'
+    return f'<img {img_attrs(url, CARD_IMG_WIDTHS, sizes)} alt="" {loading}>'
+
+
+def card_background(url):
+    """Inline style for a blog index card image."""
+    if not is_unsplash(url):
+        return f"background-image: url('{url}');"
+    small, large = CARD_WIDTHS
+    return (f"background-image: url('{variant(url, small)}'); "
+            f"background-image: image-set(url('{variant(url, small)}') 1x, url('{variant(url, large)}') 2x);")
+
+
+# --- Retrofit of existing pages (the "responsive-images" rewrite rule set) ---
+
+HERO_IMG_PATTERN = r'<img src="(https://images\.unsplash\.com/[^"]+)" alt="([^"]*)" class="hero-image" loading="eager">'
+INLINE_IMG_PATTERN = r'<img src="(https://images\.unsplash\.com/[^"]+)" alt="([^"]*)" loading="lazy">'
+CARD_STYLE_PATTERN = r"""style="background-image: url\('(https://images\.unsplash\.com/[^']+)'\);\""""
+_HERO_SRC_RE = re.compile(r'<img src="([^"]+)"[^>]*class="hero-image"')
+
+
+def retrofit_hero(match):
+    return hero_img(match.group(1), match.group(2))
+
+
+def retrofit_inline(match):
+    """Inline photo; the figure around it decides full-width or floated sizes."""
+    figure = None
+    for figure in _FIGURE_CLASS_RE.finditer(match.string, max(0, match.start() - 200), match.start()):
+        pass
+    layout = "float" if figure and "float-" in figure.group(1) else "full"
+    return inline_img(match.group(1), match.group(2), layout)
+
+
+def retrofit_preload(match):
+    """Add the hero preload before </head>, once."""
+    page = match.string
+    hero = _HERO_SRC_RE.search(page)
+    if 'rel="preload" as="image"' in page or not hero:
+        return match.group(0)
+    return hero_preload(hero.group(1)) + match.group(0)
+
+
+def retrofit_card(match):
+    return f'style="{card_background(match.group(1))}"'
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Rewrite Engine
+
+Applies a set of find/replace rules to HTML pages in one scan per file.
+
+The fix scripts used to make one full pass per rule (findall + sub per
+pattern, count + replace per URL pair, read/replace/write per script). Here
+every rule, literal or regex, is compiled into a single alternation of
+named groups, so each file is scanned once no matter how many rules apply.
+Earlier rules win when two could match at the same position, which is how
+overlapping rules are ordered (e.g. ".../steadiday" before the bare host).
+
+Rules are declared in scripts/rewrite_rules.py; each can be limited to a
+set of files with fnmatch patterns. Regex rules may use groups and \\1 or
+\\g<name> in the replacement, but not backreferences inside the pattern.
+
+Usage (from the repo root):
+    python scripts/site_cli.py rewrite --rules blog-urls --dry-run
+    python scripts/site_cli.py rewrite --rules article-heros
+"""
+
+import re
+import difflib
+from fnmatch import fnmatch
+from collections import Counter
+
+from site_tree import SiteTree
+
+_PATTERN_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+
+class Rule:
+    """One rewrite: `pattern` -> `replacement` in the files matching `files`."""
+
+    def __init__(self, name, pattern, replacement, regex=False, files=("*.html",)):
+        self.name = name
+        self.regex = regex
+        self.pattern = pattern if regex else re.escape(pattern)
+        self.replacement = replacement
+        self.files = tuple(files)
+        if regex and _PATTERN_BACKREF_RE.search(pattern):
+            raise ValueError(f"Rule {name!r}: backreferences inside the pattern are not supported")
+        self.compiled = re.compile(self.pattern)
+        if self.compiled.match(""):
+            raise ValueError(f"Rule {name!r}: pattern matches the empty string")
+
+    @classmethod
+    def literal(cls, name, old, new, files=("*.html",)):
+        return cls(name, old, new, regex=False, files=files)
+
+    @classmethod
+    def sub(cls, name, pattern, replacement, files=("*.html",)):
+        return cls(name, pattern, replacement, regex=True, files=files)
+
+    def applies_to(self, relpath):
+        return any(fnmatch(relpath, pattern) for pattern in self.files)
+
+    def expand(self, text, pos):
+        """Replacement for the match of this rule starting at `pos`."""
+        if not self.regex:
+            return self.replacement
+        m = self.compiled.match(text, pos)
+        return self.replacement(m) if callable(self.replacement) else m.expand(self.replacement)
+
+
+class RewriteEngine:
+    def __init__(self, rules):
+        self.rules = list(rules)
+        names = [r.name for r in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Rule names must be unique")
+        self._scanners = {}
+
+    def _scanner(self, indexes):
+        """One compiled alternation for this subset of rules (cached)."""
+        if indexes not in self._scanners:
+            self._scanners[indexes] = re.compile(
+                "|".join(f"(?P<_r{i}>{self.rules[i].pattern})" for i in indexes))
+        return self._scanners[indexes]
+
+    def rewrite(self, text, relpath=""):
+        """Apply every rule that covers `relpath`. Returns (new_text, Counter of hits)."""
+        indexes = tuple(i for i, rule in enumerate(self.rules) if not relpath or rule.applies_to(relpath))
+        hits = Counter()
+        if not indexes:
+            return text, hits
+
+        def replace(m):
+            rule = self.rules[int(m.lastgroup[2:])]
+            hits[rule.name] += 1
+            return rule.expand(text, m.start())
+
+        return self._scanner(indexes).sub(replace, text), hits
+
+    def run(self, tree=None, paths=None, dry_run=False, show_diff=True):
+        """Rewrite `paths` (default: every HTML page) through `tree`.
+
+        Returns {"files": {relpath: Counter}, "hits": Counter}. With dry_run
+        nothing is written; a unified diff of each change is printed instead.
+        """
+        tree = tree or SiteTree()
+        if paths is None:
+            # Every page, plus non-HTML files that rules name explicitly
+            named = {p for rule in self.rules for p in rule.files if not any(c in p for c in '*?[')}
+            paths = sorted(set(tree.html_files()) | named)
+        report = {"files": {}, "hits": Counter()}
+        for rel in paths:
+            if not any(rule.applies_to(rel) for rule in self.rules) or not tree.exists(rel):
+                continue
+            original = tree.read(rel)
+            content, hits = self.rewrite(original, rel)
+            if content == original:
+                continue
+            report["files"][rel] = hits
+            report["hits"].update(hits)
+            if dry_run:
+                if show_diff:
+                    diff = difflib.unified_diff(original.splitlines(), content.splitlines(),
+                                                f"a/{rel}", f"b/{rel}", lineterm="", n=0)
+                    for line in diff:
+                        print(line[:200] + (" …" if len(line) > 200 else ""))
+            else:
+                tree.write(rel, content)
+        return report
+
+
+def print_report(report, rules, dry_run=False):
+    verb = "Would rewrite" if dry_run else "Rewrote"
+    print(f"\n📊 {verb} {len(report['files'])} file(s)")
+    for rule in rules:
+        print(f"   {report['hits'].get(rule.name, 0):>6}  {rule.name}")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Rewrite Rules
+
+The registry of HTML fix-ups applied by scripts/rewrite_engine.py. Each
+named rule set replaces what used to be a standalone read/replace/write
+script; the scripts that remain (fix_blog_posts.py, fix_article_heros.py,
+fix_napping_title.py) are thin wrappers that run their rule set.
+
+Add a new fix by adding a rule set here, then run it with:
+    python scripts/site_cli.py rewrite --rules <name> --dry-run
+"""
+
+import post_styles
+import responsive_images
+import service_worker
+import video_embeds
+from rewrite_engine import Rule
+
+# --- blog-urls (fix_blog_posts.py) ---
+
+# The correct base URL (your custom domain)
+CORRECT_DOMAIN = "https://www.steadiday.com"
+
+# Old GitHub Pages URLs, most specific first so ".../steadiday" is
+# replaced as a whole before the bare host can match
+WRONG_DOMAINS = [
+    "https://scm-solutions-llc.github.io/steadiday",
+    "https://scm-solutions-llc.github.io",
+    "http://scm-solutions-llc.github.io/steadiday",
+    "http://scm-solutions-llc.github.io",
+]
+
+# --- article-heros (fix_article_heros.py) ---
+
+# (filename, old_hero_url, new_hero_url, reason): posts where
+# search_hero_image() fell back to the default, returned a hallucinated
+# Unsplash ID, or picked a wrong-topic photo. The URL appears in the hero
+# <img>, og:image, twitter:image and the JSON-LD image.
+HERO_FIXES = [
+    (
+        "2026-05-04-athome-alzheimers-injection-whats-coming.html",
+        "https://images.unsplash.com/photo-1557683316-973673baf926?w=1200&q=80",
+        "https://images.unsplash.com/photo-1503676260728-1c00da094a0b?w=1200&q=80",
+        "DEFAULT_HERO fallback (abstract teal) -> brain imagery",
+    ),
+    (
+        "2026-04-23-testosterone-therapy-for-men-over.html",
+        "https://images.unsplash.com/photo-nUQIh8RH2XQ?w=1200&q=80",
+        "https://images.unsplash.com/photo-1538805060514-97d9cc17730c?w=1200&q=80",
+        "BROKEN URL (LLM hallucination, likely 404) -> active senior man",
+    ),
+    (
+        "2026-04-20-vitamin-d-your-midlife-brain.html",
+        "https://images.unsplash.com/photo-1475924156734-496f6cac6ec1?w=1200&q=80",
+        "https://images.unsplash.com/photo-1502082553048-f009c37129b9?w=1200&q=80",
+        "generic morning mist -> sunlit forest (vitamin D from sun)",
+    ),
+    (
+        "2026-04-18-your-smile-after-50-a.html",
+        "https://images.unsplash.com/photo-1541781774459-bb2af2f05b55?w=1200&q=80",
+        "https://images.unsplash.com/photo-1494790108377-be9c29b29330?w=1200&q=80",
+        "wrong-topic bedroom photo -> smiling person",
+    ),
+]
+
+# --- napping-title (fix_napping_title.py) ---
+
+OLD_NAPPING_TITLE = "Daytime Napping and Mortality Risk: What Older..."
+NEW_NAPPING_TITLE = "Daytime Napping and Mortality Risk: What This Means for Adults Over 50"
+
+
+def _hero_rules():
+    rules = []
+    for filename, old, new, _reason in HERO_FIXES:
+        files = (f"blog/{filename}",)
+        rules.append(Rule.literal(f"hero:{filename}", old, new, files=files))
+        # Same URL with the & entity-encoded, as in some attributes
+        if "&" in old:
+            rules.append(Rule.literal(f"hero-amp:{filename}", old.replace("&", "&amp;"),
+                                      new.replace("&", "&amp;"), files=files))
+    return rules
+
+
+RULE_SETS = {
+    "blog-urls": [Rule.literal(domain, domain, CORRECT_DOMAIN, files=("blog/*",))
+                  for domain in WRONG_DOMAINS],
+    "article-heros": _hero_rules(),
+    "napping-title": [
+        Rule.literal("napping-title", OLD_NAPPING_TITLE, NEW_NAPPING_TITLE,
+                     files=("blog/index.html", "blog/rss.xml", "content/blog_index.json")),
+    ],
+    # Attribute fixes from fix-youtube-embeds.sh (step 1)
+    "youtube-embeds": [
+        Rule.literal("youtube-nocookie", "youtube-nocookie.com", "youtube.com", files=("blog/*",)),
+        Rule.literal("youtube-frameborder", ' frameborder="0"', '', files=("blog/*",)),
+        Rule.literal("youtube-referrer",
+                     ' loading="lazy" referrerpolicy="no-referrer-when-downgrade"',
+                     ' referrerpolicy="strict-origin-when-cross-origin"', files=("blog/*",)),
+    ],
+    # Inline post CSS -> critical CSS + shared blog/post.<hash>.css (post_styles.py).
+    # Only <style> blocks matching a known template version are replaced; a
+    # second rule repoints already-migrated posts when POST_CSS changes.
+    "post-css": [
+        Rule.sub("post-css-inline", r"<style>((?:(?!</style>)[\s\S])*)</style>",
+                 post_styles.migrate_inline_style, files=("blog/*.html",)),
+        Rule.sub("post-css-rehash",
+                 rf'<style id="{post_styles.CRITICAL_STYLE_ID}">[^<]*</style>\s*'
+                 r'<link rel="stylesheet" href="post\.[0-9a-f]{10}\.css"[^>]*>'
+                 r'<noscript><link rel="stylesheet" href="post\.[0-9a-f]{10}\.css"></noscript>',
+                 post_styles.migrate_hashed_style, files=("blog/*.html",)),
+    ],
+    # Unsplash photos -> srcset/sizes, fixed-crop dimensions and a hero
+    # preload; index cards -> image-set() (responsive_images.py)
+    "responsive-images": [
+        Rule.sub("hero-srcset", responsive_images.HERO_IMG_PATTERN, responsive_images.retrofit_hero,
+                 files=("blog/*.html",)),
+        Rule.sub("inline-srcset", responsive_images.INLINE_IMG_PATTERN, responsive_images.retrofit_inline,
+                 files=("blog/*.html",)),
+        Rule.sub("hero-preload", "</head>", responsive_images.retrofit_preload, files=("blog/*.html",)),
+        Rule.sub("card-image-set", responsive_images.CARD_STYLE_PATTERN, responsive_images.retrofit_card,
+                 files=("blog/index.html",)),
+    ],
+    # YouTube iframes -> click-to-load facades (video_embeds.py)
+    "youtube-facade": [
+        Rule.sub("youtube-facade", video_embeds.IFRAME_PATTERN, video_embeds.retrofit_iframe,
+                 files=("blog/*.html",)),
+    ],
+    # Service worker registration on every page (service_worker.py)
+    "service-worker": [
+        Rule.sub("sw-register", "</body>", service_worker.retrofit_register),
+    ],
+}
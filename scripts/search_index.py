@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Blog Search Index
+
+Builds a static, sharded inverted index for the blog so the listing pages
+can offer instant search without a search service and without loading
+every card. The only way to find an older post used to be scrolling
+through the listing pages.
+
+Each post is indexed over its title, meta description, category and meta
+keywords (title and category come from the card catalog, see
+blog_index.py). Text is lower-cased, accent-folded and split on anything
+that is not [a-z0-9]; stopwords and one-letter tokens are dropped. A term's
+weight in a post is the sum of FIELD_WEIGHTS for the fields it appears in.
+
+Output, under blog/search/ (served as static JSON, fetched on demand):
+    t/<xx>.json   terms starting with <xx>: {"term": [doc, weight, doc, weight, ...]}
+    d/<n>.json    documents DOC_CHUNK*n .. DOC_CHUNK*(n+1)-1:
+                  [[file name, title, category, date], ...] (null = removed post)
+and blog/search.js, the widget: a query fetches one term shard per word
+(the last word is matched as a prefix, so results appear while typing),
+intersects the postings, ranks by summed weight (ties go to the newer
+post) and then fetches only the document chunks of the top results.
+
+Document ids are stable: a new post gets the next id, so publishing one
+post rewrites one document chunk and the shards of its terms. The terms
+of every post are kept in .site-build/search-index.json with the post's
+(mtime, size) and card, so only new or changed posts are re-read, and
+only shards touched by a changed post are re-rendered. Without the state
+(a fresh CI checkout) every post is re-read and ids are assigned in date
+order, but files are only written when their bytes change, so publishing
+still touches just the new post's shards.
+
+Usage (from the repo root):
+    python scripts/site_cli.py build --only search
+    python scripts/site_cli.py search [--force]
+"""
+
+import os
+import re
+import html
+import json
+import unicodedata
+
+import blog_index
+from site_tree import SiteTree, write_if_changed
+
+BLOG_DIR = "blog"
+SEARCH_DIR = f"{BLOG_DIR}/search"
+WIDGET_PATH = f"{BLOG_DIR}/search.js"
+STATE_PATH = ".site-build/search-index.json"
+SHARD_PREFIX = 2
+DOC_CHUNK = 128
+MAX_RESULTS = 8
+FIELD_WEIGHTS = {"title": 4, "category": 2, "keywords": 2, "description": 1}
+# Bump when tokenization or the file format changes to rebuild everything
+VERSION = 1
+
+STOPWORDS = frozenset("""
+a an and are as at be but by can do does for from how if in into is it its
+more most of on or our so than that the their them these this those to
+too up was we what when which who why will with you your
+""".split())
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Vanilla JS widget. __CONFIG__ is replaced with the shard/chunk settings and
+# stopwords so the browser tokenizes queries exactly like tokenize() below.
+WIDGET_JS = r"""/* SteadiDay blog search (generated by scripts/search_index.py) */
+(function () {
+  var C = __CONFIG__;
+  var script = document.currentScript;
+  var form = document.querySelector('.blog-search');
+  if (!form || !script || !window.fetch || !window.Promise) return;
+  var input = form.querySelector('input');
+  var status = form.querySelector('.blog-search-status');
+  var list = form.querySelector('.blog-search-results');
+  var blog = new URL('./', script.src), base = new URL('search/', blog);
+  var cache = {}, seq = 0, timer;
+  form.hidden = false;
+
+  function get(path) {
+    if (!cache[path]) {
+      cache[path] = fetch(new URL(path, base)).then(function (r) {
+        return r.ok ? r.json() : null;
+      }).catch(function () { return null; });
+    }
+    return cache[path];
+  }
+
+  function tokens(q) {
+    var words = q.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '').match(/[a-z0-9]+/g) || [];
+    return words.filter(function (w) { return w.length > 1 && C.stop.indexOf(w) < 0; });
+  }
+
+  function postings(word, prefix) {
+    return get('t/' + word.slice(0, C.prefix) + '.json').then(function (shard) {
+      var scores = {};
+      Object.keys(shard || {}).forEach(function (term) {
+        if (term !== word && !(prefix && term.indexOf(word) === 0)) return;
+        var p = shard[term];
+        for (var i = 0; i < p.length; i += 2) scores[p[i]] = Math.max(scores[p[i]] || 0, p[i + 1]);
+      });
+      return scores;
+    });
+  }
+
+  function render(docs, query) {
+    list.textContent = '';
+    docs.forEach(function (d) {
+      var li = document.createElement('li'), a = document.createElement('a'), meta = document.createElement('span');
+      a.href = new URL(d[0], blog).href;
+      a.textContent = d[1];
+      meta.textContent = d[2] + (d[3] ? ' · ' + d[3] : '');
+      li.appendChild(a);
+      li.appendChild(meta);
+      list.appendChild(li);
+    });
+    status.textContent = !query ? '' : docs.length ? docs.length + ' matching article' + (docs.length > 1 ? 's' : '')
+      : 'No articles found for "' + query + '"';
+  }
+
+  function search() {
+    var query = input.value.trim(), words = tokens(query), id = ++seq;
+    if (!words.length) { render([], ''); return; }
+    Promise.all(words.map(function (w, i) { return postings(w, i === words.length - 1); })).then(function (sets) {
+      var hits = Object.keys(sets[0]).filter(function (doc) {
+        return sets.every(function (s) { return doc in s; });
+      }).map(function (doc) {
+        return [+doc, sets.reduce(function (sum, s) { return sum + s[doc]; }, 0)];
+      });
+      hits.sort(function (a, b) { return b[1] - a[1] || b[0] - a[0]; });
+      return Promise.all(hits.slice(0, C.max).map(function (hit) {
+        return get('d/' + Math.floor(hit[0] / C.chunk) + '.json').then(function (docs) {
+          return docs && docs[hit[0] % C.chunk];
+        });
+      }));
+    }).then(function (docs) {
+      if (id === seq) render(docs.filter(Boolean), query);
+    });
+  }
+
+  input.addEventListener('input', function () {
+    clearTimeout(timer);
+    timer = setTimeout(search, 120);
+  });
+  form.addEventListener('submit', function (e) {
+    e.preventDefault();
+    var first = list.querySelector('a');
+    if (first) window.location.href = first.href;
+  });
+})();
+"""
+
+
+def tokenize(text):
+    """Index terms of `text` (lower-case, accent-folded, no stopwords)."""
+    text = unicodedata.normalize('NFKD', html.unescape(text).lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return [t for t in _TOKEN_RE.findall(text) if len(t) > 1 and t not in STOPWORDS]
+
+
+def document_terms(fields):
+    """{term: weight} for one post from its {field: text}."""
+    terms = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        for term in set(tokenize(fields.get(field, ""))):
+            terms[term] = terms.get(term, 0) + weight
+    return terms
+
+
+def shard_of(term):
+    return term[:SHARD_PREFIX]
+
+
+def render_widget():
+    config = {"prefix": SHARD_PREFIX, "chunk": DOC_CHUNK, "max": MAX_RESULTS, "stop": sorted(STOPWORDS)}
+    return WIDGET_JS.replace("__CONFIG__", json.dumps(config, separators=(",", ":")))
+
+
+def _load_state(tree):
+    try:
+        with open(tree.abspath(STATE_PATH), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return state if state.get("version") == VERSION else None
+    except (OSError, ValueError):
+        return None
+
+
+def _doc_row(name, card):
+    return [name, html.unescape(card["title"]), card["category"], card["date"]]
+
+
+def _render_shard(index, prefix):
+    terms = {term: [v for posting in postings for v in posting]
+             for term, postings in sorted(index.get(prefix, {}).items())}
+    return json.dumps(terms, separators=(",", ":")) + "\n" if terms else None
+
+
+def _render_chunk(rows, chunk):
+    return json.dumps(rows[chunk * DOC_CHUNK:(chunk + 1) * DOC_CHUNK], ensure_ascii=False,
+                      separators=(",", ":")) + "\n"
+
+
+def _files(tree, subdir):
+    try:
+        return sorted(f for f in os.listdir(tree.abspath(f"{SEARCH_DIR}/{subdir}")) if f.endswith(".json"))
+    except OSError:
+        return []
+
+
+def build(tree=None, force=False):
+    """Update the search index for new, changed and removed posts.
+    Returns the number of index files written."""
+    tree = tree or SiteTree()
+    state = None if force else _load_state(tree)
+    full = state is None or not tree.exists(WIDGET_PATH)
+    old_docs = {} if state is None else state["docs"]
+    next_id = 0 if state is None else state["next_id"]
+
+    entries = blog_index.collect(tree)
+    if full:
+        # Oldest first, so id order follows publish order (the widget's tie-break)
+        entries.sort(key=lambda e: (e[1]["date"], e[0]))
+        old_docs, next_id = {}, 0
+    docs, dirty_shards, dirty_docs, parsed = {}, set(), set(), 0
+    for name, card in entries:
+        rel = f"{BLOG_DIR}/{name}"
+        st = os.stat(tree.abspath(rel))
+        stamp = [st.st_mtime_ns, st.st_size]
+        row = _doc_row(name, card)
+        old = old_docs.get(name)
+        if old and old["stamp"] == stamp and old["row"] == row:
+            docs[name] = old
+            continue
+        meta = tree.meta(rel)
+        terms = document_terms({"title": card["title"], "category": card["category"],
+                                "keywords": meta["keywords"], "description": meta["description"]})
+        doc_id = old["id"] if old else next_id
+        next_id = max(next_id, doc_id + 1)
+        docs[name] = {"id": doc_id, "stamp": stamp, "row": row, "terms": terms}
+        dirty_shards.update(shard_of(t) for t in terms)
+        if old:
+            dirty_shards.update(shard_of(t) for t in old["terms"])
+        dirty_docs.add(doc_id)
+        parsed += 1
+    for name in set(old_docs) - set(docs):
+        dirty_shards.update(shard_of(t) for t in old_docs[name]["terms"])
+        dirty_docs.add(old_docs[name]["id"])
+
+    # Postings for every term, grouped by shard; rebuilt in memory from the state
+    index = {}
+    for doc in docs.values():
+        for term, weight in doc["terms"].items():
+            index.setdefault(shard_of(term), {}).setdefault(term, []).append((doc["id"], weight))
+    for shard in index.values():
+        for postings in shard.values():
+            postings.sort()
+    rows = [None] * next_id
+    for doc in docs.values():
+        rows[doc["id"]] = doc["row"]
+
+    if full:
+        dirty_shards = set(index) | {f[:-len(".json")] for f in _files(tree, "t")}
+        dirty_docs = set(range(next_id))
+    written = removed = 0
+    for prefix in sorted(dirty_shards):
+        path = f"{SEARCH_DIR}/t/{prefix}.json"
+        content = _render_shard(index, prefix)
+        if content is None:
+            if tree.exists(path):
+                tree.remove(path)
+                removed += 1
+        elif tree.write(path, content):
+            written += 1
+    chunks = {doc_id // DOC_CHUNK for doc_id in dirty_docs}
+    for chunk in sorted(chunks):
+        written += tree.write(f"{SEARCH_DIR}/d/{chunk}.json", _render_chunk(rows, chunk))
+    if full:
+        for f in _files(tree, "d"):
+            if int(f[:-len(".json")]) not in chunks:
+                tree.remove(f"{SEARCH_DIR}/d/{f}")
+                removed += 1
+    written += tree.write(WIDGET_PATH, render_widget())
+
+    os.makedirs(os.path.dirname(tree.abspath(STATE_PATH)), exist_ok=True)
+    write_if_changed(tree.abspath(STATE_PATH), json.dumps(
+        {"version": VERSION, "next_id": next_id, "docs": docs}, sort_keys=True, separators=(",", ":")) + "\n")
+    print(f"🔎 Search index: {len(docs)} posts ({parsed} indexed), {len(index)} shards "
+          f"({len(dirty_shards)} checked, {written} files written, {removed} removed)")
+    return written
+
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Service Worker
+
+Generates /sw.js, a service worker that keeps the site's shell, the blog
+index and the newest posts in the browser's Cache Storage. Many of our
+readers are on slow mobile or rural connections, and every visit used to
+refetch the same stylesheets, icon and blog index before anything could
+render; a repeat visit now paints from the cache, and recent posts stay
+readable offline.
+
+The precache manifest is inlined in sw.js as [url, revision] pairs, where
+the revision is a content hash of the file in the repo:
+    shell     styles.css, the app icon and App Store badge, the self-hosted
+              fonts (build_fonts.py), the post stylesheet
+              (blog/post.<hash>.css) and the search widget
+    pages     the blog index and the PRECACHE_POSTS newest posts
+              (newest by card date, from the card catalog, see blog_index.py)
+
+Publishing changes the revisions of the files that changed (the new post,
+the blog index), which changes the bytes of sw.js, so browsers install the
+new worker. Each entry is cached under "<url>?__rev=<revision>": on
+install only entries whose key is not cached yet are fetched, and on
+activation keys that are no longer in the manifest are deleted. A publish
+therefore downloads the new and changed files only, never the whole
+precache. Bump CACHE_VERSION to drop every cache at once.
+
+Fetch strategies:
+    blog pages (/blog/**.html)  stale-while-revalidate: answered from
+              the cache (pages visited before, else the precache) while a
+              fresh copy is fetched for next time; at most MAX_PAGES pages
+              are kept besides the precache
+    shell     cache-first from the precache
+    Unsplash photos and Google Fonts files
+              cache-first, at most RUNTIME_CACHES[...] entries each (oldest
+              dropped first); fetched with CORS so the cached copies are
+              not opaque responses, which browsers count as several MB each
+              against the storage quota
+    anything else goes straight to the network.
+
+Pages register the worker with REGISTER_SNIPPET before </body>: the post
+template renders it, and the "service-worker" rewrite rule set retrofits
+existing pages (the blog listings inherit it from blog/index.html).
+
+Usage (from the repo root):
+    python scripts/site_cli.py build --only sw
+    python scripts/site_cli.py rewrite --rules service-worker
+"""
+
+import json
+import hashlib
+
+import blog_index
+import build_fonts
+import post_styles
+import search_index
+from site_tree import SiteTree
+
+SW_PATH = "sw.js"
+SHELL_FILES = ["styles.css", "assets/icon.jpeg", "assets/app-store-badge.svg"]
+PRECACHE_POSTS = 10
+MAX_PAGES = 40
+# name -> (host, max entries); cache-first, oldest entries dropped first
+RUNTIME_CACHES = {
+    "images": ("images.unsplash.com", 60),
+    "fonts": ("fonts.gstatic.com", 30),
+}
+# Bump to drop every cache the worker created
+CACHE_VERSION = 1
+
+REGISTER_SNIPPET = '''<script>
+  if ('serviceWorker' in navigator) window.addEventListener('load', function() { navigator.serviceWorker.register('/sw.js'); });
+</script>'''
+
+# Vanilla JS worker. __CONFIG__ is replaced with the manifest and cache settings.
+WORKER_JS = r"""/* SteadiDay service worker (generated by scripts/service_worker.py) */
+'use strict';
+var C = __CONFIG__;
+var PRECACHE = 'steadiday-precache-v' + C.version, PAGES = 'steadiday-pages-v' + C.version;
+var CACHES = [PRECACHE, PAGES].concat(C.runtime.map(function (r) { return 'steadiday-' + r[0] + '-v' + C.version; }));
+var REVS = {};
+C.precache.forEach(function (e) { REVS[e[0]] = e[1]; });
+
+function key(path) {
+  return new URL(path + '?__rev=' + REVS[path], self.location).href;
+}
+
+function pathOf(url) {
+  var path = new URL(url).pathname;
+  return /\/$/.test(path) ? path + 'index.html' : path;
+}
+
+function trim(cache, max) {
+  return cache.keys().then(function (keys) {
+    return Promise.all(keys.slice(0, Math.max(0, keys.length - max)).map(function (k) { return cache.delete(k); }));
+  });
+}
+
+self.addEventListener('install', function (e) {
+  e.waitUntil(caches.open(PRECACHE).then(function (cache) {
+    return Promise.all(Object.keys(REVS).map(function (path) {
+      return cache.match(key(path)).then(function (hit) {
+        if (hit) return;
+        return fetch(path, {cache: 'no-cache'}).then(function (r) {
+          if (!r.ok) throw new Error(path + ': HTTP ' + r.status);
+          return cache.put(key(path), r);
+        });
+      });
+    }));
+  }).then(function () { return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function (e) {
+  e.waitUntil(caches.keys().then(function (names) {
+    return Promise.all(names.filter(function (name) {
+      return name.indexOf('steadiday-') === 0 && CACHES.indexOf(name) < 0;
+    }).map(function (name) { return caches.delete(name); }));
+  }).then(function () {
+    return Promise.all([caches.open(PRECACHE), caches.open(PAGES)]);
+  }).then(function (open) {
+    // Drop old revisions, and visited copies of pages the precache now has fresher
+    return open[0].keys().then(function (keys) {
+      return Promise.all(keys.map(function (k) {
+        var path = pathOf(k.url);
+        if (path in REVS && k.url === key(path)) return;
+        return Promise.all([open[0].delete(k), open[1].delete(path)]);
+      }));
+    });
+  }).then(function () { return self.clients.claim(); }));
+});
+
+function precached(e, path) {
+  return caches.open(PRECACHE).then(function (cache) {
+    return cache.match(key(path));
+  }).then(function (hit) { return hit || fetch(e.request); });
+}
+
+function staleWhileRevalidate(e, path) {
+  var network = fetch(e.request).then(function (r) {
+    if (r.ok && !r.redirected) {
+      var copy = r.clone();
+      e.waitUntil(caches.open(PAGES).then(function (cache) {
+        return cache.put(path, copy).then(function () { return trim(cache, C.maxPages); });
+      }));
+    }
+    return r;
+  });
+  return caches.open(PAGES).then(function (cache) {
+    return cache.match(path);
+  }).then(function (hit) {
+    return hit || (path in REVS ? caches.match(key(path), {cacheName: PRECACHE}) : null);
+  }).then(function (hit) {
+    if (!hit) return network;
+    e.waitUntil(network.catch(function () {}));
+    return hit;
+  });
+}
+
+function cacheFirst(e, name, max) {
+  var url = e.request.url;
+  return caches.open(name).then(function (cache) {
+    return cache.match(url).then(function (hit) {
+      if (hit) return hit;
+      return fetch(url, {mode: 'cors', credentials: 'omit'}).catch(function () {
+        return fetch(e.request);
+      }).then(function (r) {
+        if (r.ok) e.waitUntil(cache.put(url, r.clone()).then(function () { return trim(cache, max); }));
+        return r;
+      });
+    });
+  });
+}
+
+self.addEventListener('fetch', function (e) {
+  if (e.request.method !== 'GET') return;
+  var url = new URL(e.request.url);
+  if (url.origin === self.location.origin) {
+    var path = pathOf(url.href);
+    if (/^\/blog\/.*\.html$/.test(path)) e.respondWith(staleWhileRevalidate(e, path));
+    else if (path in REVS) e.respondWith(precached(e, path));
+    return;
+  }
+  C.runtime.forEach(function (r) {
+    if (url.hostname === r[1]) e.respondWith(cacheFirst(e, 'steadiday-' + r[0] + '-v' + C.version, r[2]));
+  });
+});
+"""
+
+
+def revision(tree, relpath):
+    """Content hash of a file, as its precache revision."""
+    with open(tree.abspath(relpath), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:10]
+
+
+def precache_files(tree, entries=None):
+    """Repo-relative paths of everything the worker precaches, shell first."""
+    entries = blog_index.collect(tree) if entries is None else entries
+    shell = (SHELL_FILES + build_fonts.font_files(tree)
+             + [f"{blog_index.BLOG_DIR}/{post_styles.stylesheet_name()}", search_index.WIDGET_PATH])
+    pages = [blog_index.INDEX_PATH] + [f"{blog_index.BLOG_DIR}/{name}" for name, _ in entries[:PRECACHE_POSTS]]
+    return [rel for rel in shell if tree.exists(rel)] + pages
+
+
+def manifest(tree, entries=None):
+    """[[url, revision], ...] for the precache."""
+    return [[f"/{rel}", revision(tree, rel)] for rel in precache_files(tree, entries)]
+
+
+def render_worker(entries):
+    config = {"version": CACHE_VERSION, "maxPages": MAX_PAGES,
+              "runtime": [[name, host, limit] for name, (host, limit) in RUNTIME_CACHES.items()]}
+    # One manifest entry per line, so a publish shows up as a small diff of sw.js
+    precache = ",\n  ".join(json.dumps(entry) for entry in entries)
+    config = json.dumps(config)[:-1] + f',\n "precache": [\n  {precache}\n ]}}'
+    return WORKER_JS.replace("__CONFIG__", config)
+
+
+def retrofit_register(match):
+    """Add the registration before </body>, once."""
+    if "serviceWorker.register" in match.string:
+        return match.group(0)
+    return REGISTER_SNIPPET + "\n" + match.group(0)
+
+
+def build(tree=None):
+    """Write sw.js for the current site. Returns True if it changed."""
+    tree = tree or SiteTree()
+    entries = manifest(tree)
+    changed = tree.write(SW_PATH, render_worker(entries))
+    print(f"📦 Service worker: {len(entries)} precached files, "
+          f"{'updated' if changed else 'unchanged'} ({SW_PATH})")
+    return changed
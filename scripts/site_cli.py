@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Site CLI
+
+One entry point for the site's build steps. `build` imports the existing
+scripts as libraries and runs them as an ordered pipeline in a single
+interpreter, against one shared SiteTree (scripts/site_tree.py), so each
+HTML file is read and parsed at most once per run.
+
+Each step is an Artifact in the incremental build graph
+(scripts/build_graph.py): it only runs when its inputs, generator source or
+config constants changed since the last build, and independent steps (RSS,
+search and sitemap) run in parallel. A no-op build stats files and writes nothing.
+
+Commands import the scripts they run when they run, so each starts with
+only what it needs; `publish` is the only one that loads the anthropic SDK
+(through post_writer.py). `benchmark.py --startup` times the imports of
+each command and flags any that pull in the SDK, NumPy, Pillow or fontTools.
+
+Pipeline (in order):
+    fix-urls   fix_blog_posts.scan_and_fix_blog_directory  (blog/)
+    related    related_posts.build                         (content/related.json, related blocks in posts)
+    posts      post_sources.rerender                       (blog/*.html from content/posts/*.json)
+    fonts      build_fonts.build                           (assets/fonts/, font block in all pages)
+    index      blog_index.build                            (blog/index.html, page/, category/)
+    gtag       inject_gtag.main                            (all pages)
+    rss        feeds.build_feeds                           (blog/rss.xml, blog/feed.json)
+    search     search_index.build                          (blog/search/, blog/search.js)
+    sw         service_worker.build                        (sw.js, precache manifest)
+    sitemap    generate_sitemap.main                       (sitemap.xml)
+    minify     minify_site.build_dist                      (_site/, size report)
+    indexnow   submit_to_indexnow.submit_urls              (no-op without INDEX_NOW_API_KEY)
+
+Usage (from the repo root):
+    python scripts/site_cli.py build                       # full pipeline
+    python scripts/site_cli.py build --skip indexnow       # everything but IndexNow
+    python scripts/site_cli.py build --only rss --only sitemap
+    python scripts/site_cli.py build --force               # ignore the build database, re-render every listing
+    python scripts/site_cli.py publish [topic] [--news]    # write a post, commit and push it (needs ANTHROPIC_API_KEY)
+    python scripts/site_cli.py publish --build-only [--dry-run]  # rebuild, commit and push the artifacts
+    python scripts/site_cli.py index [--force]             # blog listing pages from content/blog_index.json
+    python scripts/site_cli.py rss                         # blog/rss.xml and blog/feed.json
+    python scripts/site_cli.py sitemap                     # sitemap.xml
+    python scripts/site_cli.py search [--force]            # blog search index (blog/search/)
+    python scripts/site_cli.py related [--full]            # related-posts graph + "Related reading" blocks
+    python scripts/site_cli.py rerender                    # rebuild posts from content/posts/
+    python scripts/site_cli.py rerender --bootstrap        # first extract sources from post HTML
+    python scripts/site_cli.py rewrite --rules blog-urls --dry-run
+    python scripts/site_cli.py audit [--incremental]       # report in .site-build/audit.md
+    python scripts/site_cli.py duplicates [--threshold N]  # near-duplicate clusters + content/canonical_plan.json
+    python scripts/site_cli.py links                       # report in .site-build/links.md
+    python scripts/site_cli.py images                      # WebP/AVIF screenshots for index.html
+    python scripts/site_cli.py fonts [--force]             # subset self-hosted fonts (assets/fonts/src/)
+    python scripts/site_cli.py topics                      # refresh content/topics.json, show unused topics
+    python scripts/site_cli.py minify [--strict]           # _site/ + .site-build/size-report.md
+"""
+
+import os
+import sys
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from site_tree import SiteTree
+from build_graph import Artifact, BuildGraph
+
+
+def step_fix_urls(tree, ctx):
+    import fix_blog_posts
+    ctx["fix_urls"] = fix_blog_posts.scan_and_fix_blog_directory("blog", tree=tree)
+
+
+def step_related(tree, ctx):
+    import related_posts
+    related_posts.build(tree)
+
+
+def step_posts(tree, ctx):
+    import post_sources
+    if post_sources.list_sources(tree):
+        ctx["posts"] = post_sources.rerender(tree)
+
+
+def post_inputs(tree):
+    """Post sources plus what the rendered posts pull in: the related-posts
+    graph and card catalog (Related reading) and the font manifest (head)."""
+    import post_sources
+    return post_sources.list_sources(tree) + ["content/related.json", "content/blog_index.json",
+                                              "assets/fonts/manifest.json"]
+
+
+def step_fonts(tree, ctx):
+    import build_fonts
+    build_fonts.build(tree)
+
+
+def font_inputs(tree):
+    """Every page (for the characters in use) plus the vendored font sources."""
+    import build_fonts
+    return tree.html_files() + [f"{build_fonts.SOURCE_DIR}/{name}" for _, _, name in build_fonts.FACES]
+
+
+def step_index(tree, ctx):
+    import blog_index
+    blog_index.build(tree, force=ctx.get("force", False))
+
+
+def listing_inputs(tree):
+    """Posts, the card catalog and the index template (the listings themselves are outputs)."""
+    return tree.blog_posts() + ["blog/index.html", "content/blog_index.json"]
+
+
+def step_gtag(tree, ctx):
+    import inject_gtag
+    inject_gtag.main(tree.root, tree=tree, incremental=True)
+
+
+def step_rss(tree, ctx):
+    import feeds
+    feeds.build_feeds(tree, "blog")
+
+
+def step_search(tree, ctx):
+    import search_index
+    search_index.build(tree)
+
+
+def step_sw(tree, ctx):
+    import service_worker
+    service_worker.build(tree)
+
+
+def precache_inputs(tree):
+    import service_worker
+    return service_worker.precache_files(tree) + ["content/blog_index.json"]
+
+
+def step_sitemap(tree, ctx):
+    import generate_sitemap
+    ctx["sitemap_pages"] = generate_sitemap.main(tree=tree)
+
+
+def step_minify(tree, ctx):
+    import minify_site
+    ctx["size_report"] = minify_site.build_dist(tree)
+
+
+def served_files(tree):
+    import minify_site
+    return minify_site.served_files(tree)
+
+
+def step_indexnow(tree, ctx, days=2):
+    """Submit recently modified sitemap URLs, reusing the sitemap step's pages."""
+    import submit_to_indexnow
+    api_key = os.environ.get("INDEX_NOW_API_KEY")
+    if not api_key:
+        print("⚠️  INDEX_NOW_API_KEY not set. Skipping IndexNow submission.")
+        return False  # not recorded: submit once a key is configured
+    pages = ctx.get("sitemap_pages")
+    if pages is None:
+        urls = submit_to_indexnow.get_sitemap_urls(days_ago=days)
+    else:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+        urls = [p["url"] for p in pages if p["lastmod"] >= cutoff]
+    submit_to_indexnow.submit_urls(api_key, urls)
+
+
+def build_artifacts():
+    """The site's artifacts, in pipeline order, with their declared inputs."""
+    return [
+        Artifact(
+            "fix-urls", step_fix_urls,
+            inputs=lambda tree: tree.files_in("blog", recursive=True),
+            sources=["scripts/fix_blog_posts.py", "scripts/rewrite_engine.py"],
+            config=[("scripts/rewrite_rules.py", "CORRECT_DOMAIN"),
+                    ("scripts/rewrite_rules.py", "WRONG_DOMAINS")],
+        ),
+        Artifact(
+            "related", step_related,
+            inputs=listing_inputs,
+            sources=["scripts/related_posts.py", "scripts/search_index.py"],
+            config=[("scripts/related_posts.py", "RELATED_COUNT"),
+                    ("scripts/related_posts.py", "VERSION")],
+            deps=["fix-urls"],
+            outputs=["content/related.json"],
+        ),
+        Artifact(
+            "posts", step_posts,
+            inputs=post_inputs,
+            sources=["scripts/post_sources.py", "scripts/generate_blog.py", "scripts/post_styles.py",
+                     "scripts/related_posts.py", "scripts/inject_gtag.py", "scripts/tracking.py",
+                     "scripts/video_embeds.py", "scripts/responsive_images.py", "scripts/build_fonts.py"],
+            config=[("scripts/post_styles.py", "POST_CSS")],
+            deps=["related"],
+        ),
+        Artifact(
+            "fonts", step_fonts,
+            inputs=font_inputs,
+            sources=["scripts/build_fonts.py"],
+            config=[("scripts/build_fonts.py", "FACES"),
+                    ("scripts/build_fonts.py", "PRELOAD"),
+                    ("scripts/build_fonts.py", "VERSION")],
+            deps=["posts"],
+        ),
+        Artifact(
+            "index", step_index,
+            inputs=listing_inputs,
+            sources=["scripts/blog_index.py", "scripts/responsive_images.py"],
+            config=[("scripts/blog_index.py", "PAGE_SIZE"),
+                    ("scripts/blog_index.py", "VERSION")],
+            deps=["fonts"],
+        ),
+        Artifact(
+            "gtag", step_gtag,
+            inputs=lambda tree: tree.html_files(),
+            sources=["scripts/inject_gtag.py", "scripts/tracking.py"],
+            config=[("scripts/tracking.py", "GTAG_ID"),
+                    ("scripts/tracking.py", "CONVERSION_LABEL"),
+                    ("scripts/tracking.py", "MODE")],
+            deps=["index"],
+        ),
+        Artifact(
+            "rss", step_rss,
+            inputs=lambda tree: tree.blog_posts(),
+            sources=["scripts/feeds.py", "scripts/site_tree.py", "scripts/responsive_images.py"],
+            config=[("scripts/feeds.py", "WEBSITE_URL"),
+                    ("scripts/feeds.py", "FEED_SIZE")],
+            deps=["gtag"],
+            outputs=["blog/rss.xml", "blog/feed.json"],
+        ),
+        Artifact(
+            "search", step_search,
+            inputs=lambda tree: tree.blog_posts() + ["content/blog_index.json"],
+            sources=["scripts/search_index.py", "scripts/blog_index.py"],
+            config=[("scripts/search_index.py", "FIELD_WEIGHTS"),
+                    ("scripts/search_index.py", "VERSION")],
+            deps=["gtag"],
+            outputs=["blog/search.js"],
+        ),
+        Artifact(
+            "sw", step_sw,
+            inputs=precache_inputs,
+            sources=["scripts/service_worker.py", "scripts/blog_index.py", "scripts/post_styles.py"],
+            config=[("scripts/service_worker.py", "SHELL_FILES"),
+                    ("scripts/service_worker.py", "PRECACHE_POSTS"),
+                    ("scripts/service_worker.py", "MAX_PAGES"),
+                    ("scripts/service_worker.py", "RUNTIME_CACHES"),
+                    ("scripts/service_worker.py", "CACHE_VERSION")],
+            deps=["search"],
+            outputs=["sw.js"],
+        ),
+        Artifact(
+            "sitemap", step_sitemap,
+            inputs=lambda tree: tree.html_files(),
+            sources=["scripts/generate_sitemap.py"],
+            config=[("scripts/generate_sitemap.py", "WEBSITE_URL"),
+                    ("scripts/generate_sitemap.py", "PAGE_CONFIG"),
+                    ("scripts/generate_sitemap.py", "PILLAR_POSTS")],
+            deps=["gtag"],
+            outputs=["sitemap.xml"],
+        ),
+        Artifact(
+            "minify", step_minify,
+            inputs=served_files,
+            sources=["scripts/minify_site.py"],
+            config=[("scripts/minify_site.py", "BUDGETS")],
+            deps=["rss", "sw", "sitemap"],
+            outputs=["_site/index.html", "_site/sitemap.xml"],
+        ),
+        Artifact(
+            "indexnow", step_indexnow,
+            inputs=["sitemap.xml"],
+            deps=["sitemap"],
+        ),
+    ]
+
+
+STEP_NAMES = [a.name for a in build_artifacts()]
+
+
+def run_build(tree=None, skip=(), only=(), force=False):
+    """Run the stale part of the build pipeline. Returns the shared context dict."""
+    tree = tree or SiteTree()
+    unknown = (set(skip) | set(only)) - set(STEP_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown build step(s): {', '.join(sorted(unknown))}")
+
+    selected = [name for name in STEP_NAMES
+                if name not in skip and (not only or name in only)]
+    ctx = {"force": force}
+    status = BuildGraph(build_artifacts(), tree, force=force).run(selected, ctx)
+
+    print()
+    for name in STEP_NAMES:
+        icon = {"built": "✅", "fresh": "✔️ ", "skipped": "⏭️ "}[status[name]]
+        print(f"{icon} {name}: {status[name]}")
+    print(f"📊 Files read: {tree.reads} | Files written: {tree.writes}")
+    return ctx
+
+
+def cmd_build(args):
+    run_build(SiteTree(args.root), skip=args.skip, only=args.only, force=args.force)
+
+
+def cmd_publish(args):
+    import publish
+    post_args = None if args.build_only else ([args.topic] if args.topic else []) + (["--news"] if args.news else [])
+    try:
+        publish.run(SiteTree(args.root), post_args=post_args, message=args.message, dry_run=args.dry_run,
+                    push_to=None if args.no_push else args.remote, branch=args.branch, force=args.force)
+    except publish.PublishError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+def cmd_index(args):
+    import blog_index
+    blog_index.build(SiteTree(args.root), force=args.force)
+
+
+def cmd_related(args):
+    import related_posts
+    related_posts.build(SiteTree(args.root), full=args.full)
+
+
+def cmd_rss(args):
+    import feeds
+    feeds.build_feeds(SiteTree(args.root), "blog")
+
+
+def cmd_sitemap(args):
+    import generate_sitemap
+    generate_sitemap.main(tree=SiteTree(args.root))
+
+
+def cmd_search(args):
+    import search_index
+    search_index.build(SiteTree(args.root), force=args.force)
+
+
+def cmd_rerender(args):
+    import post_sources
+    tree = SiteTree(args.root)
+    if args.bootstrap:
+        print("📄 Extracting post sources...")
+        created, skipped = post_sources.bootstrap(tree)
+        print(f"📄 Sources created: {created} | Left as HTML: {len(skipped)}")
+    print("🔁 Re-rendering posts from sources...")
+    rendered, written = post_sources.rerender(tree, jobs=args.jobs)
+    print(f"📊 Posts rendered: {rendered} | Files written: {written}")
+    if written:
+        print("ℹ️  Run `build` to refresh the RSS feed and sitemap.")
+
+
+def cmd_rewrite(args):
+    from rewrite_engine import RewriteEngine, print_report
+    from rewrite_rules import RULE_SETS
+    rules = [rule for name in args.rules for rule in RULE_SETS[name]]
+    tree = SiteTree(args.root)
+    if "post-css" in args.rules and not args.dry_run:
+        import post_styles
+        post_styles.write_stylesheet(tree)
+    report = RewriteEngine(rules).run(tree, paths=args.paths or None, dry_run=args.dry_run)
+    print_report(report, rules, dry_run=args.dry_run)
+
+
+def cmd_audit(args):
+    import audit_site
+    report = audit_site.run_audit(SiteTree(args.root), incremental=args.incremental, jobs=args.jobs)
+    audit_site.print_summary(report)
+    if args.strict and report["summary"]["errors"]:
+        sys.exit(1)
+
+
+def cmd_duplicates(args):
+    import duplicate_audit
+    duplicate_audit.run(SiteTree(args.root), threshold=args.threshold)
+
+
+def cmd_links(args):
+    import check_links
+    check_links.run_check(SiteTree(args.root), concurrency=args.concurrency,
+                          per_host=args.per_host, force=args.force, host_delay=args.host_delay)
+
+
+def cmd_images(args):
+    import build_images
+    build_images.main(SiteTree(args.root), force=args.force, jobs=args.jobs)
+
+
+def cmd_fonts(args):
+    import build_fonts
+    build_fonts.build(SiteTree(args.root), force=args.force)
+
+
+def cmd_topics(args):
+    import topic_pool
+    topic_pool.main(SiteTree(args.root))
+
+
+def cmd_minify(args):
+    import minify_site
+    minify_site.main(SiteTree(args.root), strict=args.strict)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SteadiDay site tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Run the site build pipeline")
+    build.add_argument("--root", default=".", help="Repo root (default: .)")
+    build.add_argument("--skip", action="append", default=[], choices=STEP_NAMES,
+                       help="Skip a step (repeatable)")
+    build.add_argument("--only", action="append", default=[], choices=STEP_NAMES,
+                       help="Run only these steps (repeatable)")
+    build.add_argument("--force", action="store_true",
+                       help="Rebuild every selected step, ignoring the build database (and re-render every listing page)")
+    build.set_defaults(func=cmd_build)
+
+    publish = sub.add_parser("publish", help="Write a new post, or just rebuild, and push it all as one commit (publish.py)")
+    publish.add_argument("topic", nargs="?", default=None, help="Write about this topic (default: one from the topic pool)")
+    publish.add_argument("--news", action="store_true", help="Pick a topic from recent health news")
+    publish.add_argument("--root", default=".", help="Repo root (default: .)")
+    publish.add_argument("--build-only", action="store_true", help="Run the build pipeline instead of writing a post")
+    publish.add_argument("--force", action="store_true",
+                         help="With --build-only: ignore the build database, as `build --force`")
+    publish.add_argument("--dry-run", action="store_true", help="Print the files that would be committed; commit and push nothing")
+    publish.add_argument("-m", "--message", default=None, help="Commit message (default: the post title, or a rebuild message)")
+    publish.add_argument("--remote", default="origin", help="Remote name or path, e.g. a local bare repo (default: origin)")
+    publish.add_argument("--branch", default="main", help="Branch to push to (default: main)")
+    publish.add_argument("--no-push", action="store_true", help="Commit without fetching or pushing")
+    publish.set_defaults(func=cmd_publish)
+
+    index = sub.add_parser("index", help="Render the blog index, its pages and category listings")
+    index.add_argument("--root", default=".", help="Repo root (default: .)")
+    index.add_argument("--force", action="store_true", help="Re-render every listing page")
+    index.set_defaults(func=cmd_index)
+
+    related = sub.add_parser("related", help="Update the related-posts graph and related reading blocks")
+    related.add_argument("--root", default=".", help="Repo root (default: .)")
+    related.add_argument("--full", action="store_true", help="Recompute every pair instead of only new/removed posts")
+    related.set_defaults(func=cmd_related)
+
+    rss = sub.add_parser("rss", help="Build the RSS and JSON feeds")
+    rss.add_argument("--root", default=".", help="Repo root (default: .)")
+    rss.set_defaults(func=cmd_rss)
+
+    sitemap = sub.add_parser("sitemap", help="Regenerate sitemap.xml")
+    sitemap.add_argument("--root", default=".", help="Repo root (default: .)")
+    sitemap.set_defaults(func=cmd_sitemap)
+
+    search = sub.add_parser("search", help="Build the blog search index and widget")
+    search.add_argument("--root", default=".", help="Repo root (default: .)")
+    search.add_argument("--force", action="store_true", help="Re-index every post and rewrite every shard")
+    search.set_defaults(func=cmd_search)
+
+    rerender = sub.add_parser("rerender", help="Rebuild post HTML from content/posts/ sources")
+    rerender.add_argument("--root", default=".", help="Repo root (default: .)")
+    rerender.add_argument("--bootstrap", action="store_true",
+                          help="First create sources for posts that have none")
+    rerender.add_argument("--jobs", type=int, default=None,
+                          help="Worker processes (default: CPU count)")
+    rerender.set_defaults(func=cmd_rerender)
+
+    from rewrite_rules import RULE_SETS
+    rewrite = sub.add_parser("rewrite", help="Apply rewrite rule sets (scripts/rewrite_rules.py)")
+    rewrite.add_argument("paths", nargs="*", help="Repo-relative files (default: every file the rules cover)")
+    rewrite.add_argument("--root", default=".", help="Repo root (default: .)")
+    rewrite.add_argument("--rules", action="append", required=True, choices=sorted(RULE_SETS),
+                         help="Rule set to apply (repeatable)")
+    rewrite.add_argument("--dry-run", action="store_true", help="Print a diff instead of writing")
+    rewrite.set_defaults(func=cmd_rewrite)
+
+    audit = sub.add_parser("audit", help="SEO/consistency audit of every page")
+    audit.add_argument("--root", default=".", help="Repo root (default: .)")
+    audit.add_argument("--incremental", action="store_true",
+                       help="Re-audit only pages changed since the last report")
+    audit.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    audit.add_argument("--strict", action="store_true", help="Exit 1 if the audit finds errors")
+    audit.set_defaults(func=cmd_audit)
+
+    duplicates = sub.add_parser("duplicates", help="Find near-duplicate post clusters and propose canonicals")
+    duplicates.add_argument("--root", default=".", help="Repo root (default: .)")
+    duplicates.add_argument("--threshold", type=float, default=0.3,
+                            help="Cosine similarity at which two posts are duplicates (default: 0.3)")
+    duplicates.set_defaults(func=cmd_duplicates)
+
+    links = sub.add_parser("links", help="Check outbound links in blog posts")
+    links.add_argument("--root", default=".", help="Repo root (default: .)")
+    links.add_argument("--concurrency", type=int, default=32, help="Requests in flight (default: 32)")
+    links.add_argument("--per-host", type=int, default=2, help="Requests in flight per host (default: 2)")
+    links.add_argument("--host-delay", type=float, default=0.5,
+                       help="Minimum seconds between requests to one host (default: 0.5)")
+    links.add_argument("--force", action="store_true", help="Ignore cached results")
+    links.set_defaults(func=cmd_links)
+
+    images = sub.add_parser("images", help="Build responsive WebP/AVIF images for index.html (needs Pillow)")
+    images.add_argument("--root", default=".", help="Repo root (default: .)")
+    images.add_argument("--force", action="store_true", help="Re-encode every image")
+    images.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    images.set_defaults(func=cmd_images)
+
+    fonts = sub.add_parser("fonts", help="Subset the vendored web fonts to woff2 and self-host them (needs fontTools)")
+    fonts.add_argument("--root", default=".", help="Repo root (default: .)")
+    fonts.add_argument("--force", action="store_true", help="Re-subset every face to the characters in use now")
+    fonts.set_defaults(func=cmd_fonts)
+
+    topics = sub.add_parser("topics", help="Check content/topics.json against the archive and show unused topics")
+    topics.add_argument("--root", default=".", help="Repo root (default: .)")
+    topics.set_defaults(func=cmd_topics)
+
+    minify = sub.add_parser("minify", help="Write the minified site to _site/ and check page-weight budgets")
+    minify.add_argument("--root", default=".", help="Repo root (default: .)")
+    minify.add_argument("--strict", action="store_true", help="Exit 1 if a page is over budget")
+    minify.set_defaults(func=cmd_minify)
+
+    args = parser.parse_args(argv)
+
+    print("=" * 50)
+    print(f"🏗️  SteadiDay Site CLI: {args.command}")
+    print("=" * 50)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Site Tree
+
+Shared in-memory view of the site used by the build pipeline (site_cli.py).
+
+Every script used to walk the repo and re-read every page on its own. A
+SiteTree walks the tree once, reads each file at most once (the text is
+cached), parses page metadata at most once, and keeps the cache coherent
+when a step rewrites a file. Steps that are handed a tree therefore see
+each other's edits without going back to disk.
+
+Paths are always repo-relative with forward slashes ("blog/index.html").
+
+All writes go through write_if_changed(): atomic (temp file + rename) and
+skipped when the file already holds the same bytes, so a build that
+changes nothing leaves the working tree clean.
+"""
+
+import os
+import re
+import tempfile
+
+SKIP_DIRS = {'.git', 'node_modules', '.github', '__pycache__', '.site-build', '_site'}
+
+_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.DOTALL)
+_H1_RE = re.compile(r'<h1[^>]*>(.*?)</h1>', re.DOTALL)
+_DESC_RE = re.compile(r'<meta\s+name="description"\s+content="([^"]*)"')
+_KEYWORDS_RE = re.compile(r'<meta\s+name="keywords"\s+content="([^"]*)"')
+_CATEGORY_RE = re.compile(r'class="blog-card-tag">([^<]+)<')
+_CANONICAL_RE = re.compile(r'<link rel="canonical" href="([^"]+)"')
+_OG_IMAGE_RE = re.compile(r'<meta property="og:image" content="([^"]+)"')
+_PUBLISHED_RE = re.compile(r'<meta property="article:published_time" content="([^"]+)"')
+_DATE_PREFIX_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def write_if_changed(path, content):
+    """Atomically write `content` (str or bytes) to `path`.
+
+    Skips the write entirely when the file already holds exactly these
+    bytes. Returns True if the file was (re)written.
+    """
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return True
+
+
+def parse_page_meta(relpath, content):
+    """Extract the metadata the site scripts care about from one page."""
+    filename = relpath.rsplit('/', 1)[-1]
+
+    def first(pattern):
+        m = pattern.search(content)
+        return m.group(1).strip() if m else ""
+
+    raw_title = first(_TITLE_RE)
+    h1 = _TAG_RE.sub('', first(_H1_RE)).strip()
+    date_match = _DATE_PREFIX_RE.match(filename)
+    return {
+        "path": relpath,
+        "filename": filename,
+        # <title> without the " | SteadiDay Blog" suffix
+        "title": raw_title.split('|')[0].strip(),
+        "h1": h1,
+        "description": first(_DESC_RE),
+        "keywords": first(_KEYWORDS_RE),
+        "category": first(_CATEGORY_RE),
+        "canonical": first(_CANONICAL_RE),
+        "og_image": first(_OG_IMAGE_RE),
+        "published_time": first(_PUBLISHED_RE),
+        "date": date_match.group(1) if date_match else "",
+        "slug": re.sub(r'^\d{4}-\d{2}-\d{2}-', '', filename.replace('.html', '')),
+    }
+
+
+class SiteTree:
+    """Lazily-populated, write-through cache of the site's files."""
+
+    def __init__(self, root='.'):
+        self.root = root
+        self._html_files = None
+        self._text = {}
+        self._meta = {}
+        self.reads = 0
+        self.writes = 0
+
+    @classmethod
+    def for_blog_dir(cls, blog_dir="blog"):
+        """Build a tree rooted at the parent of `blog_dir`."""
+        return cls(os.path.dirname(os.path.normpath(blog_dir)) or '.')
+
+    def abspath(self, relpath):
+        return os.path.join(self.root, *relpath.split('/'))
+
+    def exists(self, relpath):
+        return relpath in self._text or os.path.exists(self.abspath(relpath))
+
+    def size(self, relpath):
+        """Byte size of the file, from the cache when it has been read."""
+        if relpath in self._text:
+            return len(self._text[relpath].encode('utf-8'))
+        return os.path.getsize(self.abspath(relpath))
+
+    def html_files(self):
+        """All .html files in the repo (walked once), sorted."""
+        if self._html_files is None:
+            found = []
+            for dirpath, dirnames, filenames in os.walk(self.root):
+                dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+                rel_dir = os.path.relpath(dirpath, self.root)
+                for f in filenames:
+                    if f.endswith('.html'):
+                        rel = f if rel_dir == '.' else f"{rel_dir}/{f}"
+                        found.append(rel.replace(os.sep, '/'))
+            self._html_files = sorted(found)
+        return list(self._html_files)
+
+    def files_in(self, directory, recursive=False):
+        """HTML files directly inside `directory` (or below it if recursive)."""
+        prefix = directory.strip('/') + '/' if directory not in ('', '.') else ''
+        out = []
+        for rel in self.html_files():
+            if not rel.startswith(prefix):
+                continue
+            if recursive or '/' not in rel[len(prefix):]:
+                out.append(rel)
+        return out
+
+    def blog_posts(self, blog_dir="blog"):
+        """Post pages in blog/ (everything except the index), newest name first."""
+        return sorted(
+            (rel for rel in self.files_in(blog_dir) if not rel.endswith('/index.html')),
+            reverse=True,
+        )
+
+    def read(self, relpath):
+        if relpath not in self._text:
+            # newline='' keeps CRLF files byte-identical on write-back
+            with open(self.abspath(relpath), 'r', encoding='utf-8', newline='') as f:
+                self._text[relpath] = f.read()
+            self.reads += 1
+        return self._text[relpath]
+
+    def write(self, relpath, content):
+        """Write through the cache. Returns False when the bytes were unchanged."""
+        if self._text.get(relpath) == content:
+            return False
+        changed = write_if_changed(self.abspath(relpath), content)
+        if changed:
+            self.writes += 1
+        self._text[relpath] = content
+        self._meta.pop(relpath, None)
+        if relpath.endswith('.html') and self._html_files is not None and relpath not in self._html_files:
+            self._html_files = sorted(self._html_files + [relpath])
+        return changed
+
+    def remove(self, relpath):
+        """Delete a file and forget it."""
+        os.remove(self.abspath(relpath))
+        self.writes += 1
+        self._text.pop(relpath, None)
+        self._meta.pop(relpath, None)
+        if self._html_files is not None and relpath in self._html_files:
+            self._html_files = [rel for rel in self._html_files if rel != relpath]
+
+    def meta(self, relpath):
+        """Parsed page metadata; each file is parsed at most once per content."""
+        if relpath not in self._meta:
+            self._meta[relpath] = parse_page_meta(relpath, self.read(relpath))
+        return self._meta[relpath]
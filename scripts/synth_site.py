@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Synthetic Site Generator
+
+Builds a fake copy of the site with an arbitrary number of posts, rendered
+with the real generate_blog.get_html_template(), for benchmarking the site
+scripts at sizes the real blog will not reach for years (see benchmark.py).
+
+The output is deterministic for a given (posts, seed) and mimics the real
+tree closely enough to exercise every code path:
+  - blog/<date>-<slug>.html posts with figures, a video and study links
+  - content/blog_index.json with a card (and category) per post, and the
+    blog listing pages blog_index.py renders from it
+  - content/topics.json with the repo's topic pool, all topics unused and
+    every post already checked against it
+  - top-level pages from generate_sitemap.PAGE_CONFIG
+  - a share of posts still pointing at the old github.io domain (for
+    fix_blog_posts) and a share without the gtag snippets (for inject_gtag)
+
+A 100k-post site is roughly 2 GB on disk, so write it outside the repo.
+
+Usage:
+    python scripts/synth_site.py 1000 /tmp/steadiday-1k
+    python scripts/synth_site.py 100000 /tmp/steadiday-100k --seed 7
+"""
+
+import os
+import random
+import contextlib
+import argparse
+from datetime import datetime, timedelta
+
+import tracking
+from site_tree import SiteTree
+
+WORDS = ("health balance memory sleep heart walking vitamin routine friends family "
+         "doctor research study morning evening water protein strength brain joint "
+         "habit medication reminder caregiver community garden recipe exercise calm "
+         "stretch blood pressure hearing vision dental bone muscle energy mood").split()
+
+START_DATE = datetime(2026, 1, 1)
+POSTS_PER_DAY = 4
+WRONG_DOMAIN_SHARE = 0.05
+UNTAGGED_SHARE = 0.05
+
+
+def _sentence(rng, n):
+    words = [rng.choice(WORDS) for _ in range(n)]
+    return " ".join(words).capitalize() + "."
+
+
+def _photo_url(rng, width):
+    return (f"https://images.unsplash.com/photo-{rng.randrange(10**12, 10**13)}-"
+            f"{rng.getrandbits(48):012x}?w={width}&q=80")
+
+
+def make_post(i, rng, categories, layouts):
+    """Post dict in the shape generate_blog.generate_blog_post() returns."""
+    title = _sentence(rng, rng.randint(6, 10))[:-1]
+    slug = f"{'-'.join(title.lower().split()[:5])}-{i}"
+    date = (START_DATE - timedelta(days=i // POSTS_PER_DAY)).strftime('%Y-%m-%d')
+    num_images = rng.randint(0, 4)
+    layout = rng.choice(layouts)
+    parts = [f"<p>{_sentence(rng, 30)} {_sentence(rng, 20)}</p>"]
+    for s in range(6):
+        parts.append(f"<h2>{_sentence(rng, 6)[:-1]}</h2>")
+        parts.append(f'<p>{_sentence(rng, 25)} <a href="https://www.nih.gov/study-{i}-{s}" '
+                     f'target="_blank" rel="noopener">{_sentence(rng, 4)[:-1]}</a> {_sentence(rng, 30)}</p>')
+        parts.append(f"<p>{_sentence(rng, 40)}</p>")
+        if s < num_images:
+            parts.append(f"[IMAGE_{s + 1}]")
+        if s == 3:
+            parts.append("[VIDEO]")
+    return {
+        "title": title,
+        "meta_description": _sentence(rng, 22),
+        "keywords": ", ".join(rng.sample(WORDS, 4)),
+        "read_time": str(rng.randint(5, 9)),
+        "category": rng.choice(categories),
+        "date": date,
+        "slug": slug,
+        "hero_image": _photo_url(rng, 1200),
+        "body": "\n\n".join(parts),
+        "media": {
+            "images": [{"url": _photo_url(rng, 800), "alt": _sentence(rng, 8)[:-1],
+                        "layout": layout[k % len(layout)]} for k in range(num_images)],
+            "video": {"id": f"{rng.getrandbits(64):011x}"[:11], "title": _sentence(rng, 4)[:-1],
+                      "channel": "Mayo Clinic"},
+        },
+    }
+
+
+def _page(title, body=""):
+    return (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n'
+            f'<title>{title}</title>\n</head>\n<body>\n{body}\n</body>\n</html>\n')
+
+
+def generate(num_posts, out_dir, seed=42):
+    """Write a synthetic site with `num_posts` posts to `out_dir`."""
+    import blog_index
+    import generate_blog
+    import generate_sitemap
+    import inject_gtag
+    import post_styles
+    import topic_pool
+
+    rng = random.Random(seed)
+    blog_dir = os.path.join(out_dir, "blog")
+    os.makedirs(blog_dir, exist_ok=True)
+
+    post_styles.write_stylesheet(SiteTree(out_dir))
+    cards = {}
+    for i in range(num_posts):
+        post = make_post(i, rng, generate_blog.VALID_CATEGORIES, generate_blog.IMAGE_LAYOUT_PATTERNS)
+        html, filename = generate_blog.create_blog_html(post)
+        if rng.random() < UNTAGGED_SHARE:
+            # Strip the snippets so inject_gtag has real work to do
+            html = html.replace(tracking.gtag_snippet() + "\n", "")
+            html = html.replace(tracking.CONVERSION_SNIPPET + "\n", "")
+        else:
+            html, _ = inject_gtag.inject_into_content(html)
+        if rng.random() < WRONG_DOMAIN_SHARE:
+            html = html.replace(generate_blog.WEBSITE_URL, "https://scm-solutions-llc.github.io/steadiday")
+        with open(os.path.join(blog_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(html)
+        cards[filename] = blog_index.card_from_post(post, post["hero_image"])
+        if (i + 1) % 10000 == 0:
+            print(f"  {i + 1:,} posts written")
+
+    tree = SiteTree(out_dir)
+    blog_index.save_cards(tree, cards)
+    tree.write(blog_index.INDEX_PATH, _page("SteadiDay Blog", '<div class="blog-grid">\n'
+                                             '<!--BLOG_ENTRIES_START--><!--BLOG_ENTRIES_END-->\n</div>'))
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        blog_index.build(tree)
+    pool = topic_pool.load(SiteTree(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    for topic in pool["topics"]:
+        topic["used_by"] = None
+    pool["posts"] = set(cards)
+    topic_pool.save(tree, pool)
+    for page in generate_sitemap.PAGE_CONFIG:
+        if '/' not in page:
+            with open(os.path.join(out_dir, page), 'w', encoding='utf-8') as f:
+                f.write(_page(f"SteadiDay {page}"))
+    return out_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic SteadiDay site")
+    parser.add_argument("posts", type=int, help="Number of posts")
+    parser.add_argument("out_dir", help="Output directory (created if needed)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    print("=" * 50)
+    print(f"🧪 Synthetic site: {args.posts:,} posts -> {args.out_dir}")
+    print("=" * 50)
+    generate(args.posts, args.out_dir, args.seed)
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Topic Pool
+
+The evergreen topics the generator picks from when it is not writing a
+news-driven post, kept in content/topics.json with what has been used.
+They used to be a 170-entry TOPIC_CATEGORIES literal in generate_blog.py,
+and select_unique_topic() shuffled it and ran the title/slug/keyword
+duplicate check of every topic against every post, on every run, to
+rediscover which topics were already covered.
+
+Each topic in the file carries, besides topic/keyword/category:
+    id        stable slug of the topic
+    norm      normalize_text(topic), and slug, the normalized first five
+              words, as the duplicate check compares them
+    words     its content words (get_content_words)
+    shingles  character 3-grams of norm and slug
+    used_by   the post (file name) that covers it, or null
+and "posts" lists every post already checked against the pool.
+
+reconcile() checks only what is new: posts not in "posts" against the
+unused topics, and topics without derived fields (just added by hand)
+against every post. A pair is only run through is_duplicate() when it
+shares a shingle or content word; pairs with no 3-gram in common are far
+below the similarity thresholds. Covered topics get used_by.
+
+select() then needs no post scanning at all: unused topics are grouped by
+category, a category outside the cooldown is drawn with weight equal to its
+unused count (the same odds as the old shuffle), then a topic within it.
+record_publish() marks the published post's topic, checks the new post
+against the rest, and writes the file atomically.
+
+To add topics, append {"topic", "keyword", "category"} entries to
+content/topics.json and run `python scripts/site_cli.py topics`, which
+fills in the derived fields and checks them against the archive.
+
+Usage (from the repo root):
+    python scripts/site_cli.py topics
+"""
+
+import re
+import json
+import random
+from difflib import SequenceMatcher
+
+from site_tree import SiteTree
+
+POOL_PATH = "content/topics.json"
+CATEGORY_COOLDOWN_WINDOW = 4
+SHINGLE_SIZE = 3
+# Bump when normalization or the derived fields change; every topic is
+# re-derived and re-checked against every post
+VERSION = 1
+
+STOPWORDS = {'the','a','an','for','and','or','to','of','in','your','how','that','with','after','from','is','are','was','were','be','been','being','have','has','had','do','does','did','will','would','could','should','may','might','can','this','these','those','it','its','you','we','they','them','our','my','me','what','which','who','whom','when','where','why','not','no','so','if','but','as','at','by','on','up','about','into','over','than','then','too','very','just','also','more','most','some','any','all','each','every','simple','easy','best','top','guide','tips','ways','adults','seniors','50','over','after','really','complete','natural','naturally','better','healthy','health','improve'}
+
+
+# --- Duplicate check ---
+
+def normalize_text(text):
+    text = text.lower().strip()
+    text = re.sub(r'[^a-z0-9\s]', '', text)
+    return re.sub(r'\s+', ' ', text)
+
+
+def get_content_words(text):
+    return set(normalize_text(text).split()) - STOPWORDS
+
+
+def topic_slug(text):
+    return '-'.join(normalize_text(text).split()[:5])
+
+
+def _shingles(*texts):
+    return {t[i:i + SHINGLE_SIZE] for t in texts for i in range(len(t) - SHINGLE_SIZE + 1)}
+
+
+def prepare(title, slug):
+    """The fields the duplicate check compares, for a title and its slug."""
+    norm, slug_norm = normalize_text(title), normalize_text(slug)
+    return {"norm": norm, "slug": slug_norm, "words": sorted(get_content_words(title)),
+            "shingles": sorted(_shingles(norm, slug_norm))}
+
+
+def similar(new, post, threshold_title=0.55, threshold_slug=0.65):
+    """(duplicate, reason) for two prepare()d records."""
+    ratio = SequenceMatcher(None, new["norm"], post["norm"]).ratio()
+    if ratio >= threshold_title:
+        return True, f"Title similarity {ratio:.2f}"
+    ratio = SequenceMatcher(None, new["slug"], post["slug"]).ratio()
+    if ratio >= threshold_slug:
+        return True, f"Slug similarity {ratio:.2f}"
+    new_words, existing_words = set(new["words"]), set(post["words"])
+    if new_words and existing_words:
+        overlap = new_words & existing_words
+        min_len = min(len(new_words), len(existing_words))
+        if min_len > 0 and len(overlap) >= 2 and len(overlap) / min_len >= 0.6:
+            return True, f"Keyword overlap ({overlap})"
+    return False, ""
+
+
+def is_duplicate(new_title, new_slug, existing_posts, threshold_title=0.55, threshold_slug=0.65):
+    new = prepare(new_title, new_slug)
+    for post in existing_posts:
+        dup, reason = similar(new, prepare(post['title'], post['slug']), threshold_title, threshold_slug)
+        if dup:
+            return (True, reason, post['filename'])
+    return (False, "", "")
+
+
+def _may_match(a, b):
+    """Cheap screen before similar(): no shared 3-gram or content word, no match."""
+    return not (a["shingles_set"].isdisjoint(b["shingles_set"]) and a["words_set"].isdisjoint(b["words_set"]))
+
+
+def _indexed(record):
+    record["shingles_set"], record["words_set"] = set(record["shingles"]), set(record["words"])
+    return record
+
+
+# --- Pool file ---
+
+def _derive(topic, taken):
+    """Fill in a topic's id and duplicate-check fields."""
+    topic.update(prepare(topic["topic"], topic_slug(topic["topic"])))
+    base = '-'.join(topic["norm"].split()[:8])
+    topic_id, n = base, 2
+    while topic_id in taken:
+        topic_id, n = f"{base}-{n}", n + 1
+    topic["id"] = topic_id
+    topic.setdefault("used_by", None)
+    taken.add(topic_id)
+
+
+def load(tree=None):
+    """The pool from content/topics.json. Topics without derived fields (or
+    from an older VERSION) are marked "new" for reconcile()."""
+    tree = tree or SiteTree()
+    data = json.loads(tree.read(POOL_PATH))
+    stale = data.get("version") != VERSION
+    topics = data["topics"]
+    taken = {t["id"] for t in topics if "id" in t and not stale}
+    for topic in topics:
+        if stale or "norm" not in topic:
+            _derive(topic, taken)
+            topic["new"] = True
+    return {"posts": set() if stale else set(data.get("posts", [])), "topics": topics}
+
+
+def save(tree, pool):
+    """Write the pool atomically, one topic per line so diffs stay readable."""
+    fields = ("id", "topic", "keyword", "category", "used_by", "norm", "slug", "words", "shingles")
+    topics = ",\n  ".join(json.dumps({k: t[k] for k in fields}, ensure_ascii=False) for t in pool["topics"])
+    posts = ",\n  ".join(json.dumps(p) for p in sorted(pool["posts"]))
+    tree.write(POOL_PATH, f'{{"version": {VERSION},\n "topics": [\n  {topics}\n ],\n'
+                          f' "posts": [\n  {posts}\n ]}}\n')
+
+
+def reconcile(pool, existing_posts):
+    """Mark topics covered by posts not checked yet, and check new topics
+    against every post. Returns the number of topics newly marked used."""
+    topics = [_indexed(t) for t in pool["topics"]]
+    # Only posts something is checked against are prepared: all of them if a
+    # topic is new, else the ones not checked yet
+    check_all = any(t.get("new") and t["used_by"] is None for t in topics)
+    posts = [(post['filename'], _indexed(prepare(post['title'], post['slug'])))
+             for post in existing_posts
+             if (check_all or post['filename'] not in pool["posts"]) and (post['title'] or post['slug'])]
+    unseen = [p for p in posts if p[0] not in pool["posts"]]
+    marked = 0
+    for topic in topics:
+        if topic["used_by"] is not None:
+            continue
+        for filename, post in (posts if topic.get("new") else unseen):
+            if _may_match(topic, post) and similar(topic, post)[0]:
+                topic["used_by"] = filename
+                marked += 1
+                break
+    for topic in topics:
+        topic.pop("new", None)
+        del topic["shingles_set"], topic["words_set"]
+    pool["posts"].update(p['filename'] for p in existing_posts)
+    return marked
+
+
+def unused_by_category(pool):
+    groups = {}
+    for topic in pool["topics"]:
+        if topic["used_by"] is None:
+            groups.setdefault(topic["category"], []).append(topic)
+    return groups
+
+
+def get_recent_categories(existing_posts, window=CATEGORY_COOLDOWN_WINDOW):
+    return [post.get('category', '') for post in existing_posts[:window] if post.get('category')]
+
+
+def select(pool, recent_categories, rng=random):
+    """An unused topic outside the recent categories (any unused topic if
+    they are exhausted), or None once the pool is used up."""
+    groups = unused_by_category(pool)
+    eligible = {c: ts for c, ts in groups.items() if c not in recent_categories}
+    if not eligible:
+        print("  All non-recent categories exhausted, relaxing cooldown...")
+        eligible = groups
+    if not eligible:
+        return None
+    categories = sorted(eligible)
+    category = rng.choices(categories, weights=[len(eligible[c]) for c in categories])[0]
+    topic = rng.choice(eligible[category])
+    return {k: topic[k] for k in ("id", "topic", "keyword", "category")}
+
+
+def record_publish(tree, pool, post, filename, topic_id=None):
+    """Mark the published post's topic (and any other it covers) as used and save."""
+    for topic in pool["topics"]:
+        if topic["id"] == topic_id:
+            topic["used_by"] = filename
+    reconcile(pool, [{"filename": filename, "title": post["title"], "slug": post["slug"]}])
+    save(tree, pool)
+
+
+def main(tree=None):
+    """Refresh derived fields, check the archive against the pool and print usage."""
+    import generate_blog
+    tree = tree or SiteTree()
+    pool = load(tree)
+    marked = reconcile(pool, generate_blog.get_existing_posts(tree=tree))
+    save(tree, pool)
+    groups = unused_by_category(pool)
+    unused = sum(len(ts) for ts in groups.values())
+    print(f"📚 Topic pool: {len(pool['topics'])} topics, {unused} unused, {marked} newly marked used")
+    for category in sorted({t["category"] for t in pool["topics"]}):
+        print(f"  {category:<20} {len(groups.get(category, [])):>3} unused")
+    return pool
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Tracking Snippets
+
+The one definition of the Google tag (gtag.js) and App Store conversion
+snippets. generate_blog.get_html_template() renders them into new posts
+and inject_gtag.py normalizes every page to them, so the two can no
+longer drift apart (they had: the template reported App Store clicks to
+one conversion label and the injector to another, and posts carrying
+both fired two conversions per click).
+
+Two loading modes:
+    eager     the standard snippet: gtag.js is fetched from <head> right
+              away, competing with fonts and the hero image
+    deferred  (default) gtag() calls are queued in dataLayer as usual, but
+              gtag.js is only fetched on the first interaction (pointer,
+              key, touch, scroll) or once the page is idle after load
+
+The conversion snippet is the same in both modes. It listens for App Store
+link clicks on the document, queues the conversion, starts loading gtag.js
+if it has not loaded yet, and delays same-tab navigation until the tag
+confirms the hit (event_callback) or one second has passed, so clicks made
+before gtag.js arrived are still counted.
+"""
+
+GTAG_ID = "AW-17929124014"
+
+# The App Store click conversion from Google Ads
+CONVERSION_LABEL = f"{GTAG_ID}/gtKACKzG_Y8cEK7xouVC"
+
+# Loading mode for pages that do not ask for one: "deferred" or "eager"
+MODE = "deferred"
+MODES = ("deferred", "eager")
+
+GTAG_JS_URL = "https://www.googletagmanager.com/gtag/js?id="
+EAGER_COMMENT = "<!-- Google tag (gtag.js) -->"
+DEFERRED_COMMENT = "<!-- Google tag (gtag.js), loaded on first interaction or when idle -->"
+CONVERSION_COMMENT = "<!-- Google Ads: App Store click conversion tracking -->"
+
+
+def gtag_snippet(config_ids=(GTAG_ID,), mode=MODE):
+    """<head> snippet configuring `config_ids`; gtag.js is loaded per `mode`."""
+    configs = "".join(f"\n  gtag('config', '{tag_id}');" for tag_id in config_ids)
+    bootstrap = f'''<script>
+  window.dataLayer = window.dataLayer || [];
+  function gtag(){{dataLayer.push(arguments);}}
+  gtag('js', new Date());{configs}'''
+    if mode == "eager":
+        return f'''{EAGER_COMMENT}
+<script async src="{GTAG_JS_URL}{config_ids[0]}"></script>
+{bootstrap}
+</script>'''
+    return f'''{DEFERRED_COMMENT}
+{bootstrap}
+  (function() {{
+    var loaded = false;
+    window.loadGtag = function() {{
+      if (loaded) return;
+      loaded = true;
+      var s = document.createElement('script');
+      s.async = true;
+      s.src = '{GTAG_JS_URL}{config_ids[0]}';
+      document.head.appendChild(s);
+    }};
+    ['pointerdown', 'keydown', 'touchstart', 'scroll'].forEach(function(type) {{
+      window.addEventListener(type, window.loadGtag, {{once: true, passive: true}});
+    }});
+    window.addEventListener('load', function() {{
+      if ('requestIdleCallback' in window) requestIdleCallback(window.loadGtag, {{timeout: 5000}});
+      else setTimeout(window.loadGtag, 3000);
+    }});
+  }})();
+</script>'''
+
+
+CONVERSION_SNIPPET = f'''{CONVERSION_COMMENT}
+<script>
+  document.addEventListener('click', function(e) {{
+    var link = e.target.closest && e.target.closest('a[href*="apps.apple.com"]');
+    if (!link || typeof gtag !== 'function') return;
+    // Same-tab navigation waits for the hit (or 1s) so the conversion is not lost
+    var sameTab = !link.target && e.button === 0 && !(e.metaKey || e.ctrlKey || e.shiftKey || e.altKey);
+    var done = false;
+    function go() {{ if (!done) {{ done = true; window.location.href = link.href; }} }}
+    gtag('event', 'conversion', {{
+      'send_to': '{CONVERSION_LABEL}',
+      'value': 1.0,
+      'currency': 'USD',
+      'event_callback': sameTab ? go : undefined
+    }});
+    if (window.loadGtag) window.loadGtag();
+    if (sameTab) {{
+      e.preventDefault();
+      setTimeout(go, 1000);
+    }}
+  }});
+</script>'''
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+SteadiDay Video Embeds
+
+Click-to-load YouTube facades for blog posts. A YouTube <iframe> pulls in
+the player scripts (hundreds of KB over dozens of requests) on every page
+view, whether or not anyone presses play, and fix-youtube-embeds.sh had to
+drop loading="lazy" from them, so they all loaded up front.
+
+A post now ships a static thumbnail from i.ytimg.com with a play button,
+inside a link to the video on YouTube (which still works without
+JavaScript). A few bytes of inline script swap in the real iframe, with
+autoplay, when the link is clicked. The accessible title goes on the link
+and on the iframe, and the "Video: title -- channel" caption is unchanged.
+
+generate_blog.render_body() emits facades for new posts; the
+"youtube-facade" rewrite rule set (scripts/rewrite_rules.py) converts the
+iframes in existing posts.
+"""
+
+EMBED_URL = "https://www.youtube.com/embed/"
+IFRAME_ALLOW = "accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share"
+
+# Binds the facade it sits in (its parent), then is thrown away with it
+FACADE_SCRIPT = (
+    "<script>(function(f){f.firstChild.addEventListener('click',function(e){e.preventDefault();"
+    "var i=document.createElement('iframe');"
+    f"i.src='{EMBED_URL}'+f.dataset.videoId+'?autoplay=1';i.title=f.dataset.title;"
+    f"i.allow='{IFRAME_ALLOW}';i.referrerPolicy='strict-origin-when-cross-origin';"
+    "i.allowFullscreen=true;f.replaceChildren(i);i.focus();});})(document.currentScript.parentNode);</script>"
+)
+
+
+def facade(video_id, title, caption):
+    """Facade markup plus caption for one video. `title` and `caption` are HTML."""
+    return (f'<div class="video-container video-facade" data-video-id="{video_id}" data-title="{title}">'
+            f'<a class="video-play" href="https://www.youtube.com/watch?v={video_id}" aria-label="Play video: {title}">'
+            f'<img src="https://i.ytimg.com/vi/{video_id}/hqdefault.jpg" alt="" width="480" height="360" '
+            f'loading="lazy" decoding="async"><span class="video-play-icon"></span></a>{FACADE_SCRIPT}</div>'
+            f'<p class="video-caption">Video: {caption}</p>')
+
+
+# --- Retrofit of existing posts (the "youtube-facade" rewrite rule set) ---
+
+# Any of the iframe variants the generator and fix-youtube-embeds.sh produced
+IFRAME_PATTERN = (r'<div class="video-container"><iframe src="https://www\.youtube(?:-nocookie)?\.com/embed/'
+                  r'([\w-]+)" title="([^"]*)"[^>]*></iframe></div><p class="video-caption">Video: ([^<]*)</p>')
+
+
+def retrofit_iframe(match):
+    return facade(*match.group(1, 2, 3))
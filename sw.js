@@ -0,0 +1,129 @@
+/* SteadiDay service worker (generated by scripts/service_worker.py) */
+'use strict';
+var C = {"version": 1, "maxPages": 40, "runtime": [["images", "images.unsplash.com", 60], ["fonts", "fonts.gstatic.com", 30]],
+ "precache": [
+  ["/styles.css", "8b1ab743ea"],
+  ["/assets/icon.jpeg", "f195487725"],
+  ["/assets/app-store-badge.svg", "a26fc5b383"],
+  ["/blog/post.bb7c65e08a.css", "bb7c65e08a"],
+  ["/blog/search.js", "594ad6f298"],
+  ["/blog/index.html", "8025ef1a68"],
+  ["/blog/2026-05-14-smart-home-devices-that-help.html", "4c0ce91873"],
+  ["/blog/2026-05-11-daytime-napping-and-mortality-risk.html", "0978a3ef77"],
+  ["/blog/2026-05-07-5-things-we-wish-wed.html", "eaa460134d"],
+  ["/blog/2026-05-04-athome-alzheimers-injection-whats-coming.html", "1aaffd653e"],
+  ["/blog/2026-04-30-medication-routine-tips-that-actually.html", "b3c9b650d9"],
+  ["/blog/2026-04-27-daytime-naps-after-56-what.html", "ed56e5926c"],
+  ["/blog/2026-04-23-testosterone-therapy-for-men-over.html", "510d1d98d5"],
+  ["/blog/2026-04-20-vitamin-d-your-midlife-brain.html", "d6090461b7"],
+  ["/blog/2026-04-18-your-smile-after-50-a.html", "838f34f291"],
+  ["/blog/2026-04-13-new-2026-heart-guidelines-whats.html", "a80175e6d1"]
+ ]};
+var PRECACHE = 'steadiday-precache-v' + C.version, PAGES = 'steadiday-pages-v' + C.version;
+var CACHES = [PRECACHE, PAGES].concat(C.runtime.map(function (r) { return 'steadiday-' + r[0] + '-v' + C.version; }));
+var REVS = {};
+C.precache.forEach(function (e) { REVS[e[0]] = e[1]; });
+
+function key(path) {
+  return new URL(path + '?__rev=' + REVS[path], self.location).href;
+}
+
+function pathOf(url) {
+  var path = new URL(url).pathname;
+  return /\/$/.test(path) ? path + 'index.html' : path;
+}
+
+function trim(cache, max) {
+  return cache.keys().then(function (keys) {
+    return Promise.all(keys.slice(0, Math.max(0, keys.length - max)).map(function (k) { return cache.delete(k); }));
+  });
+}
+
+self.addEventListener('install', function (e) {
+  e.waitUntil(caches.open(PRECACHE).then(function (cache) {
+    return Promise.all(Object.keys(REVS).map(function (path) {
+      return cache.match(key(path)).then(function (hit) {
+        if (hit) return;
+        return fetch(path, {cache: 'no-cache'}).then(function (r) {
+          if (!r.ok) throw new Error(path + ': HTTP ' + r.status);
+          return cache.put(key(path), r);
+        });
+      });
+    }));
+  }).then(function () { return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function (e) {
+  e.waitUntil(caches.keys().then(function (names) {
+    return Promise.all(names.filter(function (name) {
+      return name.indexOf('steadiday-') === 0 && CACHES.indexOf(name) < 0;
+    }).map(function (name) { return caches.delete(name); }));
+  }).then(function () {
+    return Promise.all([caches.open(PRECACHE), caches.open(PAGES)]);
+  }).then(function (open) {
+    // Drop old revisions, and visited copies of pages the precache now has fresher
+    return open[0].keys().then(function (keys) {
+      return Promise.all(keys.map(function (k) {
+        var path = pathOf(k.url);
+        if (path in REVS && k.url === key(path)) return;
+        return Promise.all([open[0].delete(k), open[1].delete(path)]);
+      }));
+    });
+  }).then(function () { return self.clients.claim(); }));
+});
+
+function precached(e, path) {
+  return caches.open(PRECACHE).then(function (cache) {
+    return cache.match(key(path));
+  }).then(function (hit) { return hit || fetch(e.request); });
+}
+
+function staleWhileRevalidate(e, path) {
+  var network = fetch(e.request).then(function (r) {
+    if (r.ok && !r.redirected) {
+      var copy = r.clone();
+      e.waitUntil(caches.open(PAGES).then(function (cache) {
+        return cache.put(path, copy).then(function () { return trim(cache, C.maxPages); });
+      }));
+    }
+    return r;
+  });
+  return caches.open(PAGES).then(function (cache) {
+    return cache.match(path);
+  }).then(function (hit) {
+    return hit || (path in REVS ? caches.match(key(path), {cacheName: PRECACHE}) : null);
+  }).then(function (hit) {
+    if (!hit) return network;
+    e.waitUntil(network.catch(function () {}));
+    return hit;
+  });
+}
+
+function cacheFirst(e, name, max) {
+  var url = e.request.url;
+  return caches.open(name).then(function (cache) {
+    return cache.match(url).then(function (hit) {
+      if (hit) return hit;
+      return fetch(url, {mode: 'cors', credentials: 'omit'}).catch(function () {
+        return fetch(e.request);
+      }).then(function (r) {
+        if (r.ok) e.waitUntil(cache.put(url, r.clone()).then(function () { return trim(cache, max); }));
+        return r;
+      });
+    });
+  });
+}
+
+self.addEventListener('fetch', function (e) {
+  if (e.request.method !== 'GET') return;
+  var url = new URL(e.request.url);
+  if (url.origin === self.location.origin) {
+    var path = pathOf(url.href);
+    if (/^\/blog\/.*\.html$/.test(path)) e.respondWith(staleWhileRevalidate(e, path));
+    else if (path in REVS) e.respondWith(precached(e, path));
+    return;
+  }
+  C.runtime.forEach(function (r) {
+    if (url.hostname === r[1]) e.respondWith(cacheFirst(e, 'steadiday-' + r[0] + '-v' + C.version, r[2]));
+  });
+});
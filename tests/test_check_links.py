@@ -0,0 +1,119 @@
+"""check_links.py against a stub HTTP server on 127.0.0.1."""
+
+import json
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import check_links
+from site_tree import SiteTree
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # path -> (status, Location header or None, allow HEAD)
+    routes = {
+        "/ok": (200, None, True),
+        "/chain-1": (301, "/chain-2", True),
+        "/chain-2": (301, "/ok", True),
+        "/no-head": (200, None, False),
+        "/missing": (404, None, True),
+        "/down": (503, None, True),
+    }
+    hits = Counter()
+
+    def _respond(self, with_body):
+        self.hits[(self.command, self.path)] += 1
+        status, location, allow_head = self.routes.get(self.path, (404, None, True))
+        if self.command == "HEAD" and not allow_head:
+            status, location = 405, None
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        if with_body:
+            self.wfile.write(b"ok")
+
+    def do_HEAD(self):
+        self._respond(False)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    StubHandler.hits.clear()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_ok(server):
+    entry = check_links.fetch(f"{server}/ok")
+    assert entry == {"outcome": "ok", "status": 200, "final_url": f"{server}/ok"}
+    assert StubHandler.hits[("GET", "/ok")] == 0
+
+
+def test_redirect_chain(server):
+    entry = check_links.fetch(f"{server}/chain-1")
+    assert entry["outcome"] == "redirect"
+    assert entry["status"] == 200
+    assert entry["final_url"] == f"{server}/ok"
+
+
+def test_head_405_falls_back_to_get(server):
+    entry = check_links.fetch(f"{server}/no-head")
+    assert entry["outcome"] == "ok"
+    assert StubHandler.hits[("HEAD", "/no-head")] == 1
+    assert StubHandler.hits[("GET", "/no-head")] == 1
+
+
+def test_404_is_dead(server):
+    entry = check_links.fetch(f"{server}/missing")
+    assert entry["outcome"] == "dead"
+    assert entry["status"] == 404
+
+
+def test_5xx_is_transient(server):
+    entry = check_links.fetch(f"{server}/down")
+    assert entry["outcome"] == "error"
+    assert entry["status"] == 503
+
+
+def test_cache_freshness_and_expiry(server, tmp_path):
+    urls = [f"{server}/ok", f"{server}/missing", f"{server}/down"]
+    (tmp_path / "blog").mkdir()
+    (tmp_path / "blog" / "2026-01-01-post.html").write_text(
+        "<html><body>" + "".join(f'<a href="{url}">x</a>' for url in urls) + "</body></html>")
+
+    report = check_links.run_check(SiteTree(str(tmp_path)), host_delay=0)
+    assert [item["url"] for item in report["dead"]] == [f"{server}/missing"]
+    assert [item["url"] for item in report["error"]] == [f"{server}/down"]
+    assert sum(StubHandler.hits.values()) == 3
+
+    # Everything was just checked: nothing is requested again
+    check_links.run_check(SiteTree(str(tmp_path)), host_delay=0)
+    assert sum(StubHandler.hits.values()) == 3
+
+    # Two days on, the dead (1 day) and error (6 hours) entries have expired
+    # but the healthy one (7 days) has not
+    cache_path = tmp_path / check_links.CACHE_PATH
+    cache = json.loads(cache_path.read_text())
+    old = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat(timespec="seconds")
+    for entry in cache.values():
+        entry["checked"] = old
+    cache_path.write_text(json.dumps(cache))
+    check_links.run_check(SiteTree(str(tmp_path)), host_delay=0)
+    assert StubHandler.hits[("HEAD", "/ok")] == 1
+    assert StubHandler.hits[("HEAD", "/missing")] == 2
+    assert StubHandler.hits[("HEAD", "/down")] == 2
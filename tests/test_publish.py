@@ -0,0 +1,144 @@
+"""publish.py against a local bare repo, with a stub build in place of the pipeline."""
+
+import os
+import subprocess
+
+import pytest
+
+import publish
+import site_cli
+from site_tree import SiteTree
+
+IDENTITY = ["-c", "user.name=Editor", "-c", "user.email=editor@example.com"]
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", "-C", str(cwd), *args], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def repos(tmp_path, monkeypatch):
+    """(work clone, bare remote, second clone); no git identity configured."""
+    empty = tmp_path / "gitconfig"
+    empty.write_text("")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(empty))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+
+    bare, work, other = tmp_path / "site.git", tmp_path / "work", tmp_path / "other"
+    subprocess.run(["git", "init", "-q", "--bare", "-b", "main", str(bare)], check=True)
+    subprocess.run(["git", "init", "-q", "-b", "main", str(work)], check=True)
+    for rel, text in {"blog/a.html": "a\n", "blog/old.html": "old\n", "sitemap.xml": "<urlset/>\n",
+                      "scripts/tool.py": "x = 1\n", "README.md": "readme\n"}.items():
+        write(work / rel, text)
+    git(work, "add", "-A")
+    git(work, *IDENTITY, "commit", "-q", "-m", "seed")
+    git(work, "remote", "add", "origin", str(bare))
+    git(work, "push", "-q", "origin", "main")
+    subprocess.run(["git", "clone", "-q", "-b", "main", str(bare), str(other)], check=True)
+    return work, bare, other
+
+
+def push_from(other, rel, text):
+    """Commit a change from the second clone and push it. Returns its sha."""
+    git(other, "pull", "-q", "--ff-only", "origin", "main")
+    write(other / rel, text)
+    git(other, "add", rel)
+    git(other, *IDENTITY, "commit", "-q", "-m", f"edit {rel}")
+    git(other, "push", "-q", "origin", "HEAD:main")
+    return git(other, "rev-parse", "HEAD")
+
+
+def stub_build(work, during=None):
+    """A run_build stand-in: changes, adds and deletes published files, edits
+    a script (never published), then runs `during` (a concurrent push)."""
+    def run_build(tree, skip=(), only=(), force=False):
+        write(work / "blog/a.html", "a, rebuilt\n")
+        write(work / "blog/b.html", "b\n")
+        os.remove(work / "blog/old.html")
+        write(work / "sitemap.xml", "<urlset>b</urlset>\n")
+        write(work / "scripts/tool.py", "x = 2\n")
+        if during:
+            during()
+        return {}
+    return run_build
+
+
+PUBLISHED = {("M", "blog/a.html"), ("A", "blog/b.html"), ("D", "blog/old.html"), ("M", "sitemap.xml")}
+
+
+def committed_files(repo, sha):
+    lines = git(repo, "show", "--name-status", "--format=", sha).splitlines()
+    return {tuple(line.split("\t")) for line in lines}
+
+
+def test_publish_commits_the_planned_files_and_pushes(repos, monkeypatch):
+    work, bare, _ = repos
+    monkeypatch.setattr(site_cli, "run_build", stub_build(work))
+
+    sha = publish.run(SiteTree(str(work)))
+
+    assert git(bare, "rev-parse", "main") == sha
+    assert committed_files(bare, sha) == PUBLISHED
+    assert git(bare, "log", "-1", "--format=%an|%s", "main") == f"{publish.BOT_NAME}|{publish.BUILD_MESSAGE}"
+    # The script edit is left out, and nothing else was committed
+    assert git(work, "status", "--porcelain") == "M scripts/tool.py"
+    assert git(bare, "rev-list", "--count", "main") == "2"
+
+
+def test_dry_run_commits_nothing(repos, monkeypatch, capsys):
+    work, bare, _ = repos
+    before = git(bare, "rev-parse", "main")
+    monkeypatch.setattr(site_cli, "run_build", stub_build(work))
+
+    assert publish.run(SiteTree(str(work)), dry_run=True) is None
+
+    out = capsys.readouterr().out
+    assert "Publish plan: 4 files" in out and "blog/b.html" in out and "scripts/tool.py" in out
+    assert git(bare, "rev-parse", "main") == before
+    assert git(work, "rev-parse", "HEAD") == before
+
+
+def test_publish_starts_from_the_remote_branch(repos, monkeypatch):
+    work, bare, other = repos
+    theirs = push_from(other, "README.md", "edited elsewhere\n")
+    monkeypatch.setattr(site_cli, "run_build", stub_build(work))
+
+    sha = publish.run(SiteTree(str(work)))
+
+    assert git(bare, "rev-parse", "main") == sha
+    assert git(bare, "rev-parse", f"{sha}^") == theirs
+
+
+def test_concurrent_push_is_rebased_once(repos, monkeypatch, capsys):
+    work, bare, other = repos
+    pushed = []
+    monkeypatch.setattr(site_cli, "run_build",
+                        stub_build(work, during=lambda: pushed.append(push_from(other, "README.md", "race\n"))))
+
+    sha = publish.run(SiteTree(str(work)))
+
+    assert "rebasing the publish commit" in capsys.readouterr().out
+    assert git(bare, "rev-parse", "main") == sha
+    assert git(bare, "rev-parse", f"{sha}^") == pushed[0]
+    assert committed_files(bare, sha) == PUBLISHED
+    assert git(work, "status", "--porcelain") == "M scripts/tool.py"
+
+
+def test_conflicting_push_fails_cleanly(repos, monkeypatch):
+    work, bare, other = repos
+    pushed = []
+    monkeypatch.setattr(site_cli, "run_build",
+                        stub_build(work, during=lambda: pushed.append(push_from(other, "blog/a.html", "theirs\n"))))
+
+    with pytest.raises(publish.PublishError):
+        publish.run(SiteTree(str(work)))
+
+    assert git(bare, "rev-parse", "main") == pushed[0]
+    assert not os.path.exists(work / ".git" / "rebase-merge")
+    assert git(work, "status", "--porcelain") == "M scripts/tool.py"